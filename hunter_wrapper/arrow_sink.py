@@ -0,0 +1,228 @@
+"""Streaming Arrow and Parquet writers for bulk results.
+
+Rows are buffered up to a fixed batch size, converted into Arrow record
+batches with a fixed schema and flushed to disk, so large jobs never hold
+more than one batch in memory.
+"""
+
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+try:
+    import pyarrow as pa  # noqa: WPS433
+except ImportError as error:
+    raise ImportError('hunter_wrapper.arrow_sink needs PyArrow: pip install -r requirements-analytics.txt') from error
+from pyarrow import parquet as pq
+
+from hunter_wrapper.concurrency import BulkResult
+from hunter_wrapper.rows import verification_row
+
+DEFAULT_BATCH_SIZE = 10000
+FILE_FORMATS = ('parquet', 'arrow')
+
+VERIFICATION_SCHEMA = pa.schema([
+    ('index', pa.int64()),
+    ('email', pa.string()),
+    ('domain', pa.string()),
+    ('status', pa.string()),
+    ('result', pa.string()),
+    ('score', pa.int32()),
+    ('error', pa.string()),
+])
+
+EMAIL_RECORD_SCHEMA = pa.schema([
+    ('domain', pa.string()),
+    ('email', pa.string()),
+    ('type', pa.string()),
+    ('confidence', pa.int32()),
+    ('first_name', pa.string()),
+    ('last_name', pa.string()),
+    ('position', pa.string()),
+    ('seniority', pa.string()),
+    ('department', pa.string()),
+    ('verification_status', pa.string()),
+])
+
+
+def email_record_row(domain: str | None, record: dict) -> dict:
+    """Flatten one domain search email record into a row.
+
+    Args:
+        domain: The searched domain.
+        record: One entry of the domain search 'emails' list.
+
+    Returns:
+        A dict keyed by the EMAIL_RECORD_SCHEMA fields.
+
+    """
+    verification = record.get('verification') or {}
+    return {
+        'domain': domain,
+        'email': record.get('value'),
+        'type': record.get('type'),
+        'confidence': record.get('confidence'),
+        'first_name': record.get('first_name'),
+        'last_name': record.get('last_name'),
+        'position': record.get('position'),
+        'seniority': record.get('seniority'),
+        'department': record.get('department'),
+        'verification_status': verification.get('status'),
+    }
+
+
+def _open_writer(path: str | Path, schema: pa.Schema, file_format: str) -> Any:
+    """Open a record batch writer for a file.
+
+    Args:
+        path: Destination file.
+        schema: The schema of the file.
+        file_format: 'parquet' or 'arrow' (Arrow IPC file).
+
+    Returns:
+        A writer with write_batch() and close().
+
+    Raises:
+        ValueError: If file_format is not supported.
+
+    """
+    if file_format == 'parquet':
+        return pq.ParquetWriter(str(path), schema)
+    if file_format == 'arrow':
+        return pa.ipc.new_file(str(path), schema)
+    raise ValueError('file_format must be one of {0}'.format(FILE_FORMATS))
+
+
+class RecordBatchSink:
+    """Write rows to an Arrow or Parquet file one record batch at a time."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        schema: pa.Schema,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        file_format: str = 'parquet',
+    ) -> None:
+        """Open the file and start with an empty buffer.
+
+        Args:
+            path: Destination file.
+            schema: The fixed schema of the file.
+            batch_size: Number of rows per record batch (and Parquet row group).
+            file_format: 'parquet' or 'arrow' (Arrow IPC file).
+
+        """
+        self.schema = schema
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._pending: list[dict] = []
+        self._writer = _open_writer(path, schema, file_format)
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context.
+
+        Returns:
+            The sink itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush and close the file when leaving the runtime context.
+
+        Args:
+            exc_type: Exception type, if an exception was raised.
+            exc_value: Exception instance, if an exception was raised.
+            traceback: Traceback, if an exception was raised.
+
+        """
+        self.close()
+
+    def write_row(self, row: dict) -> None:
+        """Buffer one row, flushing a record batch once the buffer is full.
+
+        Args:
+            row: Values by field name; keys outside the schema are ignored.
+
+        """
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as one record batch."""
+        if not self._pending:
+            return
+        self._writer.write_batch(pa.RecordBatch.from_pylist(self._pending, schema=self.schema))
+        self.rows_written += len(self._pending)
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush the remaining rows and finish the file."""
+        self.flush()
+        self._writer.close()
+
+
+class VerificationSink(RecordBatchSink):
+    """Write verify_many results to an Arrow or Parquet file as they arrive."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        file_format: str = 'parquet',
+    ) -> None:
+        """Open the file with VERIFICATION_SCHEMA.
+
+        Args:
+            path: Destination file.
+            batch_size: Number of rows per record batch (and Parquet row group).
+            file_format: 'parquet' or 'arrow' (Arrow IPC file).
+
+        """
+        super().__init__(path, VERIFICATION_SCHEMA, batch_size, file_format)
+
+    def write(self, bulk_result: BulkResult) -> None:
+        """Write one result.
+
+        Args:
+            bulk_result: The outcome of one verification.
+
+        """
+        self.write_row(verification_row(bulk_result))
+
+
+class EmailRecordSink(RecordBatchSink):
+    """Write domain search email records to an Arrow or Parquet file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        file_format: str = 'parquet',
+    ) -> None:
+        """Open the file with EMAIL_RECORD_SCHEMA.
+
+        Args:
+            path: Destination file.
+            batch_size: Number of rows per record batch (and Parquet row group).
+            file_format: 'parquet' or 'arrow' (Arrow IPC file).
+
+        """
+        super().__init__(path, EMAIL_RECORD_SCHEMA, batch_size, file_format)
+
+    def write_search(self, response_data: dict) -> None:
+        """Write every email record of a domain search.
+
+        Args:
+            response_data: The dict returned by domain_search.
+
+        """
+        domain = response_data.get('domain')
+        for record in response_data.get('emails') or ():
+            self.write_row(email_record_row(domain, record))
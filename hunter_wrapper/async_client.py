@@ -0,0 +1,230 @@
+"""Asyncio Hunter.io API client implementation.
+
+This module mirrors HunterClient with awaitable methods backed by a
+non-blocking pooled HTTP transport.
+"""
+
+import contextlib
+import functools
+
+import httpx
+
+from hunter_wrapper.base import BaseHunterClient, endpoint_name
+from hunter_wrapper.cache import canonical_key
+from hunter_wrapper.coalescing import AsyncSingleFlight
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.deadline import Deadline
+from hunter_wrapper.exceptions import HunterAPIError
+from hunter_wrapper.keys import KeyPool
+from hunter_wrapper.sender import AsyncRequestSender
+from hunter_wrapper.transport import AsyncSessionLifecycleMixin, create_async_session
+
+
+class AsyncHunterClient(AsyncSessionLifecycleMixin, BaseHunterClient):
+    """Asyncio client for interacting with the Hunter.io API.
+
+    All calls share one pooled keep-alive httpx.AsyncClient; use the client
+    as an async context manager or await aclose() to release its connections.
+
+    For documentation, visit: https://hunter.io/api-documentation/v2
+    """
+
+    def __init__(self, api_key: str | KeyPool, config: ClientConfig | None = None) -> None:
+        """Initialize the AsyncHunterClient.
+
+        Args:
+            api_key: The API key for Hunter.io authentication, or a pool of keys.
+            config: Optional client settings, defaults are used if omitted.
+
+        """
+        super().__init__(api_key, config)
+        self.session = create_async_session(self.config.pool)
+        self.sender = AsyncRequestSender(self.session, self.config, self.key_pool)
+        self._inflight = AsyncSingleFlight()
+
+    async def email_verifier(self, email: str, raw: bool = False) -> dict | httpx.Response:
+        """Verify the deliverability of a given email address.
+
+        Args:
+            email: The email address to check.
+            raw: If True, returns the entire response instead of just the 'data'.
+
+        Returns:
+            If raw is True: httpx.Response object.
+            If raw is False: Email verification data as dict; addresses failing
+            the local checks get a synthetic 'invalid' or 'disposable' result without a request.
+
+        """
+        check = self._domain_index.screen(self.config.email_validator.precheck(email))
+        if not (raw or check.valid):
+            return check.local_result()
+        query_params = {'email': check.email, 'api_key': self.api_key}
+        endpoint = self.base_endpoint.format(endpoint='email-verifier')
+        return await self._query_hunter(endpoint, query_params, raw=raw)
+
+    async def domain_search(
+        self,
+        domain: str | None = None,
+        company: str | None = None,
+        raw: bool = False,
+        **kwargs,
+    ) -> dict | httpx.Response:
+        """Return all the email addresses found for a given domain.
+
+        Args:
+            domain: The domain on which to search for emails. Must be defined if company is not.
+            company: The name of the company on which to search for emails. Must be defined if domain is not.
+            raw: If True, returns the entire response instead of just the 'data'.
+            kwargs: Optional parameters (limit, offset, seniority, department, emails_type).
+
+        Returns:
+            If raw is True: httpx.Response object.
+            If raw is False: Domain search data as dict with email addresses found.
+
+        Raises:
+            MissingCompanyError: If neither domain nor company is provided.  # noqa: DAR402
+
+        """
+        query_parameters = self._domain_search_params(domain, company, kwargs)
+        endpoint = self.base_endpoint.format(endpoint='domain-search')
+
+        response = await self._query_hunter(endpoint, query_parameters, raw=raw)
+        if isinstance(response, dict):
+            self._domain_index.observe(response)
+            self._patterns.observe(response)
+        return response
+
+    async def email_finder(
+        self,
+        domain: str | None = None,
+        company: str | None = None,
+        raw: bool = False,
+        **name_params,
+    ) -> httpx.Response | tuple[str, int]:
+        """Find the email address of a person given its name and company's domain.
+
+        Args:
+            domain: The domain of the company where the person works. Must be defined if company is not.
+            company: The name of the company where the person works. Must be defined if domain is not.
+            raw: If True, returns the entire response instead of just email and score.
+            name_params: Name parameters (first_name, last_name, or full_name).
+
+        Returns:
+            If raw is True: httpx.Response object.
+            If raw is False: Tuple of (email, score).
+
+        Raises:
+            MissingCompanyError: If neither domain nor company is provided.  # noqa: DAR402
+            MissingNameError: If name information is insufficient.  # noqa: DAR402
+            HunterSkippedDomainError: If the domain is a known webmail or disposable domain.  # noqa: DAR402
+
+        """
+        query_parameters = self._email_finder_params(domain, company, name_params)
+        # Render the address from a cached domain pattern when one is known
+        candidate = None if raw else self._patterns.candidate(query_parameters)
+        if candidate is not None:
+            verification = None if candidate.trusted else await self.email_verifier(candidate.email)
+            if candidate.accepts(verification):
+                return candidate.email, candidate.score
+
+        endpoint = self.base_endpoint.format(endpoint='email-finder')
+
+        response = await self._query_hunter(endpoint, query_parameters, raw=raw)
+        if raw:
+            # Type narrowing: when raw=True, response is httpx.Response
+            assert isinstance(response, httpx.Response)
+            return response
+
+        # Type narrowing: when raw=False, response is dict
+        assert isinstance(response, dict)
+        return response['email'], response['score']
+
+    async def account_information(self, raw: bool = False) -> dict | httpx.Response:
+        """Return the account's plan and its used and available searches and verifications.
+
+        Fetching the account is free and reconciles the credit scheduler, if one is configured.
+        With a key pool, the account of one of the keys is returned and nothing is reconciled.
+
+        Args:
+            raw: If True, returns the entire response instead of just the 'data'.
+
+        Returns:
+            If raw is True: httpx.Response object.
+            If raw is False: Account data as dict, with usage under 'requests'.
+
+        """
+        endpoint = self.base_endpoint.format(endpoint='account')
+        response = await self._query_hunter(endpoint, {'api_key': self.api_key}, raw=raw)
+        # With a key pool each key reconciles its own credits from its own account
+        if isinstance(response, dict) and self.key_pool is None:
+            self.sender.credits.reconcile(response)
+        return response
+
+    async def _query_hunter(
+        self,
+        endpoint: str,
+        query_params: dict,
+        request_type: str = 'get',
+        raw: bool = False,
+    ) -> dict | httpx.Response:
+        """Make a non-blocking request to the Hunter.io API.
+
+        Args:
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+            request_type: HTTP method to use.
+            raw: If True, return the raw response; raw responses bypass caching and coalescing.
+
+        Returns:
+            If raw is True: httpx.Response object.
+            If raw is False: API response data as dict.
+
+        Raises:
+            HunterAPIError: If the API returns an error.  # noqa: DAR402
+            HunterDeadlineExceededError: If the call used up its time budget.  # noqa: DAR402
+
+        """
+        # Rate-limit waits, coalescing waits and retries share one time budget
+        with Deadline(self.config.timeout.total):
+            name = endpoint_name(endpoint)
+            # A failed reconciliation keeps the local count until the next one
+            if self.key_pool is None and self.sender.credits.start_reconcile(name):
+                with contextlib.suppress(HunterAPIError, httpx.HTTPStatusError):
+                    await self.account_information()
+            if raw:
+                return await self.sender.send(request_type, endpoint, query_params)
+
+            key_params = self._key_params(query_params)
+            cached = self._cache.get(name, key_params)
+            if cached is not None:
+                return cached
+
+            # Concurrent identical lookups share one in-flight request
+            return await self._inflight.run(
+                canonical_key(name, key_params),
+                functools.partial(self._fetch, endpoint, query_params, key_params, request_type),
+            )
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        query_params: dict,
+        key_params: dict,
+        request_type: str,
+    ) -> dict:
+        """Send one request, decode its data and store it in the cache.
+
+        Args:
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+            key_params: Query parameters the response is cached under.
+            request_type: HTTP method to use.
+
+        Returns:
+            API response data as dict.
+
+        """
+        res = await self.sender.send(request_type, endpoint, query_params)
+        response_data = self.config.decoder.decode_data(res.content)
+        self._cache.set(endpoint_name(endpoint), key_params, response_data)
+        return response_data
@@ -0,0 +1,207 @@
+"""Shared request building for the Hunter.io API clients.
+
+This module holds the validation and error mapping used by both the
+blocking and the asyncio clients.
+"""
+
+from hunter_wrapper.cache import NullCache
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.domain_index import DomainIndex
+from hunter_wrapper.exceptions import MissingCompanyError, MissingNameError
+from hunter_wrapper.keys import KeyPool
+from hunter_wrapper.names import normalize_name_params
+from hunter_wrapper.patterns import PatternCache
+
+NAME_FIELDS = ('first_name', 'last_name', 'full_name')
+
+
+def endpoint_name(endpoint: str) -> str:
+    """Return the endpoint name of an API endpoint URL.
+
+    Args:
+        endpoint: The API endpoint URL.
+
+    Returns:
+        The last path segment, e.g. 'domain-search'.
+
+    """
+    return endpoint.rsplit('/', 1)[-1]
+
+
+class BaseHunterClient:
+    """Transport-agnostic part of the Hunter.io API clients."""
+
+    def __init__(self, api_key: str | KeyPool, config: ClientConfig | None = None) -> None:
+        """Initialize the client settings.
+
+        Args:
+            api_key: The API key for Hunter.io authentication, or a pool of keys.
+            config: Optional client settings, defaults are used if omitted.
+
+        """
+        # With a key pool, each request is sent with a key picked from the pool
+        self.key_pool = api_key if isinstance(api_key, KeyPool) else None
+        self.api_key = api_key.primary_key if isinstance(api_key, KeyPool) else api_key
+        self.base_params = {'api_key': self.api_key}
+        self.base_endpoint = 'https://api.hunter.io/v2/{endpoint}'
+        self.config = config or ClientConfig()
+        cache = self.config.cache
+        self._cache = NullCache() if cache is None else cache
+        domain_index = self.config.domain_index
+        # An empty index that does not learn never skips a lookup
+        self._domain_index = DomainIndex(learn=False) if domain_index is None else domain_index
+        pattern_cache = self.config.pattern_cache
+        # A cache that keeps no domains never renders an address
+        self._patterns = PatternCache(maxsize=0) if pattern_cache is None else pattern_cache
+
+    def _domain_search_params(
+        self,
+        domain: str | None,
+        company: str | None,
+        kwargs: dict,
+    ) -> dict:
+        """Build the query parameters for a domain search.
+
+        Args:
+            domain: The domain on which to search for emails.
+            company: The name of the company on which to search for emails.
+            kwargs: Optional parameters (limit, offset, seniority, department, emails_type).
+
+        Returns:
+            The query parameters dict.
+
+        Raises:
+            MissingCompanyError: If neither domain nor company is provided.
+
+        """
+        if domain:
+            query_parameters = {'domain': domain, 'api_key': self.api_key}
+        elif company:
+            query_parameters = {'company': company, 'api_key': self.api_key}
+        else:
+            raise MissingCompanyError(
+                'You must supply at least a domain name or a company name',
+            )
+
+        # Add optional parameters from kwargs
+        self._add_optional_search_params(query_parameters, kwargs)
+        return query_parameters
+
+    def _email_finder_params(
+        self,
+        domain: str | None,
+        company: str | None,
+        name_params: dict,
+    ) -> dict:
+        """Build the query parameters for an email finder lookup.
+
+        Args:
+            domain: The domain of the company where the person works.
+            company: The name of the company where the person works.
+            name_params: Name parameters (first_name, last_name, or full_name).
+
+        Returns:
+            The query parameters dict.
+
+        Raises:
+            MissingCompanyError: If neither domain nor company is provided.
+            MissingNameError: If name information is insufficient.  # noqa: DAR402
+            HunterSkippedDomainError: If the domain is a known webmail or disposable domain.  # noqa: DAR402
+
+        """
+        query_parameters = self.base_params.copy()
+
+        # Validate and add company/domain parameters
+        if not domain and not company:
+            raise MissingCompanyError(
+                'You must supply at least a domain name or a company name',
+            )
+        if domain:
+            query_parameters['domain'] = domain
+        elif company:
+            query_parameters['company'] = company
+
+        # Validate and add name parameters
+        self._validate_and_add_name_params(query_parameters, name_params)
+        self._domain_index.screen_domain(domain)
+        return query_parameters
+
+    def _validate_and_add_name_params(
+        self,
+        query_parameters: dict,
+        name_params: dict,
+    ) -> None:
+        """Validate and add name parameters to the query.
+
+        Args:
+            query_parameters: The query parameters dict to update.
+            name_params: Dictionary containing name-related parameters.
+
+        Raises:
+            MissingNameError: If name information is insufficient.
+
+        """
+        first_name = name_params.get('first_name')
+        last_name = name_params.get('last_name')
+        full_name = name_params.get('full_name')
+
+        has_both_names = bool(first_name and last_name)
+
+        if not full_name and not has_both_names:
+            raise MissingNameError(
+                'You must supply a first name AND a last name OR a full name',
+            )
+
+        if has_both_names:
+            names = {'first_name': first_name, 'last_name': last_name}
+        else:
+            names = {'full_name': full_name}
+        # Names are sent as given; normalization only applies to the lookup key
+        query_parameters.update(names)
+
+    def _key_params(self, query_params: dict) -> dict:
+        """Return the parameters that identify a lookup in the cache and in flight.
+
+        With normalize_names, equivalent spellings of a name share one cache
+        entry and one in-flight request.
+
+        Args:
+            query_params: Query parameters of the request.
+
+        Returns:
+            The query parameters with their names normalized, or unchanged.
+
+        """
+        names = {name: query_params[name] for name in NAME_FIELDS if name in query_params}
+        if not (names and self.config.normalize_names):
+            return query_params
+        key_params = dict(query_params)
+        for name in names:
+            key_params.pop(name)
+        key_params.update(normalize_name_params(names))
+        return key_params
+
+    def _add_optional_search_params(
+        self,
+        query_parameters: dict,
+        kwargs: dict,
+    ) -> None:
+        """Add optional search parameters to the query.
+
+        Args:
+            query_parameters: The query parameters dict to update.
+            kwargs: Dictionary containing optional parameters.
+
+        """
+        optional_params = {
+            'limit': 'limit',
+            'offset': 'offset',
+            'seniority': 'seniority',
+            'department': 'department',
+            'emails_type': 'type',
+        }
+
+        for key, api_key in optional_params.items():
+            param_value = kwargs.get(key, None)
+            if param_value is not None:
+                query_parameters[api_key] = param_value
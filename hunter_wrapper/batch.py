@@ -0,0 +1,355 @@
+"""Columnar containers for analysing bulk results with NumPy.
+
+Scores are stored in float arrays and categorical fields such as status
+as integer codes into a small label table, so aggregates over millions of
+results run as vectorized operations on compact arrays.
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Self
+
+try:
+    import numpy as np  # noqa: WPS433
+except ImportError as error:
+    raise ImportError('hunter_wrapper.batch needs NumPy: pip install -r requirements-analytics.txt') from error
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.bulk import DEFAULT_CONCURRENCY, averify_many, verify_many
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.rows import verification_row
+
+VERIFICATION_NUMERIC = ('index', 'score', 'deliverable')
+VERIFICATION_CATEGORICAL = ('domain', 'status', 'result')
+VERIFICATION_TEXT = ('email',)
+
+
+class Categorical:
+    """A column of strings stored as integer codes into a table of labels."""
+
+    __slots__ = ('codes', 'labels')
+
+    def __init__(self, codes: np.ndarray, labels: Sequence[str]) -> None:
+        """Initialize the column.
+
+        Args:
+            codes: Position of each row's label in labels.
+            labels: The distinct labels of the column.
+
+        """
+        self.codes = codes
+        self.labels = tuple(labels)
+
+    def code_of(self, label: str) -> int:
+        """Return the code of a label.
+
+        Args:
+            label: The label to look up.
+
+        Returns:
+            The code, or -1 if no row has the label.
+
+        """
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            return -1
+
+    def decode(self) -> np.ndarray:
+        """Return the labels of all rows.
+
+        Returns:
+            An object array with one label per row.
+
+        """
+        return np.asarray(self.labels, dtype=object)[self.codes]
+
+    def take(self, selector: np.ndarray) -> 'Categorical':
+        """Return the rows picked by a boolean mask or an array of positions.
+
+        Args:
+            selector: A boolean mask or integer positions.
+
+        Returns:
+            A new column sharing the label table.
+
+        """
+        return Categorical(self.codes[selector], self.labels)
+
+    def totals(self, weights: np.ndarray | None = None) -> dict[str, float]:
+        """Count the rows per label, or sum weights per label.
+
+        Args:
+            weights: Optional numbers to sum, one per row.
+
+        Returns:
+            The count or sum by label, for labels present in the column.
+
+        """
+        sizes = np.bincount(self.codes, minlength=len(self.labels))
+        sums = sizes
+        if weights is not None:
+            sums = np.bincount(self.codes, weights, len(self.labels))
+        present = sizes.nonzero()[0]
+        labels = np.asarray(self.labels, dtype=object)[present]
+        return dict(zip(labels.tolist(), sums[present].tolist()))
+
+
+class _BatchBuilder:
+    """Accumulate rows into compact column buffers."""
+
+    def __init__(self, numeric: Sequence[str], categorical: Sequence[str], text: Sequence[str]) -> None:
+        """Initialize empty columns.
+
+        Args:
+            numeric: Names of float columns; missing values become NaN.
+            categorical: Names of columns stored as codes; missing values become ''.
+            text: Names of columns kept as strings.
+
+        """
+        self._numeric = {name: array('d') for name in numeric}
+        self._codes = {name: array('i') for name in categorical}
+        self._labels: dict[str, dict[str, int]] = {name: {} for name in categorical}
+        self._text: dict[str, list[str]] = {name: [] for name in text}
+
+    def append(self, row: dict) -> None:
+        """Add one row.
+
+        Args:
+            row: Column values by name; other keys are ignored.
+
+        """
+        self._append_numbers(row)
+        self._append_codes(row)
+        for name, texts in self._text.items():
+            texts.append(row.get(name) or '')
+
+    def build(self) -> 'ResultBatch':
+        """Convert the buffers into a batch.
+
+        Returns:
+            A ResultBatch holding the appended rows.
+
+        """
+        return ResultBatch(
+            numeric={name: np.frombuffer(numbers) for name, numbers in self._numeric.items()},
+            categorical=self._categorical(),
+            text=self._texts(),
+        )
+
+    def _append_numbers(self, row: dict) -> None:
+        """Add the numeric fields of a row.
+
+        Args:
+            row: Column values by name.
+
+        """
+        for name, numbers in self._numeric.items():
+            number = row.get(name)
+            numbers.append(math.nan if number is None else number)
+
+    def _append_codes(self, row: dict) -> None:
+        """Add the categorical fields of a row, growing the label tables.
+
+        Args:
+            row: Column values by name.
+
+        """
+        for name, codes in self._codes.items():
+            labels = self._labels[name]
+            label = row.get(name) or ''
+            codes.append(labels.setdefault(label, len(labels)))
+
+    def _categorical(self) -> dict[str, Categorical]:
+        """Convert the code buffers into categorical columns.
+
+        Returns:
+            Categorical columns by name.
+
+        """
+        categorical = {}
+        for name, codes in self._codes.items():
+            labels = list(self._labels[name])
+            categorical[name] = Categorical(np.frombuffer(codes, dtype=np.int32), labels)
+        return categorical
+
+    def _texts(self) -> dict[str, np.ndarray]:
+        """Convert the text buffers into object arrays.
+
+        Returns:
+            Text columns by name.
+
+        """
+        texts = {}
+        for name, strings in self._text.items():
+            texts[name] = np.asarray(strings, dtype=object)
+        return texts
+
+
+class ResultBatch:
+    """Column-oriented collection of bulk results."""
+
+    def __init__(
+        self,
+        numeric: dict[str, np.ndarray],
+        categorical: dict[str, Categorical],
+        text: dict[str, np.ndarray],
+    ) -> None:
+        """Initialize the batch from its columns.
+
+        Args:
+            numeric: Float columns by name, NaN marking missing values.
+            categorical: Coded string columns by name.
+            text: Object columns of strings by name.
+
+        """
+        self.numeric = numeric
+        self.categorical = categorical
+        self.text = text
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            The number of rows in the batch.
+
+        """
+        columns = [
+            *self.numeric.values(),
+            *(column.codes for column in self.categorical.values()),
+            *self.text.values(),
+        ]
+        return len(columns[0]) if columns else 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[dict],
+        numeric: Sequence[str] = (),
+        categorical: Sequence[str] = (),
+        text: Sequence[str] = (),
+    ) -> Self:
+        """Build a batch from row dicts, consumed lazily.
+
+        Args:
+            rows: Row dicts.
+            numeric: Names of float columns; missing values become NaN.
+            categorical: Names of columns stored as codes; missing values become ''.
+            text: Names of columns kept as strings.
+
+        Returns:
+            The batch.
+
+        """
+        builder = _BatchBuilder(numeric, categorical, text)
+        for row in rows:
+            builder.append(row)
+        batch = builder.build()
+        return cls(batch.numeric, batch.categorical, batch.text)
+
+    def equals(self, column: str, label: str) -> np.ndarray:
+        """Return a mask of the rows whose categorical column equals a label.
+
+        Args:
+            column: Name of a categorical column.
+            label: The label to match.
+
+        Returns:
+            A boolean array with one entry per row.
+
+        """
+        categorical = self.categorical[column]
+        return categorical.codes == categorical.code_of(label)
+
+    def select(self, selector: np.ndarray) -> 'ResultBatch':
+        """Return the rows picked by a boolean mask or an array of positions.
+
+        Args:
+            selector: A boolean mask or integer positions, e.g. from equals().
+
+        Returns:
+            A new batch with the selected rows.
+
+        """
+        return ResultBatch(
+            numeric={name: numbers[selector] for name, numbers in self.numeric.items()},
+            categorical={name: column.take(selector) for name, column in self.categorical.items()},
+            text={name: texts[selector] for name, texts in self.text.items()},
+        )
+
+    def counts(self, column: str) -> dict[str, int]:
+        """Count the rows per label of a categorical column.
+
+        Args:
+            column: Name of a categorical column.
+
+        Returns:
+            Number of rows by label, for labels present in the batch.
+
+        """
+        totals = self.categorical[column].totals()
+        return {label: int(total) for label, total in totals.items()}
+
+    def group_mean(self, by: str, column: str) -> dict[str, float]:
+        """Average a numeric column per label of a categorical column.
+
+        Missing (NaN) values are left out of the averages.
+
+        Args:
+            by: Name of the categorical column to group by.
+            column: Name of the numeric column to average.
+
+        Returns:
+            The mean by label, for labels with at least one value.
+
+        """
+        present_rows = self.select(~np.isnan(self.numeric[column]))
+        sizes = present_rows.categorical[by].totals()
+        sums = present_rows.categorical[by].totals(present_rows.numeric[column])
+        return {label: total / sizes[label] for label, total in sums.items()}
+
+
+def verify_batch(
+    client: HunterClient,
+    emails: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> ResultBatch:
+    """Verify many email addresses and collect the results into columns.
+
+    Args:
+        client: The client used for the lookups.
+        emails: Email addresses to verify, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+
+    Returns:
+        A ResultBatch in input order with the columns of verification_row.
+
+    """
+    bulk_results = verify_many(client, emails, concurrency)
+    rows = (verification_row(bulk_result) for bulk_result in bulk_results)
+    batch = ResultBatch.from_rows(rows, VERIFICATION_NUMERIC, VERIFICATION_CATEGORICAL, VERIFICATION_TEXT)
+    return batch.select(np.argsort(batch.numeric['index'], kind='stable'))
+
+
+async def averify_batch(
+    client: AsyncHunterClient,
+    emails: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> ResultBatch:
+    """Verify many email addresses on the event loop and collect them into columns.
+
+    Args:
+        client: The async client used for the lookups.
+        emails: Email addresses to verify, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+
+    Returns:
+        A ResultBatch in input order with the columns of verification_row.
+
+    """
+    builder = _BatchBuilder(VERIFICATION_NUMERIC, VERIFICATION_CATEGORICAL, VERIFICATION_TEXT)
+    async for bulk_result in averify_many(client, emails, concurrency):
+        builder.append(verification_row(bulk_result))
+    batch = builder.build()
+    return batch.select(np.argsort(batch.numeric['index'], kind='stable'))
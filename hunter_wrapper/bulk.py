@@ -0,0 +1,185 @@
+"""Bulk lookups built on top of the Hunter.io API clients."""
+
+import functools
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Protocol
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.concurrency import BulkResult
+from hunter_wrapper.dedup import Deduplication, arun_deduplicated, email_key, finder_key, run_deduplicated
+from hunter_wrapper.dispatch import BATCH, acall_in_class, call_in_class
+from hunter_wrapper.rows import FINDER_FIELDS
+
+DEFAULT_CONCURRENCY = 8
+
+
+class ResultSink(Protocol):
+    """Destination for bulk results, written one at a time."""
+
+    def write(self, bulk_result: BulkResult) -> None:
+        """Write one result.
+
+        Args:
+            bulk_result: The outcome of one lookup.
+
+        """
+
+
+def verify_many(
+    client: HunterClient,
+    emails: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deduplication: Deduplication | None = None,
+) -> Iterator[BulkResult]:
+    """Verify many email addresses with a bounded number of requests in flight.
+
+    Results stream back in completion order; use BulkResult.index to map
+    them to the input. A failed lookup is reported on its own result
+    instead of aborting the job. Addresses that differ only in case or
+    surrounding spaces are verified once and share the result.
+
+    Args:
+        client: The client used for the lookups.
+        emails: Email addresses to verify, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+        deduplication: Settings and duplicate counters; duplicates are looked up once if omitted.
+
+    Returns:
+        An iterator of BulkResult with verification data as response.
+
+    """
+    return run_deduplicated(
+        functools.partial(call_in_class, BATCH, client.email_verifier),
+        emails,
+        concurrency,
+        email_key,
+        deduplication,
+    )
+
+
+def averify_many(
+    client: AsyncHunterClient,
+    emails: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deduplication: Deduplication | None = None,
+) -> AsyncIterator[BulkResult]:
+    """Verify many email addresses concurrently on the event loop.
+
+    Args:
+        client: The async client used for the lookups.
+        emails: Email addresses to verify, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+        deduplication: Settings and duplicate counters; duplicates are looked up once if omitted.
+
+    Returns:
+        An async iterator of BulkResult with verification data as response.
+
+    """
+    return arun_deduplicated(
+        functools.partial(acall_in_class, BATCH, client.email_verifier),
+        emails,
+        concurrency,
+        email_key,
+        deduplication,
+    )
+
+
+def find_many(
+    client: HunterClient,
+    rows: Iterable[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deduplication: Deduplication | None = None,
+) -> Iterator[BulkResult]:
+    """Find email addresses for many people with bounded concurrency.
+
+    Each row holds domain or company plus first_name/last_name or
+    full_name; other keys are ignored. Rows with missing names or company
+    fail validation with MissingNameError or MissingCompanyError before any
+    request is sent, and are reported on their own result. Rows for the
+    same person at the same company are looked up once and share the result.
+
+    Args:
+        client: The client used for the lookups.
+        rows: Row dicts, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+        deduplication: Settings and duplicate counters; duplicates are looked up once if omitted.
+
+    Returns:
+        An iterator of BulkResult with (email, score) as response.
+
+    """
+    return run_deduplicated(
+        functools.partial(call_in_class, BATCH, lambda row: client.email_finder(**_finder_kwargs(row))),
+        rows,
+        concurrency,
+        functools.partial(finder_key, normalize=client.config.normalize_names),
+        deduplication,
+    )
+
+
+def afind_many(
+    client: AsyncHunterClient,
+    rows: Iterable[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deduplication: Deduplication | None = None,
+) -> AsyncIterator[BulkResult]:
+    """Find email addresses for many people concurrently on the event loop.
+
+    Args:
+        client: The async client used for the lookups.
+        rows: Row dicts, consumed lazily.
+        concurrency: Maximum number of requests in flight.
+        deduplication: Settings and duplicate counters; duplicates are looked up once if omitted.
+
+    Returns:
+        An async iterator of BulkResult with (email, score) as response.
+
+    """
+    return arun_deduplicated(
+        functools.partial(acall_in_class, BATCH, lambda row: client.email_finder(**_finder_kwargs(row))),
+        rows,
+        concurrency,
+        functools.partial(finder_key, normalize=client.config.normalize_names),
+        deduplication,
+    )
+
+
+def find_many_to_sink(
+    client: HunterClient,
+    rows: Iterable[dict],
+    sink: ResultSink,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    deduplication: Deduplication | None = None,
+) -> int:
+    """Run find_many and write every result to a sink as it completes.
+
+    Args:
+        client: The client used for the lookups.
+        rows: Row dicts, consumed lazily.
+        sink: Destination for the results, e.g. CsvResultSink.
+        concurrency: Maximum number of requests in flight.
+        deduplication: Settings and duplicate counters; duplicates are looked up once if omitted.
+
+    Returns:
+        The number of rows processed.
+
+    """
+    processed = 0
+    for bulk_result in find_many(client, rows, concurrency, deduplication):
+        sink.write(bulk_result)
+        processed += 1
+    return processed
+
+
+def _finder_kwargs(row: dict) -> dict:
+    """Keep the email finder arguments of a row, dropping empty values.
+
+    Args:
+        row: Input row, e.g. from a CSV file.
+
+    Returns:
+        Keyword arguments for email_finder.
+
+    """
+    return {field: row[field] for field in FINDER_FIELDS if row.get(field)}
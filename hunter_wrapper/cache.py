@@ -0,0 +1,233 @@
+"""Response caching for the Hunter.io API clients.
+
+Responses are keyed on the endpoint and the canonicalized query
+parameters, with the API key left out so rotated keys share entries.
+"""
+
+import abc
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+
+DEFAULT_TTLS = MappingProxyType({
+    'domain-search': SECONDS_PER_DAY,
+    'email-finder': SECONDS_PER_DAY,
+    'email-verifier': SECONDS_PER_HOUR,
+})
+
+_CASE_INSENSITIVE_PARAMS = frozenset(('domain', 'email'))
+
+
+def canonical_key(endpoint: str, query_params: Mapping) -> str:
+    """Build a cache key from an endpoint name and its query parameters.
+
+    The api_key and empty parameters are dropped, values are stripped and
+    domain/email are lowercased, and keys are sorted, so equivalent
+    queries map to the same key.
+
+    Args:
+        endpoint: The endpoint name, e.g. 'domain-search'.
+        query_params: The query parameters of the request.
+
+    Returns:
+        The cache key.
+
+    """
+    canonical = {}
+    for param_name, param_value in query_params.items():
+        if param_name == 'api_key' or param_value is None:
+            continue
+        normalized = str(param_value).strip()
+        if param_name in _CASE_INSENSITIVE_PARAMS:
+            normalized = normalized.lower()
+        canonical[param_name] = normalized
+    encoded_params = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    return '{0}?{1}'.format(endpoint, encoded_params)
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response caches with per-endpoint TTLs and hit counters.
+
+    Endpoints without a TTL (or with a TTL of 0) are never cached.
+    Subclasses implement storage through _load and _store.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttls: Seconds to keep responses, per endpoint name.
+            clock: Time source used for expiry.
+
+        """
+        self.ttls = dict(ttls)
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+
+    def get(self, endpoint: str, query_params: Mapping) -> dict | None:
+        """Look up a cached response.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+            query_params: The query parameters of the request.
+
+        Returns:
+            The cached response data, or None on a miss.
+
+        """
+        if not self.ttls.get(endpoint):
+            return None
+        cached = self._load(canonical_key(endpoint, query_params), self._clock())
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def set(self, endpoint: str, query_params: Mapping, response_data: dict) -> None:
+        """Store a response for its endpoint TTL.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+            query_params: The query parameters of the request.
+            response_data: The response data to cache.
+
+        """
+        ttl = self.ttls.get(endpoint)
+        if ttl:
+            self._store(canonical_key(endpoint, query_params), response_data, self._clock() + ttl)
+
+    @abc.abstractmethod
+    def _load(self, key: str, now: float) -> dict | None:
+        """Return the unexpired entry for key.
+
+        Args:
+            key: The cache key.
+            now: The current time.
+
+        """
+
+    @abc.abstractmethod
+    def _store(self, key: str, response_data: dict, expires_at: float) -> None:
+        """Store an entry until expires_at.
+
+        Args:
+            key: The cache key.
+            response_data: The response data to cache.
+            expires_at: Time after which the entry is stale.
+
+        """
+
+
+class NullCache(ResponseCache):
+    """Cache that stores nothing, used when no cache is configured."""
+
+    def __init__(self) -> None:
+        """Initialize a cache without TTLs, so no endpoint is looked up or stored."""
+        super().__init__(ttls={})
+
+    def _load(self, key: str, now: float) -> dict | None:
+        """Miss every lookup; with no TTLs, get() never reaches this.
+
+        Args:
+            key: The cache key.
+            now: The current time.
+
+        """
+
+    def _store(self, key: str, response_data: dict, expires_at: float) -> None:
+        """Drop the entry.
+
+        Args:
+            key: The cache key.
+            response_data: The response data to cache.
+            expires_at: Time after which the entry is stale.
+
+        """
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-process cache with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used ones are evicted.
+            ttls: Seconds to keep responses, per endpoint name.
+            clock: Time source used for expiry.
+
+        """
+        super().__init__(ttls, clock)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including stale ones.
+
+        Returns:
+            The number of entries.
+
+        """
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str, now: float) -> dict | None:
+        """Return the unexpired entry for key and mark it recently used.
+
+        Args:
+            key: The cache key.
+            now: The current time.
+
+        Returns:
+            A copy of the cached response data, or None.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+        # Callers own what they get, so editing a hit never changes later hits
+        return copy.deepcopy(entry[1])
+
+    def _store(self, key: str, response_data: dict, expires_at: float) -> None:
+        """Store an entry, evicting the least recently used ones when full.
+
+        Args:
+            key: The cache key.
+            response_data: The response data to cache.
+            expires_at: Time after which the entry is stale.
+
+        """
+        stored = copy.deepcopy(response_data)
+        with self._lock:
+            self._entries[key] = (expires_at, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,178 @@
+"""Per-endpoint circuit breaker for the Hunter.io API.
+
+When too many recent calls to an endpoint failed with server or
+connection errors, the circuit opens and further calls fail fast until a
+cool-down has passed and a trial call succeeds.
+"""
+
+import enum
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from hunter_wrapper.exceptions import HunterCircuitOpenError
+
+
+class CircuitState(enum.Enum):
+    """State of an endpoint circuit."""
+
+    closed = 'closed'
+    open = 'open'
+    half_open = 'half_open'
+
+
+class _Circuit:
+    """Failure window and state of one endpoint."""
+
+    def __init__(self, window_size: int) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            window_size: Number of recent outcomes kept.
+
+        """
+        self.state = CircuitState.closed
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.opened_at = float(0)
+        self.trial_in_flight = False
+
+    def failure_rate(self) -> float:
+        """Return the share of failures in the window.
+
+        Returns:
+            The failure rate between 0 and 1.
+
+        """
+        if not self.outcomes:
+            return 0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+@dataclass
+class CircuitBreaker:
+    """Circuit breaker keeping one circuit per endpoint.
+
+    Attributes:
+        failure_rate: Failure share in the window that opens the circuit.
+        window_size: Number of recent calls considered.
+        min_calls: Calls needed in the window before the circuit may open.
+        cooldown: Seconds the circuit stays open before a trial call.
+        clock: Monotonic time source.
+
+    """
+
+    failure_rate: float = 0.5
+    window_size: int = 20
+    min_calls: int = 10
+    cooldown: float = 30
+    clock: Callable[[], float] = time.monotonic
+    _circuits: dict[str, _Circuit] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def before_call(self, endpoint: str) -> bool:
+        """Let a call through or fail fast.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+
+        Returns:
+            True if the call is the trial call of a half-open circuit; pass it
+            on to record_success, record_failure and release_trial.
+
+        Raises:
+            HunterCircuitOpenError: If the circuit is open or a trial call is in flight.
+
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state is CircuitState.closed:
+                return False
+            retry_in = circuit.opened_at + self.cooldown - self.clock()
+            if retry_in > 0 or circuit.trial_in_flight:
+                raise HunterCircuitOpenError(
+                    'Circuit for {0} is open'.format(endpoint),
+                    retry_in=max(retry_in, 0),
+                )
+            circuit.state = CircuitState.half_open
+            circuit.trial_in_flight = True
+            return True
+
+    def record_success(self, endpoint: str, trial: bool = False) -> None:
+        """Record a call that reached a healthy API.
+
+        Only the trial call closes a half-open circuit; calls let through
+        before it opened do not.
+
+        Args:
+            endpoint: The endpoint name.
+            trial: Whether the call is the trial call, as returned by before_call.
+
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if trial and circuit.state is CircuitState.half_open:
+                circuit.state = CircuitState.closed
+                circuit.outcomes.clear()
+                circuit.trial_in_flight = False
+            circuit.outcomes.append(True)
+
+    def record_failure(self, endpoint: str, trial: bool = False) -> None:
+        """Record a call that failed with a server or connection error.
+
+        Args:
+            endpoint: The endpoint name.
+            trial: Whether the call is the trial call, as returned by before_call.
+
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.outcomes.append(False)
+            trial_failed = trial and circuit.state is CircuitState.half_open
+            closed = circuit.state is CircuitState.closed
+            enough_calls = closed and len(circuit.outcomes) >= self.min_calls
+            if trial_failed or (enough_calls and circuit.failure_rate() >= self.failure_rate):
+                circuit.state = CircuitState.open
+                circuit.opened_at = self.clock()
+                circuit.trial_in_flight = False
+
+    def release_trial(self, endpoint: str) -> None:
+        """Let another trial call through after one that said nothing about the API's health.
+
+        Calls failing before they reach the API, e.g. while waiting for the
+        rate limiter, neither close nor reopen the circuit. Only call it for
+        the call that before_call let through as the trial.
+
+        Args:
+            endpoint: The endpoint name.
+
+        """
+        with self._lock:
+            self._circuit(endpoint).trial_in_flight = False
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the state of every endpoint circuit, e.g. for dashboards.
+
+        Returns:
+            The circuit state, per endpoint name.
+
+        """
+        with self._lock:
+            return {endpoint: circuit.state for endpoint, circuit in self._circuits.items()}
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        """Return the circuit of endpoint, creating it if needed.
+
+        Args:
+            endpoint: The endpoint name.
+
+        Returns:
+            The endpoint circuit.
+
+        """
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = _Circuit(self.window_size)
+            self._circuits[endpoint] = circuit
+        return circuit
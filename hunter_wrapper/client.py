@@ -3,27 +3,43 @@
 This module provides the main client class for interacting with Hunter.io API.
 """
 
+import contextlib
+import functools
+
 import requests
 
-from hunter_wrapper.exceptions import HunterAPIError, MissingCompanyError, MissingNameError
+from hunter_wrapper.base import BaseHunterClient, endpoint_name
+from hunter_wrapper.cache import canonical_key
+from hunter_wrapper.coalescing import SingleFlight
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.deadline import Deadline
+from hunter_wrapper.exceptions import HunterAPIError
+from hunter_wrapper.keys import KeyPool
+from hunter_wrapper.sender import RequestSender
+from hunter_wrapper.transport import SessionLifecycleMixin, create_session
 
 
-class HunterClient:
+class HunterClient(SessionLifecycleMixin, BaseHunterClient):
     """Client for interacting with the Hunter.io API.
 
+    All calls share one pooled keep-alive session; use the client as a
+    context manager or call close() to release its connections.
+
     For documentation, visit: https://hunter.io/api-documentation/v2
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str | KeyPool, config: ClientConfig | None = None) -> None:
         """Initialize the HunterClient.
 
         Args:
-            api_key: The API key for Hunter.io authentication.
+            api_key: The API key for Hunter.io authentication, or a pool of keys.
+            config: Optional client settings, defaults are used if omitted.
 
         """
-        self.api_key = api_key
-        self.base_params = {'api_key': api_key}
-        self.base_endpoint = 'https://api.hunter.io/v2/{endpoint}'
+        super().__init__(api_key, config)
+        self.session = create_session(self.config.pool)
+        self.sender = RequestSender(self.session, self.config, self.key_pool)
+        self._inflight = SingleFlight()
 
     def email_verifier(self, email: str, raw: bool = False) -> dict | requests.Response:
         """Verify the deliverability of a given email address.
@@ -34,10 +50,14 @@ class HunterClient:
 
         Returns:
             If raw is True: requests.Response object.
-            If raw is False: Email verification data as dict.
+            If raw is False: Email verification data as dict; addresses failing
+            the local checks get a synthetic 'invalid' or 'disposable' result without a request.
 
         """
-        query_params = {'email': email, 'api_key': self.api_key}
+        check = self._domain_index.screen(self.config.email_validator.precheck(email))
+        if not (raw or check.valid):
+            return check.local_result()
+        query_params = {'email': check.email, 'api_key': self.api_key}
         endpoint = self.base_endpoint.format(endpoint='email-verifier')
         return self._query_hunter(
             endpoint,
@@ -65,24 +85,17 @@ class HunterClient:
             If raw is False: Domain search data as dict with email addresses found.
 
         Raises:
-            MissingCompanyError: If neither domain nor company is provided.
+            MissingCompanyError: If neither domain nor company is provided.  # noqa: DAR402
 
         """
-        if domain:
-            query_parameters = {'domain': domain, 'api_key': self.api_key}
-        elif company:
-            query_parameters = {'company': company, 'api_key': self.api_key}
-        else:
-            raise MissingCompanyError(
-                'You must supply at least a domain name or a company name',
-            )
-
-        # Add optional parameters from kwargs
-        self._add_optional_search_params(query_parameters, kwargs)
-
+        query_parameters = self._domain_search_params(domain, company, kwargs)
         endpoint = self.base_endpoint.format(endpoint='domain-search')
 
-        return self._query_hunter(endpoint, query_parameters, raw=raw)
+        response = self._query_hunter(endpoint, query_parameters, raw=raw)
+        if isinstance(response, dict):
+            self._domain_index.observe(response)
+            self._patterns.observe(response)
+        return response
 
     def email_finder(
         self,
@@ -104,24 +117,18 @@ class HunterClient:
             If raw is False: Tuple of (email, score).
 
         Raises:
-            MissingCompanyError: If neither domain nor company is provided.
+            MissingCompanyError: If neither domain nor company is provided.  # noqa: DAR402
             MissingNameError: If name information is insufficient.  # noqa: DAR402
+            HunterSkippedDomainError: If the domain is a known webmail or disposable domain.  # noqa: DAR402
 
         """
-        query_parameters = self.base_params.copy()
-
-        # Validate and add company/domain parameters
-        if not domain and not company:
-            raise MissingCompanyError(
-                'You must supply at least a domain name or a company name',
-            )
-        if domain:
-            query_parameters['domain'] = domain
-        elif company:
-            query_parameters['company'] = company
-
-        # Validate and add name parameters
-        self._validate_and_add_name_params(query_parameters, name_params)
+        query_parameters = self._email_finder_params(domain, company, name_params)
+        # Render the address from a cached domain pattern when one is known
+        candidate = None if raw else self._patterns.candidate(query_parameters)
+        if candidate is not None:
+            verification = None if candidate.trusted else self.email_verifier(candidate.email)
+            if candidate.accepts(verification):
+                return candidate.email, candidate.score
 
         endpoint = self.base_endpoint.format(endpoint='email-finder')
 
@@ -133,67 +140,28 @@ class HunterClient:
 
         # Type narrowing: when raw=False, response is dict
         assert isinstance(response, dict)
-        email = response['email']
-        score = response['score']
+        return response['email'], response['score']
 
-        return email, score
+    def account_information(self, raw: bool = False) -> dict | requests.Response:
+        """Return the account's plan and its used and available searches and verifications.
 
-    def _validate_and_add_name_params(
-        self,
-        query_parameters: dict,
-        name_params: dict,
-    ) -> None:
-        """Validate and add name parameters to the query.
+        Fetching the account is free and reconciles the credit scheduler, if one is configured.
+        With a key pool, the account of one of the keys is returned and nothing is reconciled.
 
         Args:
-            query_parameters: The query parameters dict to update.
-            name_params: Dictionary containing name-related parameters.
-
-        Raises:
-            MissingNameError: If name information is insufficient.
-
-        """
-        first_name = name_params.get('first_name')
-        last_name = name_params.get('last_name')
-        full_name = name_params.get('full_name')
-
-        has_both_names = bool(first_name and last_name)
-
-        if not full_name and not has_both_names:
-            raise MissingNameError(
-                'You must supply a first name AND a last name OR a full name',
-            )
-
-        if has_both_names:
-            query_parameters['first_name'] = first_name
-            query_parameters['last_name'] = last_name
-        elif full_name:
-            query_parameters['full_name'] = full_name
-
-    def _add_optional_search_params(
-        self,
-        query_parameters: dict,
-        kwargs: dict,
-    ) -> None:
-        """Add optional search parameters to the query.
+            raw: If True, returns the entire response instead of just the 'data'.
 
-        Args:
-            query_parameters: The query parameters dict to update.
-            kwargs: Dictionary containing optional parameters.
+        Returns:
+            If raw is True: requests.Response object.
+            If raw is False: Account data as dict, with usage under 'requests'.
 
         """
-        optional_params = {
-            'limit': 'limit',
-            'offset': 'offset',
-            'seniority': 'seniority',
-            'department': 'department',
-            'emails_type': 'type',
-        }
-
-        for key, api_key in optional_params.items():
-            param_value = kwargs.get(key, None)
-            if param_value is not None:
-                query_parameters[api_key] = param_value
+        endpoint = self.base_endpoint.format(endpoint='account')
+        response = self._query_hunter(endpoint, {'api_key': self.api_key}, raw=raw)
+        # With a key pool each key reconciles its own credits from its own account
+        if isinstance(response, dict) and self.key_pool is None:
+            self.sender.credits.reconcile(response)
+        return response
 
     def _query_hunter(
         self,
@@ -208,27 +176,58 @@ class HunterClient:
             endpoint: The API endpoint URL.
             query_params: Query parameters for the request.
             request_type: HTTP method to use.
-            raw: If True, return the raw response.
+            raw: If True, return the raw response; raw responses bypass caching and coalescing.
 
         Returns:
             If raw is True: requests.Response object.
             If raw is False: API response data as dict.
 
         Raises:
-            HunterAPIError: If the API returns an error.
+            HunterAPIError: If the API returns an error.  # noqa: DAR402
+            HunterDeadlineExceededError: If the call used up its time budget.  # noqa: DAR402
 
         """
-        request_kwargs = {'params': query_params}
-        res = getattr(requests, request_type)(endpoint, **request_kwargs)
-        res.raise_for_status()
+        # Rate-limit waits, coalescing waits and retries share one time budget
+        with Deadline(self.config.timeout.total):
+            name = endpoint_name(endpoint)
+            # A failed reconciliation keeps the local count until the next one
+            if self.key_pool is None and self.sender.credits.start_reconcile(name):
+                with contextlib.suppress(HunterAPIError, requests.HTTPError):
+                    self.account_information()
+            if raw:
+                return self.sender.send(request_type, endpoint, query_params)
+
+            key_params = self._key_params(query_params)
+            cached = self._cache.get(name, key_params)
+            if cached is not None:
+                return cached
+
+            # Concurrent identical lookups share one in-flight request
+            return self._inflight.run(
+                canonical_key(name, key_params),
+                functools.partial(self._fetch, endpoint, query_params, key_params, request_type),
+            )
 
-        if raw:
-            return res
+    def _fetch(
+        self,
+        endpoint: str,
+        query_params: dict,
+        key_params: dict,
+        request_type: str,
+    ) -> dict:
+        """Send one request, decode its data and store it in the cache.
 
-        try:
-            response_data = res.json()['data']
-        except KeyError:
-            error_message = str(res.json())
-            raise HunterAPIError(error_message)
+        Args:
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+            key_params: Query parameters the response is cached under.
+            request_type: HTTP method to use.
+
+        Returns:
+            API response data as dict.
 
+        """
+        res = self.sender.send(request_type, endpoint, query_params)
+        response_data = self.config.decoder.decode_data(res.content)
+        self._cache.set(endpoint_name(endpoint), key_params, response_data)
         return response_data
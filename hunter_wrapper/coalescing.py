@@ -0,0 +1,137 @@
+"""Single-flight coalescing of concurrent identical requests.
+
+While a request for a key is in flight, other callers asking for the
+same key wait for it and share its result or its exception. Waiting
+callers give up when their own call deadline expires.
+"""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from hunter_wrapper.deadline import remaining_time
+from hunter_wrapper.exceptions import HunterDeadlineExceededError
+
+
+class _Call:
+    """Shared state of one in-flight call."""
+
+    def __init__(self) -> None:
+        """Initialize an unfinished call."""
+        self.finished = threading.Event()
+        self.response: Any = None
+        self.error: Exception | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls made from several threads."""
+
+    def __init__(self) -> None:
+        """Initialize with no call in flight."""
+        self.coalesced = 0
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run func once for all concurrent callers of the same key.
+
+        Args:
+            key: Identity of the call, e.g. a canonical cache key.
+            func: Callable performing the call.
+
+        Returns:
+            The result of func, shared by every caller.
+
+        Raises:
+            Exception: The exception raised by func, for every caller.  # noqa: DAR402
+            HunterDeadlineExceededError: If the call deadline expires while waiting.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                leader = _Call()
+                self._calls[key] = leader
+            else:
+                self.coalesced += 1
+        if call is None:
+            return self._lead(key, leader, func)
+
+        if not call.finished.wait(remaining_time()):
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for a coalesced request')
+        if call.error is not None:
+            raise call.error
+        return call.response
+
+    def _lead(self, key: str, call: _Call, func: Callable[[], Any]) -> Any:
+        """Run func on behalf of every caller of key.
+
+        Args:
+            key: Identity of the call.
+            call: The shared call state.
+            func: Callable performing the call.
+
+        Returns:
+            The result of func.
+
+        """
+        try:
+            call.response = func()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key)
+            call.finished.set()
+        return call.response
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical calls made from one event loop."""
+
+    def __init__(self) -> None:
+        """Initialize with no call in flight."""
+        self.coalesced = 0
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func once for all concurrent callers of the same key.
+
+        Cancelling one caller does not cancel the shared call.
+
+        Args:
+            key: Identity of the call, e.g. a canonical cache key.
+            func: Coroutine function performing the call.
+
+        Returns:
+            The result of func, shared by every caller.
+
+        Raises:
+            HunterDeadlineExceededError: If the call deadline expires while waiting.
+
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(functools.partial(self._forget, key))
+        else:
+            self.coalesced += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), remaining_time())
+        except TimeoutError as exc:
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for a coalesced request') from exc
+
+    def _forget(self, key: str, call: asyncio.Future) -> None:
+        """Drop a finished call so later callers start a new one.
+
+        Args:
+            key: Identity of the call.
+            call: The finished call.
+
+        """
+        if self._calls.get(key) is call:
+            self._calls.pop(key)
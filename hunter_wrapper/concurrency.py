@@ -0,0 +1,297 @@
+"""Bounded-concurrency execution helpers for bulk Hunter.io lookups.
+
+Inputs are consumed lazily and results are yielded as soon as they
+complete, so only the in-flight window is ever held in memory.
+"""
+
+import abc
+import asyncio
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self
+
+
+@dataclass(frozen=True, slots=True)
+class BulkResult:
+    """Outcome of one lookup in a bulk job.
+
+    Attributes:
+        index: Position of the query in the input sequence.
+        query: The input the lookup was made for.
+        response: The lookup result, or None if it failed.
+        error: The exception raised by the lookup, or None on success.
+
+    """
+
+    index: int
+    query: Any
+    response: Any
+    error: BaseException | None = None
+
+
+class _InFlightWindow(abc.ABC):
+    """Keep a bounded number of lookups running over a lazy input."""
+
+    def __init__(self, queries: Iterable[Any], concurrency: int) -> None:
+        """Initialize the window.
+
+        Args:
+            queries: Input queries, consumed lazily.
+            concurrency: Maximum number of lookups in flight.
+
+        """
+        self._numbered = enumerate(queries)
+        self._concurrency = concurrency
+        self._pending: dict[Any, tuple[int, Any]] = {}
+
+    def __bool__(self) -> bool:
+        """Tell whether lookups are still in flight.
+
+        Returns:
+            True while the window is not empty.
+
+        """
+        return bool(self._pending)
+
+    def _fill(self, count: int) -> None:
+        """Start up to count lookups from the input.
+
+        Args:
+            count: Maximum number of lookups to start.
+
+        """
+        for index, query in itertools.islice(self._numbered, count):
+            self._pending[self._start(query)] = (index, query)
+
+    def _collect(self, done: set) -> list[BulkResult]:
+        """Turn finished futures into results and refill the window.
+
+        Args:
+            done: The finished futures or tasks.
+
+        Returns:
+            One BulkResult per finished future.
+
+        """
+        finished = [_future_result(future, *self._pending.pop(future)) for future in done]
+        self._fill(len(finished))
+        return finished
+
+    @abc.abstractmethod
+    def _start(self, query: Any) -> Any:
+        """Start one lookup.
+
+        Args:
+            query: The input to look up.
+
+        """
+
+
+class _ThreadWindow(_InFlightWindow):
+    """In-flight window running blocking lookups in worker threads."""
+
+    def __init__(
+        self,
+        func: Callable[[Any], Any],
+        queries: Iterable[Any],
+        concurrency: int,
+    ) -> None:
+        """Initialize the window and its thread pool.
+
+        Args:
+            func: Blocking callable applied to each query.
+            queries: Input queries, consumed lazily.
+            concurrency: Maximum number of lookups in flight.
+
+        """
+        super().__init__(queries, concurrency)
+        self._func = func
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def __enter__(self) -> Self:
+        """Start the first batch of lookups.
+
+        Returns:
+            The window itself.
+
+        """
+        self._fill(self._concurrency)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cancel lookups that have not started yet.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def drain(self) -> list[BulkResult]:
+        """Wait for at least one lookup to finish.
+
+        Returns:
+            The results of the finished lookups.
+
+        """
+        done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+        return self._collect(done)
+
+    def _start(self, query: Any) -> Future:
+        """Submit one lookup to the thread pool.
+
+        Args:
+            query: The input to look up.
+
+        Returns:
+            The future of the lookup.
+
+        """
+        return self._executor.submit(self._func, query)
+
+
+class _TaskWindow(_InFlightWindow):
+    """In-flight window running coroutine lookups as event loop tasks."""
+
+    def __init__(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        queries: Iterable[Any],
+        concurrency: int,
+    ) -> None:
+        """Initialize the window.
+
+        Args:
+            func: Coroutine function applied to each query.
+            queries: Input queries, consumed lazily.
+            concurrency: Maximum number of lookups in flight.
+
+        """
+        super().__init__(queries, concurrency)
+        self._func = func
+
+    async def __aenter__(self) -> Self:
+        """Start the first batch of lookups.
+
+        Returns:
+            The window itself.
+
+        """
+        self._fill(self._concurrency)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cancel lookups that are still running.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        for task in self._pending:
+            task.cancel()
+
+    async def drain(self) -> list[BulkResult]:
+        """Wait for at least one lookup to finish.
+
+        Returns:
+            The results of the finished lookups.
+
+        """
+        done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+        return self._collect(done)
+
+    def _start(self, query: Any) -> asyncio.Future:
+        """Schedule one lookup on the event loop.
+
+        Args:
+            query: The input to look up.
+
+        Returns:
+            The task of the lookup.
+
+        """
+        return asyncio.ensure_future(self._func(query))
+
+
+def run_bounded(
+    func: Callable[[Any], Any],
+    queries: Iterable[Any],
+    concurrency: int,
+) -> Iterator[BulkResult]:
+    """Run func over queries in threads, yielding results as they complete.
+
+    At most `concurrency` calls are in flight at once. Leaving the
+    iteration early cancels every call that has not started yet.
+
+    Args:
+        func: Blocking callable applied to each query.
+        queries: Input queries, consumed lazily.
+        concurrency: Maximum number of calls in flight.
+
+    Yields:
+        A BulkResult per query, in completion order.
+
+    """
+    with _ThreadWindow(func, queries, concurrency) as window:
+        while window:
+            yield from window.drain()
+
+
+async def arun_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    queries: Iterable[Any],
+    concurrency: int,
+) -> AsyncIterator[BulkResult]:
+    """Run func over queries as tasks, yielding results as they complete.
+
+    At most `concurrency` calls are in flight at once. Leaving the
+    iteration early cancels every call still running.
+
+    Args:
+        func: Coroutine function applied to each query.
+        queries: Input queries, consumed lazily.
+        concurrency: Maximum number of calls in flight.
+
+    Yields:
+        A BulkResult per query, in completion order.
+
+    """
+    async with _TaskWindow(func, queries, concurrency) as window:
+        while window:
+            for bulk_result in await window.drain():
+                yield bulk_result
+
+
+def _future_result(future: Future | asyncio.Future, index: int, query: Any) -> BulkResult:
+    """Convert a finished future into a BulkResult.
+
+    Args:
+        future: The finished future or task.
+        index: Position of the query in the input sequence.
+        query: The input the lookup was made for.
+
+    Returns:
+        The BulkResult for the lookup.
+
+    """
+    error = future.exception()
+    if error is not None:
+        return BulkResult(index, query, None, error)
+    return BulkResult(index, query, future.result())
@@ -0,0 +1,49 @@
+"""Configuration objects for the Hunter.io API client."""
+
+from dataclasses import dataclass, field
+
+from hunter_wrapper.cache import ResponseCache
+from hunter_wrapper.circuit import CircuitBreaker
+from hunter_wrapper.credits import CreditScheduler
+from hunter_wrapper.deadline import TimeoutConfig
+from hunter_wrapper.decoding import ResponseDecoder
+from hunter_wrapper.domain_index import DomainIndex
+from hunter_wrapper.patterns import PatternCache
+from hunter_wrapper.ratelimit import RateLimiter
+from hunter_wrapper.retry import RetryPolicy
+from hunter_wrapper.transport import PoolConfig
+from hunter_wrapper.validation import EmailValidator
+
+
+@dataclass
+class ClientConfig:
+    """Optional settings for HunterClient.
+
+    Attributes:
+        pool: Connection pool settings for the HTTP transport.
+        timeout: Connect/read timeouts and the default time budget of a call.
+        cache: Optional response cache, e.g. MemoryCache(); responses are not cached if omitted.
+        rate_limiter: Optional per-endpoint rate limiter; requests are not throttled if omitted.
+        retry_policy: Retry policy for transient failures; RetryPolicy() if omitted.
+        circuit_breaker: Per-endpoint circuit breaker; CircuitBreaker() if omitted.
+        credit_scheduler: Optional credit tracker pacing calls to hourly/daily budgets; nothing is tracked if omitted.
+        decoder: Decoder of response bodies; uses the fastest installed JSON parser by default.
+        email_validator: Local syntax check run before email_verifier calls; EmailValidator(enabled=False) turns it off.
+        domain_index: Optional webmail/disposable domain index, e.g. DomainIndex.bundled(); nothing is skipped if unset.
+        pattern_cache: Optional cache of domain email patterns used to render email_finder results locally.
+        normalize_names: Whether email_finder caches and coalesces on names folded to lowercase ASCII, sent as given.
+
+    """
+
+    pool: PoolConfig = field(default_factory=PoolConfig)
+    timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
+    cache: ResponseCache | None = None
+    rate_limiter: RateLimiter | None = None
+    retry_policy: RetryPolicy | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    credit_scheduler: CreditScheduler | None = None
+    decoder: ResponseDecoder = field(default_factory=ResponseDecoder)
+    email_validator: EmailValidator = field(default_factory=EmailValidator)
+    domain_index: DomainIndex | None = None
+    pattern_cache: PatternCache | None = None
+    normalize_names: bool = True
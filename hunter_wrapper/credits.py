@@ -0,0 +1,264 @@
+"""Credit budgets for long-running Hunter.io jobs.
+
+Domain searches and email finder lookups spend search credits, email
+verifications spend verification credits. The scheduler counts them
+locally, reconciles the count with the account endpoint from time to
+time and makes calls wait once an hourly or daily budget is spent, so
+bulk jobs pause instead of draining the plan's monthly credits.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from hunter_wrapper.cache import SECONDS_PER_DAY, SECONDS_PER_HOUR
+from hunter_wrapper.deadline import remaining_time
+from hunter_wrapper.exceptions import HunterCreditsExhaustedError
+
+SEARCHES = 'searches'
+VERIFICATIONS = 'verifications'
+
+# Credit kind spent by each endpoint; other endpoints, such as account, are free
+CREDIT_KINDS = MappingProxyType({
+    'domain-search': SEARCHES,
+    'email-finder': SEARCHES,
+    'email-verifier': VERIFICATIONS,
+})
+
+DEFAULT_RECONCILE_INTERVAL = 600
+NO_BUDGETS: Mapping[str, 'CreditBudget'] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class CreditBudget:
+    """Credits of one kind a client may spend per hour and per day.
+
+    Attributes:
+        per_hour: Credits allowed per hour, or None for no hourly limit.
+        per_day: Credits allowed per day, or None for no daily limit.
+
+    """
+
+    per_hour: int | None = None
+    per_day: int | None = None
+
+
+class _Window:
+    """Fixed time window counting the credits spent in it."""
+
+    def __init__(self, length: float, limit: int) -> None:
+        """Initialize a window that starts with the first credit spent.
+
+        Args:
+            length: Length of the window in seconds.
+            limit: Credits allowed per window.
+
+        """
+        self.length = length
+        self.limit = limit
+        self.spent = 0
+        self._started_at: float | None = None
+
+    def wait(self, now: float) -> float:
+        """Return how long to wait before the next credit may be spent.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            0 if the window has credits left, otherwise the seconds until it ends.
+
+        """
+        if self._started_at is None or now >= self._started_at + self.length:
+            self._started_at = now
+            self.spent = 0
+        if self.spent < self.limit:
+            return 0
+        return self._started_at + self.length - now
+
+
+def _longest_wait(windows: list[_Window], now: float) -> float:
+    """Return how long to wait until every window has credits left.
+
+    Args:
+        windows: The hourly and daily windows of a credit kind.
+        now: The current time.
+
+    Returns:
+        The longest wait of the windows, 0 if none is spent.
+
+    """
+    return max((window.wait(now) for window in windows), default=0)
+
+
+def _reconcile_due(reconciled_at: float | None, interval: float | None, now: float) -> bool:
+    """Tell whether the account should be fetched again.
+
+    Args:
+        reconciled_at: When the account was last fetched, or None if never.
+        interval: Seconds between fetches, or None to never fetch it.
+        now: The current time.
+
+    Returns:
+        True if reconciling is on and the last reconciliation is older than the interval.
+
+    """
+    if interval is None:
+        return False
+    return reconciled_at is None or now - reconciled_at >= interval
+
+
+class CreditScheduler:
+    """Track remaining credits and pace calls to stay within a budget.
+
+    Without budgets and reconciliation the scheduler never makes a call wait.
+    """
+
+    def __init__(
+        self,
+        budgets: Mapping[str, CreditBudget] = NO_BUDGETS,
+        reconcile_every: float | None = DEFAULT_RECONCILE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            budgets: Budget per credit kind, 'searches' or 'verifications'.
+            reconcile_every: Seconds between account endpoint calls; None never calls it.
+            clock: Monotonic time source.
+
+        """
+        self.reconcile_every = reconcile_every
+        # Monthly credits left per kind, known once the account was fetched
+        self.remaining: dict[str, int] = {}
+        self._windows = {
+            kind: [
+                _Window(length, limit)
+                for length, limit in ((SECONDS_PER_HOUR, budget.per_hour), (SECONDS_PER_DAY, budget.per_day))
+                if limit is not None
+            ]
+            for kind, budget in budgets.items()
+        }
+        self._clock = clock
+        self._reconciled_at: float | None = None
+        self._lock = threading.Lock()
+
+    def start_reconcile(self, endpoint: str) -> bool:
+        """Tell whether the account should be fetched before a call to endpoint.
+
+        Only one caller per interval is told to fetch it.
+
+        Args:
+            endpoint: The endpoint name of the upcoming call.
+
+        Returns:
+            True if the caller should fetch the account and pass it to reconcile().
+
+        """
+        if endpoint not in CREDIT_KINDS:
+            return False
+        with self._lock:
+            now = self._clock()
+            if not _reconcile_due(self._reconciled_at, self.reconcile_every, now):
+                return False
+            self._reconciled_at = now
+            return True
+
+    def reconcile_due(self) -> bool:
+        """Tell whether the account should be fetched again, e.g. to learn about renewed credits.
+
+        Returns:
+            True if reconciling is on and the last reconciliation is older than the interval.
+
+        """
+        with self._lock:
+            return _reconcile_due(self._reconciled_at, self.reconcile_every, self._clock())
+
+    def reconcile(self, account_data: dict) -> None:
+        """Replace the local credit counts with the account's.
+
+        Args:
+            account_data: The dict returned by account_information.
+
+        """
+        usage_by_kind = account_data.get('requests') or {}
+        with self._lock:
+            self._reconciled_at = self._clock()
+            for kind in (SEARCHES, VERIFICATIONS):
+                usage = usage_by_kind.get(kind)
+                if usage:
+                    used = usage.get('used', 0)
+                    self.remaining[kind] = usage.get('available', 0) - used
+
+    def acquire(self, endpoint: str) -> bool:
+        """Block until a call to endpoint fits in the budget, and spend its credit.
+
+        Waits are bounded by the deadline of the running call, if any.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-verifier'.
+
+        Returns:
+            True once the credit is spent, False if the wait would exceed the deadline.
+
+        """
+        while True:
+            wait = self._reserve(endpoint, remaining_time())
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            time.sleep(wait)
+
+    async def aacquire(self, endpoint: str) -> bool:
+        """Wait on the event loop until a call to endpoint fits in the budget.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-verifier'.
+
+        Returns:
+            True once the credit is spent, False if the wait would exceed the deadline.
+
+        """
+        while True:
+            wait = self._reserve(endpoint, remaining_time())
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            await asyncio.sleep(wait)
+
+    def _reserve(self, endpoint: str, max_wait: float | None) -> float | None:
+        """Spend a credit for endpoint if the budget allows it now.
+
+        Args:
+            endpoint: The endpoint name.
+            max_wait: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            0 once the credit is spent, the seconds to wait before trying
+            again, or None if that wait would exceed max_wait.
+
+        Raises:
+            HunterCreditsExhaustedError: If no credits of the kind are left this month.
+
+        """
+        kind = CREDIT_KINDS.get(endpoint)
+        if kind is None:
+            return 0
+        with self._lock:
+            left = self.remaining.get(kind)
+            if left is not None and left <= 0:
+                raise HunterCreditsExhaustedError('No {0} credits left this month'.format(kind))
+            windows = self._windows.get(kind, [])
+            wait = _longest_wait(windows, self._clock())
+            if wait:
+                return None if max_wait is not None and wait > max_wait else wait
+            for window in windows:
+                window.spent += 1
+            if left is not None:
+                self.remaining[kind] = left - 1
+            return 0
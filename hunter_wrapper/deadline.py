@@ -0,0 +1,125 @@
+"""Timeouts and call deadlines for the Hunter.io API clients.
+
+A deadline is a time budget for a whole call: rate-limit waits, waits on
+a coalesced request, every attempt and the backoff between retries all
+draw from it. Deadlines propagate through context variables, so they
+follow the call into nested code and asyncio tasks.
+"""
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Self
+
+from hunter_wrapper.exceptions import HunterDeadlineExceededError
+
+_deadline_at: ContextVar[float | None] = ContextVar('hunter_deadline_at', default=None)
+
+
+def current_deadline() -> float | None:
+    """Return the deadline of the running call as monotonic time.
+
+    Returns:
+        The deadline, or None if the call has no budget.
+
+    """
+    return _deadline_at.get()
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left in the budget of the running call.
+
+    Returns:
+        Seconds left (0 once expired), or None if the call has no budget.
+
+    """
+    deadline_at = _deadline_at.get()
+    if deadline_at is None:
+        return None
+    return max(0, deadline_at - time.monotonic())
+
+
+class Deadline:
+    """Context manager giving the calls made inside it a time budget.
+
+    Nested deadlines never extend an enclosing one. A budget of None
+    keeps the enclosing deadline, if any.
+    """
+
+    def __init__(self, seconds: float | None) -> None:
+        """Initialize the deadline.
+
+        Args:
+            seconds: Time budget in seconds, or None for no additional limit.
+
+        """
+        self.seconds = seconds
+        self._token: Token | None = None
+
+    def __enter__(self) -> Self:
+        """Start the budget.
+
+        Returns:
+            The deadline itself.
+
+        """
+        deadline_at = _deadline_at.get()
+        if self.seconds is not None:
+            own_deadline_at = time.monotonic() + self.seconds
+            deadline_at = own_deadline_at if deadline_at is None else min(deadline_at, own_deadline_at)
+        self._token = _deadline_at.set(deadline_at)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Restore the enclosing deadline.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        if self._token is not None:
+            _deadline_at.reset(self._token)
+            self._token = None
+
+
+@dataclass(frozen=True)
+class TimeoutConfig:
+    """Client-level timeout settings.
+
+    Attributes:
+        connect: Seconds to wait for a connection to the API.
+        read: Seconds to wait for response data.
+        total: Default time budget of a call when no Deadline is active; None for no budget.
+
+    """
+
+    connect: float = 5
+    read: float = 30
+    total: float | None = None
+
+    def for_attempt(self) -> tuple[float, float]:
+        """Return the connect and read timeouts of the next attempt.
+
+        Both are clipped to the budget left in the running call.
+
+        Returns:
+            Tuple of (connect, read) timeouts in seconds.
+
+        Raises:
+            HunterDeadlineExceededError: If the budget is used up.
+
+        """
+        remaining = remaining_time()
+        if remaining is None:
+            return self.connect, self.read
+        if not remaining:
+            raise HunterDeadlineExceededError('Call deadline exceeded')
+        return min(self.connect, remaining), min(self.read, remaining)
@@ -0,0 +1,176 @@
+"""JSON decoding of Hunter.io API responses.
+
+Each response body is parsed exactly once. The fastest installed parser is
+used: orjson, then msgspec, then the standard library. With msgspec
+installed, responses can also be decoded straight into typed structs.
+"""
+
+import dataclasses
+import importlib
+import json
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+from hunter_wrapper.exceptions import HunterAPIError
+
+
+def _optional_import(module_name: str) -> ModuleType | None:
+    """Import an optional dependency.
+
+    Args:
+        module_name: The module to import.
+
+    Returns:
+        The module, or None if it is not installed.
+
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:  # pragma: no cover
+        return None
+
+
+orjson = _optional_import('orjson')
+msgspec = _optional_import('msgspec')
+
+_DataT = TypeVar('_DataT')
+
+JsonLoads = Callable[[bytes], Any]
+
+_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if msgspec is not None:
+    _DECODE_ERRORS = (ValueError, msgspec.MsgspecError)
+
+
+def default_loads() -> JsonLoads:
+    """Return the fastest installed JSON parser.
+
+    Returns:
+        orjson.loads, msgspec.json.decode or json.loads, in that order of preference.
+
+    """
+    if orjson is not None:
+        return orjson.loads
+    if msgspec is not None:
+        return msgspec.json.decode
+    return json.loads
+
+
+def _declared(data_type: type, response_data: dict) -> dict:
+    """Keep the fields of response data that a dataclass declares.
+
+    Args:
+        data_type: The type to build.
+        response_data: The decoded 'data' member.
+
+    Returns:
+        The fields data_type accepts; all of them if it is not a dataclass.
+
+    """
+    if not dataclasses.is_dataclass(data_type):
+        return response_data
+    names = {data_field.name for data_field in dataclasses.fields(data_type) if data_field.init}
+    return {name: field_value for name, field_value in response_data.items() if name in names}
+
+
+class ResponseDecoder:
+    """Decode API response bodies with a pluggable JSON parser."""
+
+    def __init__(self, loads: JsonLoads | None = None) -> None:
+        """Initialize the decoder.
+
+        Args:
+            loads: Function parsing a JSON body; the fastest installed parser if omitted.
+
+        """
+        self.loads = default_loads() if loads is None else loads
+        self._typed_decoders: dict[type, Any] = {}
+
+    def decode(self, body: bytes) -> Any:
+        """Parse a response body.
+
+        Args:
+            body: The raw response body.
+
+        Returns:
+            The decoded JSON document.
+
+        Raises:
+            HunterAPIError: If the body is not valid JSON.
+
+        """
+        try:
+            return self.loads(body)
+        except _DECODE_ERRORS as error:
+            raise HunterAPIError('Invalid JSON response: {0}'.format(error)) from error
+
+    def decode_data(self, body: bytes) -> dict:
+        """Parse a response body and return its 'data' member.
+
+        Args:
+            body: The raw response body.
+
+        Returns:
+            API response data as dict.
+
+        Raises:
+            HunterAPIError: If the body is not valid JSON or holds an API error.
+
+        """
+        payload = self.decode(body)
+        try:
+            return payload['data']
+        except (KeyError, TypeError):
+            raise HunterAPIError(str(payload))
+
+    def decode_into(self, body: bytes, data_type: type[_DataT]) -> _DataT:
+        """Decode the 'data' member of a response body into a typed object.
+
+        Types with a from_dict classmethod, such as the result models, are
+        built from the decoded data. Otherwise, with msgspec installed the
+        body is decoded and validated in one pass; without it data_type is
+        called with the decoded fields it declares, other fields are dropped.
+
+        Args:
+            body: The raw response body.
+            data_type: A result model, msgspec Struct, dataclass or other type msgspec can decode into.
+
+        Returns:
+            The response data as a data_type instance.
+
+        Raises:
+            HunterAPIError: If the body is not valid JSON, holds an API error or does not match data_type.
+
+        """
+        from_dict = getattr(data_type, 'from_dict', None)
+        if msgspec is None or from_dict is not None:
+            response_data = self.decode_data(body)
+            try:
+                return from_dict(response_data) if from_dict else data_type(**_declared(data_type, response_data))
+            except (KeyError, TypeError, ValueError) as build_error:
+                raise HunterAPIError('Unexpected response data: {0!r}'.format(build_error)) from build_error
+        try:
+            return self._typed_decoder(data_type).decode(body).data
+        except msgspec.MsgspecError as error:
+            # Surface the API's own error payload when there is one
+            self.decode_data(body)
+            raise HunterAPIError('Unexpected response data: {0}'.format(error)) from error
+
+    def _typed_decoder(self, data_type: type) -> Any:
+        """Return the msgspec decoder for responses carrying data_type.
+
+        Args:
+            data_type: The type of the 'data' member.
+
+        Returns:
+            A msgspec.json.Decoder of the response envelope.
+
+        """
+        # Type narrowing: only called when msgspec is installed
+        assert msgspec is not None
+        typed_decoder = self._typed_decoders.get(data_type)
+        if typed_decoder is None:
+            envelope = msgspec.defstruct('HunterEnvelope', [('data', data_type)])
+            typed_decoder = msgspec.json.Decoder(envelope)
+            self._typed_decoders[data_type] = typed_decoder
+        return typed_decoder
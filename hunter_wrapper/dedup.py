@@ -0,0 +1,361 @@
+"""Deduplication stage for bulk lookups.
+
+Inputs that share a normalized key, e.g. the same address in several CRM
+records, are looked up once and the result is copied back to every
+position that asked for it. Inputs are still read lazily: each step reads
+a bounded number of inputs, and only a bounded number of parked
+duplicates and finished results are kept, so memory stays constant
+however long the job is.
+"""
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from hunter_wrapper.concurrency import BulkResult, arun_bounded, run_bounded
+from hunter_wrapper.names import normalize_name_params
+
+# Input positions, with their queries, that share one lookup
+_Positions = list[tuple[int, Any]]
+
+DEFAULT_LOOKAHEAD = 100
+DEFAULT_MAX_WAITING = 1000
+DEFAULT_MAX_DONE = 10000
+
+
+def email_key(email: str) -> str:
+    """Return the deduplication key of an address.
+
+    Args:
+        email: The address to verify.
+
+    Returns:
+        The address stripped and lowercased, as in the response cache key.
+
+    """
+    return email.strip().lower()
+
+
+def finder_key(row: dict, normalize: bool = True) -> tuple:
+    """Return the deduplication key of an email finder row.
+
+    Args:
+        row: Row with domain or company and first_name/last_name or full_name.
+        normalize: Whether names are normalized, as with ClientConfig.normalize_names.
+
+    Returns:
+        The lowercased domain and company with the name parameters.
+
+    """
+    names = {'first_name': row.get('first_name'), 'last_name': row.get('last_name')}
+    if not all(names.values()):
+        names = {'full_name': row.get('full_name') or ''}
+    if normalize:
+        names = normalize_name_params(names)
+    domain = (row.get('domain') or '').strip().lower()
+    company = (row.get('company') or '').strip().casefold()
+    return (domain, company, *sorted(names.items()))
+
+
+class Deduplication:
+    """Settings and counters of the deduplication stage of bulk jobs."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+        max_waiting: int = DEFAULT_MAX_WAITING,
+        max_done: int = DEFAULT_MAX_DONE,
+    ) -> None:
+        """Initialize the counters.
+
+        Args:
+            enabled: Set to False to look up every input, duplicates included.
+            lookahead: Inputs read at most before the stage hands control back to the job.
+            max_waiting: Duplicates parked until their lookup finishes; more are looked up on their own.
+            max_done: Finished results remembered; the least recently used is forgotten first.
+
+        """
+        self.enabled = enabled
+        self.lookahead = lookahead
+        self.max_waiting = max_waiting
+        self.max_done = max_done
+        self.total = 0
+        self.unique = 0
+
+    @property
+    def duplicates(self) -> int:
+        """Return the number of inputs answered from another input's lookup.
+
+        Returns:
+            The number of duplicate inputs.
+
+        """
+        return self.total - self.unique
+
+    @property
+    def duplicate_ratio(self) -> float:
+        """Return the share of inputs that were duplicates.
+
+        Returns:
+            A ratio from 0 to 1, or 0 before any input was seen.
+
+        """
+        return self.duplicates / self.total if self.total else float(0)
+
+
+@dataclass(frozen=True, slots=True)
+class _Lookup:
+    """One lookup sent by the stage.
+
+    Attributes:
+        key: Normalized key whose waiting positions share the result, or None for this input only.
+        index: Position of the input in the job.
+        query: The input to look up.
+
+    """
+
+    key: Hashable | None
+    index: int
+    query: Any
+
+    def send(self, func: Callable[[Any], Any]) -> Any:
+        """Send the lookup.
+
+        Args:
+            func: Blocking callable applied to each unique query.
+
+        Returns:
+            The result of func, or None for the placeholder that sends nothing.
+
+        """
+        return None if self is _NO_LOOKUP else func(self.query)
+
+    async def asend(self, func: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Send the lookup on the event loop.
+
+        Args:
+            func: Coroutine function applied to each unique query.
+
+        Returns:
+            The result of func, or None for the placeholder that sends nothing.
+
+        """
+        return None if self is _NO_LOOKUP else await func(self.query)
+
+
+# Placeholder handed to the job when the inputs read so far need no lookup
+_NO_LOOKUP = _Lookup(None, -1, None)
+
+
+class _DedupStage:
+    """Send each unique input of one job once and fan the results out."""
+
+    def __init__(self, key: Callable[[Any], Hashable], deduplication: Deduplication) -> None:
+        """Initialize an empty stage.
+
+        Args:
+            key: Returns the normalized key of an input.
+            deduplication: Settings, and counters updated while the inputs are read.
+
+        """
+        self._key = key
+        self._deduplication = deduplication
+        # Positions waiting for the in-flight lookup of their key
+        self._waiting: dict[Hashable, _Positions] = {}
+        self._parked = 0
+        self._done: OrderedDict[Hashable, BulkResult] = OrderedDict()
+        self._ready: list[BulkResult] = []
+
+    def lookups(self, queries: Iterable[Any]) -> Iterator[_Lookup]:
+        """Yield the lookups to send, reading a bounded number of inputs per step.
+
+        Duplicates are parked or answered from a finished lookup. When
+        lookahead inputs in a row needed no lookup, a placeholder is yielded
+        so the job can hand out the answered duplicates before reading on.
+
+        Args:
+            queries: Input queries, consumed lazily.
+
+        Yields:
+            The lookups to send, or the placeholder when there is nothing to send yet.
+
+        """
+        unsent = 0
+        for index, query in enumerate(queries):
+            self._deduplication.total += 1
+            lookup = self._read(index, query)
+            if lookup is not None:
+                unsent = 0
+                yield lookup
+                continue
+            unsent += 1
+            if unsent >= self._deduplication.lookahead:
+                unsent = 0
+                yield _NO_LOOKUP
+
+    def fan_out(self, bulk_result: BulkResult) -> list[BulkResult]:
+        """Copy the result of a lookup to every input that shares its key.
+
+        Args:
+            bulk_result: The outcome of one lookup; its query is the _Lookup.
+
+        Returns:
+            One result per position answered by the lookup, then the results
+            of duplicates read since the previous call.
+
+        """
+        lookup: _Lookup = bulk_result.query
+        if lookup is _NO_LOOKUP:
+            return self.flush()
+        if lookup.key is None:
+            positions = [(lookup.index, lookup.query)]
+        else:
+            self._remember(lookup.key, bulk_result)
+            positions = self._waiting.pop(lookup.key)
+            self._parked -= len(positions) - 1
+        fanned = [
+            BulkResult(index, query, bulk_result.response, bulk_result.error)
+            for index, query in positions
+        ]
+        return fanned + self.flush()
+
+    def flush(self) -> list[BulkResult]:
+        """Return the results of duplicates whose lookup had already finished.
+
+        Returns:
+            The results waiting to be yielded.
+
+        """
+        ready = self._ready
+        self._ready = []
+        return ready
+
+    async def afan_out(self, outcomes: AsyncIterator[BulkResult]) -> AsyncIterator[BulkResult]:
+        """Fan the results of the stage's lookups out to every input.
+
+        Args:
+            outcomes: The results of the lookups.
+
+        Yields:
+            A BulkResult per input.
+
+        """
+        async for bulk_result in outcomes:
+            for fanned in self.fan_out(bulk_result):
+                yield fanned
+        for duplicate in self.flush():
+            yield duplicate
+
+    def _read(self, index: int, query: Any) -> _Lookup | None:
+        """Take in one input.
+
+        Args:
+            index: Position of the input in the job.
+            query: The input.
+
+        Returns:
+            The lookup to send for the input, or None if it is answered by another lookup.
+
+        """
+        try:
+            query_key = self._key(query)
+        except Exception:
+            # A malformed input is sent on its own, so its lookup reports the error on its result
+            self._deduplication.unique += 1
+            return _Lookup(None, index, query)
+        done = self._done.get(query_key)
+        if done is not None:
+            self._done.move_to_end(query_key)
+            self._ready.append(BulkResult(index, query, done.response, done.error))
+            return None
+        positions = self._waiting.get(query_key)
+        if positions is None:
+            self._waiting[query_key] = [(index, query)]
+            self._deduplication.unique += 1
+            return _Lookup(query_key, index, query)
+        if self._parked >= self._deduplication.max_waiting:
+            # Too many parked duplicates; this one is sent on its own
+            self._deduplication.unique += 1
+            return _Lookup(None, index, query)
+        positions.append((index, query))
+        self._parked += 1
+        return None
+
+    def _remember(self, query_key: Hashable, bulk_result: BulkResult) -> None:
+        """Keep a finished result for later duplicates, forgetting the least recently used.
+
+        Failed lookups are not kept, so later duplicates are looked up again.
+
+        Args:
+            query_key: The normalized key of the lookup.
+            bulk_result: The result of the lookup.
+
+        """
+        if self._deduplication.max_done <= 0 or bulk_result.error is not None:
+            return
+        self._done[query_key] = bulk_result
+        if len(self._done) > self._deduplication.max_done:
+            self._done.popitem(last=False)
+
+
+def run_deduplicated(
+    func: Callable[[Any], Any],
+    queries: Iterable[Any],
+    concurrency: int,
+    key: Callable[[Any], Hashable],
+    deduplication: Deduplication | None = None,
+) -> Iterator[BulkResult]:
+    """Run func once per unique query in threads, yielding a result per query.
+
+    Args:
+        func: Blocking callable applied to each unique query.
+        queries: Input queries, consumed lazily.
+        concurrency: Maximum number of calls in flight.
+        key: Returns the normalized key of a query.
+        deduplication: Settings and counters; a fresh Deduplication() if omitted.
+
+    Yields:
+        A BulkResult per query with its own index, in completion order.
+
+    """
+    counters = Deduplication() if deduplication is None else deduplication
+    if not counters.enabled:
+        yield from run_bounded(func, queries, concurrency)
+        return
+    stage = _DedupStage(key, counters)
+    lookups = stage.lookups(queries)
+    outcomes = run_bounded(lambda lookup: lookup.send(func), lookups, concurrency)
+    for bulk_result in outcomes:
+        yield from stage.fan_out(bulk_result)
+    yield from stage.flush()
+
+
+def arun_deduplicated(
+    func: Callable[[Any], Awaitable[Any]],
+    queries: Iterable[Any],
+    concurrency: int,
+    key: Callable[[Any], Hashable],
+    deduplication: Deduplication | None = None,
+) -> AsyncIterator[BulkResult]:
+    """Run func once per unique query as tasks, yielding a result per query.
+
+    Args:
+        func: Coroutine function applied to each unique query.
+        queries: Input queries, consumed lazily.
+        concurrency: Maximum number of calls in flight.
+        key: Returns the normalized key of a query.
+        deduplication: Settings and counters; a fresh Deduplication() if omitted.
+
+    Returns:
+        An async iterator of BulkResult per query with its own index, in completion order.
+
+    """
+    counters = Deduplication() if deduplication is None else deduplication
+    if not counters.enabled:
+        return arun_bounded(func, queries, concurrency)
+    stage = _DedupStage(key, counters)
+    lookups = stage.lookups(queries)
+    outcomes = arun_bounded(lambda lookup: lookup.asend(func), lookups, concurrency)
+    return stage.afan_out(outcomes)
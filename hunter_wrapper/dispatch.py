@@ -0,0 +1,358 @@
+"""Priority dispatch of rate-limited requests.
+
+Interactive lookups and bulk jobs that share one API key also share its
+rate limits. The dispatcher queues callers per priority class and hands
+out each endpoint's rate-limit tokens by weighted fair sharing, so
+waiting interactive calls get most of the tokens and batch calls soak up
+the rest. The class of a call comes from the Priority context it runs in.
+"""
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar, Token
+from types import MappingProxyType, TracebackType
+from typing import Any, Self
+
+from hunter_wrapper.ratelimit import DEFAULT_RATES, RateLimiter
+
+INTERACTIVE = 'interactive'
+BATCH = 'batch'
+
+# Share of the tokens each class gets while both are waiting
+DEFAULT_WEIGHTS = MappingProxyType({
+    INTERACTIVE: 8.0,
+    BATCH: 1.0,
+})
+
+# Delay before polling again when a token came back between two checks
+_RECHECK_DELAY = 0.001
+
+_priority_class: ContextVar[str] = ContextVar('hunter_priority_class', default=INTERACTIVE)
+
+
+class Priority:
+    """Context manager running the calls made inside it in a priority class."""
+
+    def __init__(self, class_name: str) -> None:
+        """Initialize the context.
+
+        Args:
+            class_name: The priority class, e.g. 'interactive' or 'batch'.
+
+        """
+        self.class_name = class_name
+        self._token: Token | None = None
+
+    def __enter__(self) -> Self:
+        """Switch to the priority class.
+
+        Returns:
+            The context itself.
+
+        """
+        self._token = _priority_class.set(self.class_name)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Restore the enclosing priority class.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        if self._token is not None:
+            _priority_class.reset(self._token)
+            self._token = None
+
+
+def call_in_class(class_name: str, func: Callable[[Any], Any], query: Any) -> Any:
+    """Run a blocking lookup in a priority class.
+
+    Args:
+        class_name: The priority class.
+        func: The lookup.
+        query: The input of the lookup.
+
+    Returns:
+        The lookup result.
+
+    """
+    with Priority(class_name):
+        return func(query)
+
+
+async def acall_in_class(class_name: str, func: Callable[[Any], Awaitable[Any]], query: Any) -> Any:
+    """Run a coroutine lookup in a priority class.
+
+    Args:
+        class_name: The priority class.
+        func: The lookup.
+        query: The input of the lookup.
+
+    Returns:
+        The lookup result.
+
+    """
+    with Priority(class_name):
+        return await func(query)
+
+
+@dataclasses.dataclass
+class ClassMetrics:
+    """Counters describing the queue of a priority class.
+
+    Attributes:
+        queued: Number of calls waiting right now.
+        max_queued: Largest number of calls waiting at once.
+        granted: Number of calls that were handed a token.
+        rejected: Number of calls that gave up because of their deadline.
+        total_wait: Seconds granted calls waited in the queue, summed.
+        max_wait: Longest single wait in seconds.
+
+    """
+
+    queued: int = 0
+    max_queued: int = 0
+    granted: int = 0
+    rejected: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+
+
+@dataclasses.dataclass(slots=True, eq=False)
+class _Ticket:
+    """A call waiting for a rate-limit token."""
+
+    endpoint: str
+    class_name: str
+    enqueued_at: float
+    granted: bool = False
+
+
+class _ClassQueues:
+    """Tickets waiting for one endpoint, per class, served by weighted fair queueing."""
+
+    def __init__(self, weights: Mapping[str, float]) -> None:
+        """Initialize empty queues.
+
+        Args:
+            weights: Share of the tokens per class; unknown classes weigh 1.
+
+        """
+        self._weights = weights
+        self._queues: dict[str, deque[_Ticket]] = {}
+        # Virtual time at which each class was last served
+        self._tags: dict[str, float] = {}
+        self._virtual_time = float(0)
+
+    def push(self, ticket: _Ticket) -> None:
+        """Queue a ticket behind the others of its class.
+
+        Args:
+            ticket: The waiting call.
+
+        """
+        queue = self._queues.setdefault(ticket.class_name, deque())
+        if not queue:
+            # A class that was idle does not bank the share it did not use
+            last_served = self._tags.get(ticket.class_name, 0)
+            self._tags[ticket.class_name] = max(last_served, self._virtual_time)
+        queue.append(ticket)
+
+    def remove(self, ticket: _Ticket) -> None:
+        """Drop a ticket that gave up waiting.
+
+        Args:
+            ticket: The waiting call.
+
+        """
+        self._queues[ticket.class_name].remove(ticket)
+
+    def pop(self) -> _Ticket | None:
+        """Take the next ticket to serve.
+
+        Returns:
+            The head of the waiting class with the smallest finish tag, or None if nothing waits.
+
+        """
+        waiting = [class_name for class_name, queue in self._queues.items() if queue]
+        if not waiting:
+            return None
+        chosen = min(waiting, key=self._finish_tag)
+        self._virtual_time = self._tags[chosen]
+        self._tags[chosen] = self._finish_tag(chosen)
+        return self._queues[chosen].popleft()
+
+    def _finish_tag(self, class_name: str) -> float:
+        """Return the virtual time at which serving a class again would finish.
+
+        Args:
+            class_name: A waiting class.
+
+        Returns:
+            The class tag advanced by the inverse of its weight.
+
+        """
+        return self._tags[class_name] + 1 / self._weights.get(class_name, 1)
+
+
+class PriorityDispatcher(RateLimiter):
+    """Rate limiter sharing the tokens of each endpoint between priority classes.
+
+    Endpoints without a rate are not queued.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float] = DEFAULT_RATES,
+        weights: Mapping[str, float] = DEFAULT_WEIGHTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize one bucket per endpoint and empty queues.
+
+        Args:
+            rates: Requests per second allowed, per endpoint name.
+            weights: Share of the tokens per priority class while several classes wait.
+            clock: Monotonic time source of the buckets.
+
+        """
+        super().__init__(rates, clock)
+        self.weights = dict(weights)
+        self._queues: dict[str, _ClassQueues] = {}
+        self._metrics: dict[str, ClassMetrics] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint: str, timeout: float | None = None) -> bool:
+        """Block until the call's class is handed a token for endpoint.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-finder'.
+            timeout: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            True once the request may be sent, False if the wait would exceed timeout.
+
+        """
+        ticket = self._enqueue(endpoint)
+        deadline_at = None if timeout is None else time.monotonic() + timeout
+        while ticket is not None:
+            wait = self._poll(ticket, deadline_at)
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            time.sleep(wait)
+        return True
+
+    async def aacquire(self, endpoint: str, timeout: float | None = None) -> bool:
+        """Wait on the event loop until the call's class is handed a token for endpoint.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-finder'.
+            timeout: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            True once the request may be sent, False if the wait would exceed timeout.
+
+        """
+        ticket = self._enqueue(endpoint)
+        deadline_at = None if timeout is None else time.monotonic() + timeout
+        while ticket is not None:
+            wait = self._poll(ticket, deadline_at)
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            await asyncio.sleep(wait)
+        return True
+
+    def class_metrics(self) -> dict[str, ClassMetrics]:
+        """Return queue depth and wait-time metrics for every priority class.
+
+        Returns:
+            A snapshot of the counters, per class name.
+
+        """
+        with self._lock:
+            return {
+                class_name: dataclasses.replace(counters)
+                for class_name, counters in self._metrics.items()
+            }
+
+    def _enqueue(self, endpoint: str) -> _Ticket | None:
+        """Queue the running call in its priority class.
+
+        Args:
+            endpoint: The endpoint name.
+
+        Returns:
+            The ticket, or None if the endpoint is not rate limited.
+
+        """
+        if endpoint not in self.buckets:
+            return None
+        ticket = _Ticket(endpoint, _priority_class.get(), time.monotonic())
+        with self._lock:
+            self._queues.setdefault(endpoint, _ClassQueues(self.weights)).push(ticket)
+            counters = self._metrics.setdefault(ticket.class_name, ClassMetrics())
+            counters.queued += 1
+            counters.max_queued = max(counters.max_queued, counters.queued)
+        return ticket
+
+    def _poll(self, ticket: _Ticket, deadline_at: float | None) -> float | None:
+        """Hand out the available tokens and check whether the ticket got one.
+
+        Args:
+            ticket: The waiting call.
+            deadline_at: Monotonic time after which the call gives up, or None.
+
+        Returns:
+            0 once granted, the seconds until the next token otherwise, or
+            None if the call gave up because that is past its deadline.
+
+        """
+        bucket = self.buckets[ticket.endpoint]
+        with self._lock:
+            self._dispatch(ticket.endpoint)
+            if ticket.granted:
+                return 0
+            wait = bucket.wait_time()
+            if deadline_at is not None and time.monotonic() + wait > deadline_at:
+                self._queues[ticket.endpoint].remove(ticket)
+                counters = self._metrics[ticket.class_name]
+                counters.queued -= 1
+                counters.rejected += 1
+                return None
+            return wait or _RECHECK_DELAY
+
+    def _dispatch(self, endpoint: str) -> None:
+        """Grant every available token of endpoint to the next waiting tickets.
+
+        Args:
+            endpoint: The endpoint name.
+
+        """
+        bucket = self.buckets[endpoint]
+        while not bucket.wait_time():
+            ticket = self._queues[endpoint].pop()
+            if ticket is None:
+                return
+            bucket.reserve()
+            ticket.granted = True
+            waited = time.monotonic() - ticket.enqueued_at
+            counters = self._metrics[ticket.class_name]
+            counters.queued -= 1
+            counters.granted += 1
+            counters.total_wait += waited
+            counters.max_wait = max(counters.max_wait, waited)
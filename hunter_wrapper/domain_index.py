@@ -0,0 +1,176 @@
+"""Local index of webmail and disposable email domains.
+
+Lookups that can only waste credits are answered without a request:
+email finder lookups on webmail or disposable domains are refused, and
+addresses at disposable domains get a local verifier result. The index
+starts from the lists bundled with the package and learns from the
+disposable/webmail flags of domain_search responses.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from importlib import resources
+from typing import Self
+
+from hunter_wrapper.exceptions import HunterSkippedDomainError
+from hunter_wrapper.validation import EmailCheck
+
+DISPOSABLE = 'disposable'
+WEBMAIL = 'webmail'
+
+
+def _bundled_domains(file_name: str) -> Iterable[str]:
+    """Read a domain list shipped with the package.
+
+    Args:
+        file_name: Name of a file in the hunter_wrapper/data directory.
+
+    Returns:
+        The domains of the file, skipping blank and comment lines.
+
+    """
+    text = resources.files('hunter_wrapper').joinpath('data', file_name).read_text(encoding='utf-8')
+    stripped = (line.strip() for line in text.splitlines())
+    return [line for line in stripped if line and not line.startswith('#')]
+
+
+class DomainIndex:
+    """Classify domains as webmail or disposable, including their subdomains."""
+
+    def __init__(
+        self,
+        disposable: Iterable[str] = (),
+        webmail: Iterable[str] = (),
+        learn: bool = True,
+        maxsize: int = 10000,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            disposable: Known disposable email domains.
+            webmail: Known webmail domains.
+            learn: Whether observe() updates the index from domain_search data.
+            maxsize: Maximum number of learned domains kept; the least recently observed go first.
+
+        """
+        self.learn = learn
+        self.maxsize = maxsize
+        self._disposable = frozenset(domain.lower() for domain in disposable)
+        self._webmail = frozenset(domain.lower() for domain in webmail)
+        # Observed categories that differ from the lists and take precedence; '' means neither
+        self._learned: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of learned domains.
+
+        Returns:
+            The number of domains whose observed category overrides the lists.
+
+        """
+        return len(self._learned)
+
+    @classmethod
+    def bundled(cls, learn: bool = True, maxsize: int = 10000) -> Self:
+        """Create an index from the domain lists shipped with the package.
+
+        Args:
+            learn: Whether observe() updates the index from domain_search data.
+            maxsize: Maximum number of learned domains kept.
+
+        Returns:
+            The index.
+
+        """
+        return cls(
+            disposable=_bundled_domains('disposable_domains.txt'),
+            webmail=_bundled_domains('webmail_domains.txt'),
+            learn=learn,
+            maxsize=maxsize,
+        )
+
+    def classify(self, domain: str) -> str | None:
+        """Return the category of a domain or of its closest listed parent.
+
+        Args:
+            domain: The domain to classify, e.g. 'eu.mailinator.com'.
+
+        Returns:
+            'disposable', 'webmail' or None.
+
+        """
+        labels = domain.strip().rstrip('.').lower().split('.')
+        for start in range(len(labels) - 1):
+            suffix = '.'.join(labels[start:])
+            learned = self._learned.get(suffix)
+            if learned is not None:
+                return learned or None
+            if suffix in self._disposable:
+                return DISPOSABLE
+            if suffix in self._webmail:
+                return WEBMAIL
+        return None
+
+    def observe(self, response_data: dict) -> None:
+        """Record the disposable/webmail flags of a domain search.
+
+        Only flags that change the classification are kept, so plain
+        company domains do not grow the index.
+
+        Args:
+            response_data: The dict returned by domain_search.
+
+        """
+        domain = response_data.get('domain')
+        if not (self.learn and domain):
+            return
+        category = ''
+        if response_data.get(DISPOSABLE):
+            category = DISPOSABLE
+        elif response_data.get(WEBMAIL):
+            category = WEBMAIL
+        domain = domain.lower()
+        with self._lock:
+            self._learned.pop(domain, None)
+            if category == (self.classify(domain) or ''):
+                return
+            self._learned[domain] = category
+            while len(self._learned) > self.maxsize:
+                self._learned.popitem(last=False)
+
+    def screen(self, check: EmailCheck) -> EmailCheck:
+        """Mark an address at a disposable domain to be answered locally.
+
+        Addresses at webmail domains are still sent: they may belong to a
+        real person and only the verifier can tell.
+
+        Args:
+            check: The outcome of the syntax check.
+
+        Returns:
+            The check, or a 'disposable' check for addresses at disposable domains.
+
+        """
+        if not check.valid:
+            return check
+        domain = check.email.rpartition('@')[2]
+        if self.classify(domain) != DISPOSABLE:
+            return check
+        return EmailCheck(check.email, 'disposable domain', DISPOSABLE)
+
+    def screen_domain(self, domain: str | None) -> None:
+        """Refuse email finder lookups on webmail and disposable domains.
+
+        Args:
+            domain: The domain of the lookup, or None for a company lookup.
+
+        Raises:
+            HunterSkippedDomainError: If the domain is webmail or disposable.
+
+        """
+        category = self.classify(domain) if domain else None
+        if category is not None:
+            raise HunterSkippedDomainError(
+                'Skipped lookup on {0} domain {1}'.format(category, domain),
+            )
@@ -21,3 +21,69 @@ class MissingNameError(HunterAPIError):
 
 class MissingCompanyError(HunterAPIError):
     """Exception raised when a company is missing for email finding."""
+
+
+class HunterRateLimitError(HunterAPIError):
+    """Exception raised when the API answers with HTTP 429 Too Many Requests."""
+
+    def __init__(
+        self,
+        message: str = 'Hunter API rate limit exceeded',
+        retry_after: float | None = None,
+    ) -> None:
+        """Initialize the HunterRateLimitError.
+
+        Args:
+            message: The error message to display.
+            retry_after: Seconds to wait before retrying, from the Retry-After header.
+
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class HunterServerError(HunterAPIError):
+    """Exception raised when the API answers with an HTTP 5xx status code."""
+
+
+class HunterConnectionError(HunterAPIError):
+    """Exception raised when the API cannot be reached or the connection drops."""
+
+
+class HunterCircuitOpenError(HunterAPIError):
+    """Exception raised without a request while the endpoint's circuit is open."""
+
+    def __init__(
+        self,
+        message: str = 'Hunter API circuit is open',
+        retry_in: float = 0,
+    ) -> None:
+        """Initialize the HunterCircuitOpenError.
+
+        Args:
+            message: The error message to display.
+            retry_in: Seconds until the circuit lets a trial request through.
+
+        """
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
+class HunterTimeoutError(HunterConnectionError):
+    """Exception raised when connecting to or reading from the API timed out."""
+
+
+class HunterDeadlineExceededError(HunterAPIError):
+    """Exception raised when a call used up its time budget."""
+
+
+class HunterSkippedDomainError(HunterAPIError):
+    """Exception raised without a request for a known webmail or disposable domain."""
+
+
+class HunterCreditsExhaustedError(HunterAPIError):
+    """Exception raised without a request once the plan has no credits of a kind left."""
+
+
+class HunterNoKeysError(HunterAPIError):
+    """Exception raised without a request when no key of the key pool can be used."""
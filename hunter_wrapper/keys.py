@@ -0,0 +1,374 @@
+"""Pools of Hunter.io API keys.
+
+A client given a KeyPool sends every request with a key picked from the
+pool, either the least loaded one or in turn. Each key has its own rate
+limiter and credit counter. Keys the API rejects as invalid are removed,
+rate-limited keys sit out a cool-down, and their requests fail over to
+the other keys.
+"""
+
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import TypeVar
+
+import httpx
+import requests
+
+from hunter_wrapper.credits import CREDIT_KINDS, CreditScheduler
+from hunter_wrapper.deadline import remaining_time
+from hunter_wrapper.exceptions import (
+    HunterAPIError,
+    HunterCreditsExhaustedError,
+    HunterDeadlineExceededError,
+    HunterNoKeysError,
+    HunterRateLimitError,
+)
+from hunter_wrapper.ratelimit import RateLimiter
+
+LEAST_LOADED = 'least_loaded'
+ROUND_ROBIN = 'round_robin'
+
+# Errors that may tell that a key cannot be used now
+KEY_ERRORS = (HunterRateLimitError, HunterCreditsExhaustedError, requests.HTTPError, httpx.HTTPStatusError)
+
+# Errors a fetch of a key's account may fail with
+RECONCILE_ERRORS = (HunterAPIError, requests.HTTPError, httpx.HTTPStatusError)
+
+# Seconds a key answered with 429 and no Retry-After sits out
+DEFAULT_QUARANTINE = 60
+
+_LIMITS_EXCEEDED = 'Call deadline exceeded while waiting for the key limits'
+_ALL_RATE_LIMITED = 'Every API key of the pool is rate limited'
+
+_Response = TypeVar('_Response')
+
+# Fetches the account data of the given API key
+FetchAccount = Callable[[str], dict]
+
+
+@dataclass(eq=False)
+class PooledKey:
+    """One API key of a pool with its own limits.
+
+    Attributes:
+        api_key: The API key.
+        rate_limiter: Per-endpoint rate limits of the key's plan.
+        credits: Credit counter and budgets of the key; counts nothing until reconciled from the key's account.
+        in_flight: Number of requests being sent with the key.
+        quarantined_until: Monotonic time before which the rate-limited key is not used.
+
+    """
+
+    api_key: str
+    rate_limiter: RateLimiter = field(default_factory=RateLimiter)
+    credits: CreditScheduler = field(default_factory=lambda: CreditScheduler(reconcile_every=None))
+    in_flight: int = 0
+    quarantined_until: float = 0
+
+
+def _is_invalid_key(error: Exception) -> bool:
+    """Tell whether an error means that the key can never be used again.
+
+    Args:
+        error: The error raised while sending with the key.
+
+    Returns:
+        True if the API rejected the key as invalid.
+
+    """
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def _raise_if_rejected(error: Exception) -> None:
+    """Re-raise an error of a failed account fetch if it rejects the key.
+
+    A failed reconciliation otherwise keeps the key's local count until the next one.
+
+    Args:
+        error: The error raised while fetching the key's account.
+
+    Raises:
+        error: If the key is invalid or rate limited.
+
+    """
+    if isinstance(error, HunterRateLimitError) or _is_invalid_key(error):
+        raise error
+
+
+def _send_within_limits(
+    key: PooledKey,
+    endpoint: str,
+    send: Callable[[str], _Response],
+    fetch_account: FetchAccount | None,
+) -> _Response:
+    """Reconcile the key's credits if due, wait for its limits, then send with the key.
+
+    Args:
+        key: The key to send with.
+        endpoint: The endpoint name.
+        send: Sends the request with the given API key.
+        fetch_account: Fetches the account of an API key; keys are not reconciled if None.
+
+    Returns:
+        The response of send.
+
+    Raises:
+        HunterDeadlineExceededError: If the budget ran out waiting for the key's limits.
+
+    """
+    if fetch_account is not None and key.credits.start_reconcile(endpoint):
+        try:
+            key.credits.reconcile(fetch_account(key.api_key))
+        except RECONCILE_ERRORS as error:
+            _raise_if_rejected(error)
+    if not key.rate_limiter.acquire(endpoint, timeout=remaining_time()):
+        raise HunterDeadlineExceededError(_LIMITS_EXCEEDED)
+    if not key.credits.acquire(endpoint):
+        raise HunterDeadlineExceededError(_LIMITS_EXCEEDED)
+    return send(key.api_key)
+
+
+async def _asend_within_limits(
+    key: PooledKey,
+    endpoint: str,
+    send: Callable[[str], Awaitable[_Response]],
+    fetch_account: Callable[[str], Awaitable[dict]] | None,
+) -> _Response:
+    """Reconcile the key's credits if due, wait on the event loop for its limits, then send.
+
+    Args:
+        key: The key to send with.
+        endpoint: The endpoint name.
+        send: Sends the request with the given API key.
+        fetch_account: Fetches the account of an API key; keys are not reconciled if None.
+
+    Returns:
+        The response of send.
+
+    Raises:
+        HunterDeadlineExceededError: If the budget ran out waiting for the key's limits.
+
+    """
+    if fetch_account is not None and key.credits.start_reconcile(endpoint):
+        try:
+            key.credits.reconcile(await fetch_account(key.api_key))
+        except RECONCILE_ERRORS as error:
+            _raise_if_rejected(error)
+    if not await key.rate_limiter.aacquire(endpoint, timeout=remaining_time()):
+        raise HunterDeadlineExceededError(_LIMITS_EXCEEDED)
+    if not await key.credits.aacquire(endpoint):
+        raise HunterDeadlineExceededError(_LIMITS_EXCEEDED)
+    return await send(key.api_key)
+
+
+def _load(endpoint: str, key: PooledKey) -> tuple[int, float]:
+    """Return how loaded a key is for a call to endpoint.
+
+    Args:
+        endpoint: The endpoint name.
+        key: The key.
+
+    Returns:
+        The requests in flight, then the wait for the key's next rate-limit token.
+
+    """
+    bucket = key.rate_limiter.buckets.get(endpoint)
+    return key.in_flight, bucket.wait_time() if bucket else 0
+
+
+class KeyPool:
+    """Thread-safe pool of API keys used in turn or by load."""
+
+    def __init__(
+        self,
+        keys: Iterable[str | PooledKey],
+        strategy: str = LEAST_LOADED,
+        quarantine: float = DEFAULT_QUARANTINE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            keys: API keys, or PooledKey entries with their own limits.
+            strategy: 'least_loaded' or 'round_robin'.
+            quarantine: Seconds a key answered with 429 sits out when the API gives no Retry-After.
+            clock: Monotonic time source.
+
+        Raises:
+            ValueError: If no key is given.
+
+        """
+        self.keys: list[PooledKey] = []
+        for key in keys:
+            self.keys.append(key if isinstance(key, PooledKey) else PooledKey(key))
+        if not self.keys:
+            raise ValueError('A key pool needs at least one API key')
+        # The key the client is identified with
+        self.primary_key = self.keys[0].api_key
+        self.strategy = strategy
+        self.quarantine = quarantine
+        self.clock = clock
+        # Reason each removed key was taken out of the pool, by API key
+        self.removed: dict[str, str] = {}
+        self._turn = 0
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        endpoint: str,
+        send: Callable[[str], _Response],
+        fetch_account: FetchAccount | None = None,
+    ) -> _Response:
+        """Send a request with a key of the pool, failing over when the key is rejected.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-finder'.
+            send: Sends the request with the given API key.
+            fetch_account: Fetches the account of an API key to reconcile the key's credits.
+
+        Returns:
+            The response of send.
+
+        """
+        # Each key is tried at most once per call; retries are left to the RetryPolicy
+        tried: set[PooledKey] = set()
+        while True:
+            key = self._checkout(endpoint, tried)
+            try:
+                return _send_within_limits(key, endpoint, send, fetch_account)
+            except KEY_ERRORS as error:
+                if not self._reject(key, error):
+                    raise
+            finally:
+                self._checkin(key)
+
+    async def acall(
+        self,
+        endpoint: str,
+        send: Callable[[str], Awaitable[_Response]],
+        fetch_account: Callable[[str], Awaitable[dict]] | None = None,
+    ) -> _Response:
+        """Send a request on the event loop with a key of the pool, failing over on rejection.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'email-finder'.
+            send: Sends the request with the given API key.
+            fetch_account: Fetches the account of an API key to reconcile the key's credits.
+
+        Returns:
+            The response of send.
+
+        """
+        tried: set[PooledKey] = set()
+        while True:
+            key = self._checkout(endpoint, tried)
+            try:
+                return await _asend_within_limits(key, endpoint, send, fetch_account)
+            except KEY_ERRORS as error:
+                if not self._reject(key, error):
+                    raise
+            finally:
+                self._checkin(key)
+
+    def _checkout(self, endpoint: str, tried: set[PooledKey]) -> PooledKey:
+        """Pick the key for a request and count it as in flight.
+
+        Keys known to have no credits of the endpoint's kind left, keys
+        sitting out a rate-limit cool-down and keys already tried by the call
+        are skipped.
+
+        Args:
+            endpoint: The endpoint name.
+            tried: Keys the call already sent with; the picked key is added.
+
+        Returns:
+            The key to send with.
+
+        Raises:
+            HunterNoKeysError: If no key of the pool can be used.
+            HunterRateLimitError: If the keys left are rate limited; retry_after tells when one is back.
+
+        """
+        with self._lock:
+            now = self.clock()
+            with_credits = self._usable(endpoint)
+            usable = [key for key in with_credits if key.quarantined_until <= now and key not in tried]
+            resting = [key.quarantined_until - now for key in with_credits if key.quarantined_until > now]
+            if resting and not usable:
+                raise HunterRateLimitError(_ALL_RATE_LIMITED, retry_after=min(resting))
+            if not usable:
+                raise HunterNoKeysError('No API key of the pool can be used: {0}'.format(self.removed))
+            if self.strategy == ROUND_ROBIN:
+                key = usable[self._turn % len(usable)]
+                self._turn += 1
+            else:
+                key = min(usable, key=lambda candidate: _load(endpoint, candidate))
+            key.in_flight += 1
+            tried.add(key)
+            return key
+
+    def _usable(self, endpoint: str) -> list[PooledKey]:
+        """Return the keys not known to have run out of credits for endpoint.
+
+        A key that ran out is tried again once its next reconciliation is due.
+
+        Args:
+            endpoint: The endpoint name.
+
+        Returns:
+            The keys in pool order.
+
+        """
+        kind = CREDIT_KINDS.get(endpoint, '')
+        usable = []
+        for key in self.keys:
+            credits_left = key.credits.remaining.get(kind, 1)
+            if credits_left > 0 or key.credits.reconcile_due():
+                usable.append(key)
+        return usable
+
+    def _checkin(self, key: PooledKey) -> None:
+        """Count a request of the key as finished.
+
+        Args:
+            key: The key the request was sent with.
+
+        """
+        with self._lock:
+            key.in_flight -= 1
+
+    def _reject(self, key: PooledKey, error: Exception) -> bool:
+        """Take a key out of use if the error tells that it cannot be used now.
+
+        An invalid key is removed for good; a rate-limited key sits out the
+        Retry-After delay, or the pool's quarantine without a positive one; a
+        key out of credits is skipped until its next reconciliation.
+
+        Args:
+            key: The key the request was sent with.
+            error: The error raised by the request.
+
+        Returns:
+            True if the key was rejected and the request should use another key.
+
+        """
+        if isinstance(error, HunterCreditsExhaustedError):
+            # The key's reconciled count is spent; it is skipped until the next reconciliation
+            return True
+        with self._lock:
+            if isinstance(error, HunterRateLimitError):
+                # Retry-After: 0 or a past date would put the key straight back in use
+                retry_after = error.retry_after or 0
+                cooldown = retry_after if retry_after > 0 else self.quarantine
+                key.quarantined_until = max(key.quarantined_until, self.clock() + cooldown)
+                return True
+            if not _is_invalid_key(error):
+                return False
+            if key in self.keys:
+                self.keys.remove(key)
+                self.removed[key.api_key] = 'invalid API key'
+        return True
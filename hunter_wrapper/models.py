@@ -0,0 +1,304 @@
+"""Compact typed result models for the Hunter.io API endpoints.
+
+The models use __slots__ and intern their enum-like string fields, so
+millions of results share one copy of each status or category string.
+Rarely used nested data such as sources is kept as plain tuples of field
+values and only turned into objects when it is accessed.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Self
+
+
+def _intern(text: str | None) -> str | None:
+    """Intern an enum-like string field.
+
+    Args:
+        text: The field as decoded from the response.
+
+    Returns:
+        The interned string, or None.
+
+    """
+    return None if text is None else sys.intern(text)
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """A web page on which an email address was found.
+
+    Attributes:
+        domain: Domain of the page.
+        uri: Address of the page.
+        extracted_on: Date the address was first seen on the page.
+        last_seen_on: Date the address was last seen on the page.
+        still_on_page: Whether the address is still on the page.
+
+    """
+
+    domain: str | None
+    uri: str | None
+    extracted_on: str | None = None
+    last_seen_on: str | None = None
+    still_on_page: bool | None = None
+
+    @classmethod
+    def from_dict(cls, source: dict) -> Self:
+        """Build a source from its API representation.
+
+        Args:
+            source: One entry of a 'sources' list.
+
+        Returns:
+            The source.
+
+        """
+        return cls(*cls.pack([source])[0])
+
+    @classmethod
+    def pack(cls, sources: list[dict] | None) -> tuple[tuple, ...]:
+        """Keep the entries of a 'sources' list as tuples of field values.
+
+        Args:
+            sources: The 'sources' list as received, or None.
+
+        Returns:
+            One tuple of field values per source, in declaration order.
+
+        """
+        return tuple(
+            (
+                _intern(source.get('domain')),
+                source.get('uri'),
+                source.get('extracted_on'),
+                source.get('last_seen_on'),
+                source.get('still_on_page'),
+            )
+            for source in sources or ()
+        )
+
+
+class _LazySources:
+    """Give a model lazy access to the sources it was found on."""
+
+    __slots__ = ()
+
+    source_fields: tuple[tuple, ...]
+
+    @property
+    def sources(self) -> tuple[Source, ...]:
+        """Return the sources, built from their field values on access.
+
+        Returns:
+            The sources of the result.
+
+        """
+        return tuple(Source(*fields) for fields in self.source_fields)
+
+
+@dataclass(frozen=True, slots=True)
+class EmailRecord(_LazySources):
+    """An email address found by a domain search.
+
+    Attributes:
+        email: The email address.
+        email_type: 'personal' or 'generic'.
+        confidence: Confidence score from 0 to 100.
+        first_name: First name of the owner.
+        last_name: Last name of the owner.
+        position: Job title of the owner.
+        seniority: Seniority level of the owner.
+        department: Department of the owner.
+        verification_status: Status of the last verification, if any.
+        source_fields: The field values of each source; see sources.
+
+    """
+
+    email: str
+    email_type: str | None = None
+    confidence: int | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    position: str | None = None
+    seniority: str | None = None
+    department: str | None = None
+    verification_status: str | None = None
+    source_fields: tuple[tuple, ...] = ()
+
+    @classmethod
+    def from_dict(cls, record: dict) -> Self:
+        """Build an email record from its API representation.
+
+        Args:
+            record: One entry of the domain search 'emails' list.
+
+        Returns:
+            The email record.
+
+        """
+        verification = record.get('verification') or {}
+        return cls(
+            email=record['value'],
+            email_type=_intern(record.get('type')),
+            confidence=record.get('confidence'),
+            first_name=record.get('first_name'),
+            last_name=record.get('last_name'),
+            position=record.get('position'),
+            seniority=_intern(record.get('seniority')),
+            department=_intern(record.get('department')),
+            verification_status=_intern(verification.get('status')),
+            source_fields=Source.pack(record.get('sources')),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationResult(_LazySources):
+    """Outcome of an email verification.
+
+    Attributes:
+        email: The verified email address.
+        status: 'valid', 'invalid', 'accept_all', 'webmail', 'disposable' or 'unknown'.
+        deliverability: The API 'result' field: 'deliverable', 'undeliverable' or 'risky'.
+        score: Deliverability score from 0 to 100.
+        disposable: Whether the domain is a disposable email provider.
+        webmail: Whether the domain is a webmail provider.
+        accept_all: Whether the server accepts all addresses.
+        mx_records: Whether the domain has MX records.
+        smtp_check: Whether the address passed the SMTP check.
+        source_fields: The field values of each source; see sources.
+
+    """
+
+    email: str
+    status: str | None = None
+    deliverability: str | None = None
+    score: int | None = None
+    disposable: bool | None = None
+    webmail: bool | None = None
+    accept_all: bool | None = None
+    mx_records: bool | None = None
+    smtp_check: bool | None = None
+    source_fields: tuple[tuple, ...] = ()
+
+    @classmethod
+    def from_dict(cls, response_data: dict) -> Self:
+        """Build a verification result from email_verifier data.
+
+        Args:
+            response_data: The dict returned by email_verifier.
+
+        Returns:
+            The verification result.
+
+        """
+        return cls(
+            email=response_data['email'],
+            status=_intern(response_data.get('status')),
+            deliverability=_intern(response_data.get('result')),
+            score=response_data.get('score'),
+            disposable=response_data.get('disposable'),
+            webmail=response_data.get('webmail'),
+            accept_all=response_data.get('accept_all'),
+            mx_records=response_data.get('mx_records'),
+            smtp_check=response_data.get('smtp_check'),
+            source_fields=Source.pack(response_data.get('sources')),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DomainSearchResult:
+    """Outcome of a domain search.
+
+    Attributes:
+        domain: The searched domain.
+        organization: Name of the organization owning the domain.
+        pattern: Most common email pattern of the domain, e.g. '{first}.{last}'.
+        disposable: Whether the domain is a disposable email provider.
+        webmail: Whether the domain is a webmail provider.
+        accept_all: Whether the server accepts all addresses.
+        emails: The email addresses found.
+
+    """
+
+    domain: str | None
+    organization: str | None = None
+    pattern: str | None = None
+    disposable: bool | None = None
+    webmail: bool | None = None
+    accept_all: bool | None = None
+    emails: tuple[EmailRecord, ...] = ()
+
+    @classmethod
+    def from_dict(cls, response_data: dict) -> Self:
+        """Build a domain search result from domain_search data.
+
+        Args:
+            response_data: The dict returned by domain_search.
+
+        Returns:
+            The domain search result.
+
+        """
+        records = response_data.get('emails') or ()
+        return cls(
+            domain=_intern(response_data.get('domain')),
+            organization=response_data.get('organization'),
+            pattern=_intern(response_data.get('pattern')),
+            disposable=response_data.get('disposable'),
+            webmail=response_data.get('webmail'),
+            accept_all=response_data.get('accept_all'),
+            emails=tuple(EmailRecord.from_dict(record) for record in records),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FinderResult(_LazySources):
+    """Outcome of an email finder lookup.
+
+    Attributes:
+        email: The email address found, or None.
+        score: Confidence score from 0 to 100.
+        domain: Domain of the company.
+        first_name: First name of the person.
+        last_name: Last name of the person.
+        position: Job title of the person.
+        company: Name of the company.
+        verification_status: Status of the last verification, if any.
+        source_fields: The field values of each source; see sources.
+
+    """
+
+    email: str | None
+    score: int | None = None
+    domain: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    position: str | None = None
+    company: str | None = None
+    verification_status: str | None = None
+    source_fields: tuple[tuple, ...] = ()
+
+    @classmethod
+    def from_dict(cls, response_data: dict) -> Self:
+        """Build a finder result from email finder data.
+
+        Args:
+            response_data: The 'data' member of an email finder response.
+
+        Returns:
+            The finder result.
+
+        """
+        verification = response_data.get('verification') or {}
+        return cls(
+            email=response_data.get('email'),
+            score=response_data.get('score'),
+            domain=_intern(response_data.get('domain')),
+            first_name=response_data.get('first_name'),
+            last_name=response_data.get('last_name'),
+            position=response_data.get('position'),
+            company=response_data.get('company'),
+            verification_status=_intern(verification.get('status')),
+            source_fields=Source.pack(response_data.get('sources')),
+        )
@@ -0,0 +1,155 @@
+"""Name normalization for email finder lookups.
+
+Names are case-folded, transliterated to ASCII with precompiled
+translation tables and stripped of accents and stray punctuation, and full
+names are split into first and last name. Equivalent spellings such as
+'José Núñez' and 'jose nunez' then share one cache entry and one request.
+"""
+
+import unicodedata
+
+# Precompiled in one table: letters that Unicode decomposition does not
+# reduce to ASCII, Cyrillic, and punctuation variants
+_TRANSLITERATION = str.maketrans({
+    'æ': 'ae',
+    'œ': 'oe',
+    'ø': 'o',
+    'đ': 'd',
+    'ð': 'd',
+    'þ': 'th',
+    'ł': 'l',
+    'ı': 'i',
+    'ħ': 'h',
+    'ŋ': 'ng',
+    'ŧ': 't',
+    'а': 'a',
+    'б': 'b',
+    'в': 'v',
+    'г': 'g',
+    'д': 'd',
+    'е': 'e',
+    'ё': 'e',
+    'ж': 'zh',
+    'з': 'z',
+    'и': 'i',
+    'й': 'y',
+    'к': 'k',
+    'л': 'l',
+    'м': 'm',
+    'н': 'n',
+    'о': 'o',
+    'п': 'p',
+    'р': 'r',
+    'с': 's',
+    'т': 't',
+    'у': 'u',
+    'ф': 'f',
+    'х': 'kh',
+    'ц': 'ts',
+    'ч': 'ch',
+    'ш': 'sh',
+    'щ': 'shch',
+    'ъ': '',
+    'ы': 'y',
+    'ь': '',
+    'э': 'e',
+    'ю': 'yu',
+    'я': 'ya',
+    'і': 'i',
+    'ї': 'yi',
+    'є': 'ye',
+    'ґ': 'g',
+    '’': "'",
+    '‘': "'",
+    'ʼ': "'",
+    '`': "'",
+    '‐': '-',
+    '‑': '-',
+    '–': '-',
+    '—': '-',
+    '.': ' ',
+    ',': ' ',
+    '_': ' ',
+})
+# Combining diacritical marks left over after NFKD decomposition
+COMBINING_MARKS_START = 0x300
+COMBINING_MARKS_END = 0x370
+_STRIP_MARKS = str.maketrans(dict.fromkeys(range(COMBINING_MARKS_START, COMBINING_MARKS_END)))
+
+# Lowercase words that start a multi-word last name, e.g. 'van der Berg'
+NAME_PARTICLES = frozenset(
+    'al bin da das de del della der di dos du el la le st ten ter van von'.split(),
+)
+
+
+def normalize_name(name: str) -> str:
+    """Fold a name to its lowercase ASCII form.
+
+    Args:
+        name: A first, last or full name.
+
+    Returns:
+        The name case-folded, transliterated, without accents and with single spaces.
+
+    """
+    folded = name.casefold()
+    if not folded.isascii():
+        folded = unicodedata.normalize('NFKD', folded.translate(_TRANSLITERATION)).translate(_STRIP_MARKS)
+    return ' '.join(folded.translate(_TRANSLITERATION).split())
+
+
+def split_full_name(full_name: str) -> tuple[str, str] | None:
+    """Split a full name into normalized first and last name.
+
+    'Last, First' is understood, middle names are dropped and a name
+    particle keeps the rest of the name together as the last name.
+
+    Args:
+        full_name: The full name, e.g. 'Ludwig van Beethoven' or 'Collison, Patrick'.
+
+    Returns:
+        The first and last name, or None if the name has a single word.
+
+    """
+    last_name, comma, first_name = full_name.partition(',')
+    if comma and first_name.strip() and last_name.strip():
+        return normalize_name(first_name), normalize_name(last_name)
+    words = normalize_name(full_name).split()
+    if len(words) < 2:
+        return None
+    return words[0], ' '.join(words[_last_name_start(words):])
+
+
+def _last_name_start(words: list[str]) -> int:
+    """Return the position of the first word of the last name.
+
+    Args:
+        words: The words of a normalized full name, at least two.
+
+    Returns:
+        The position of the first particle after the first name, or of the last word.
+
+    """
+    for position, word in enumerate(words[1:-1], start=1):
+        if word in NAME_PARTICLES:
+            return position
+    return len(words) - 1
+
+
+def normalize_name_params(names: dict) -> dict:
+    """Normalize the name parameters of an email finder lookup.
+
+    Args:
+        names: Either first_name and last_name, or full_name.
+
+    Returns:
+        Normalized first_name and last_name, or a normalized full_name that has a single word.
+
+    """
+    full_name = names.get('full_name')
+    if not full_name:
+        return {key: normalize_name(name) for key, name in names.items()}
+    split_name = split_full_name(full_name)
+    if split_name is None:
+        return {'full_name': normalize_name(full_name)}
+    return {'first_name': split_name[0], 'last_name': split_name[1]}
@@ -0,0 +1,194 @@
+"""Auto-paginating iteration over Hunter.io domain search results."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Self
+
+import requests
+
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.exceptions import HunterAPIError
+
+# Largest limit the domain search endpoint accepts
+MAX_PAGE_SIZE = 100
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+DEFAULT_PREFETCH = 4
+
+
+class _OrderedPrefetch:
+    """Run calls ahead in worker threads and hand back results in input order."""
+
+    def __init__(
+        self,
+        func: Callable[[Any], Any],
+        queries: Iterable[Any],
+        prefetch: int,
+    ) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            func: Blocking callable applied to each query.
+            queries: Input queries, consumed lazily.
+            prefetch: Maximum number of calls running ahead of the consumer.
+
+        """
+        self._func = func
+        self._queries = iter(queries)
+        self._prefetch = prefetch
+        self._executor = ThreadPoolExecutor(max_workers=prefetch)
+        self._pending: deque[Future] = deque()
+
+    def __enter__(self) -> Self:
+        """Start the first calls.
+
+        Returns:
+            The prefetcher itself.
+
+        """
+        self._submit(self._prefetch)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cancel calls that have not started yet.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield call results in input order.
+
+        Yields:
+            The result of each call.
+
+        """
+        while self._pending:
+            next_result = self._pending.popleft().result()
+            self._submit(1)
+            yield next_result
+
+    def _submit(self, count: int) -> None:
+        """Start up to count calls from the input.
+
+        Args:
+            count: Maximum number of calls to start.
+
+        """
+        for _ in range(count):
+            query = next(self._queries, None)
+            if query is None:
+                return
+            self._pending.append(self._executor.submit(self._func, query))
+
+
+def iter_domain_emails(
+    client: HunterClient,
+    domain: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = DEFAULT_PREFETCH,
+    **search_params,
+) -> Iterator[dict]:
+    """Iterate over every email record Hunter.io has for a domain.
+
+    The first page tells how many results exist (meta.results); the
+    remaining pages are then fetched concurrently, up to `prefetch` ahead
+    of the consumer, and yielded in order. Pages not yet requested are
+    never fetched if the consumer stops iterating.
+
+    Args:
+        client: The client used for the searches.
+        domain: The domain on which to search for emails.
+        page_size: Number of emails per request, from 1 to 100.
+        prefetch: Maximum number of pages fetched ahead, at least 1.
+        search_params: Optional filters (seniority, department, emails_type).
+
+    Returns:
+        An iterator over the email records of every page.
+
+    Raises:
+        ValueError: If page_size or prefetch is out of range.
+
+    """
+    if page_size < 1 or page_size > MAX_PAGE_SIZE:
+        raise ValueError('page_size must be between 1 and {0}, got {1}'.format(MAX_PAGE_SIZE, page_size))
+    if prefetch < 1:
+        raise ValueError('prefetch must be at least 1, got {0}'.format(prefetch))
+    return _iter_pages(client, domain, page_size, prefetch, search_params)
+
+
+def _iter_pages(
+    client: HunterClient,
+    domain: str,
+    page_size: int,
+    prefetch: int,
+    search_params: dict,
+) -> Iterator[dict]:
+    """Yield the email records of every page, prefetching after the first.
+
+    Args:
+        client: The client used for the searches.
+        domain: The domain on which to search for emails.
+        page_size: Number of emails per request.
+        prefetch: Maximum number of pages fetched ahead.
+        search_params: Optional filters.
+
+    Yields:
+        Email records from the 'emails' list of each page.
+
+    """
+    emails, total = _fetch_page(client, domain, 0, page_size, search_params)
+    yield from emails
+
+    offsets = range(page_size, total, page_size)
+    with _OrderedPrefetch(
+        lambda offset: _fetch_page(client, domain, offset, page_size, search_params)[0],
+        offsets,
+        prefetch,
+    ) as pages:
+        for page in pages:
+            yield from page
+
+
+def _fetch_page(
+    client: HunterClient,
+    domain: str,
+    offset: int,
+    page_size: int,
+    search_params: dict,
+) -> tuple[list[dict], int]:
+    """Fetch one page of a domain search.
+
+    Args:
+        client: The client used for the search.
+        domain: The domain on which to search for emails.
+        offset: Number of results to skip.
+        page_size: Number of emails to return.
+        search_params: Optional filters.
+
+    Returns:
+        The email records of the page and the total number of results.
+
+    Raises:
+        HunterAPIError: If the API returns an error.
+
+    """
+    search_params = {**search_params, 'limit': page_size, 'offset': offset}
+    response = client.domain_search(domain=domain, raw=True, **search_params)
+    # Type narrowing: when raw=True, response is requests.Response
+    assert isinstance(response, requests.Response)
+
+    payload = client.config.decoder.decode(response.content)
+    if 'data' not in payload:
+        raise HunterAPIError(str(payload))
+    return payload['data']['emails'], payload['meta']['results']
@@ -0,0 +1,264 @@
+"""Email pattern cache and local email synthesis for the email finder.
+
+domain_search reports the most common address pattern of a domain, e.g.
+'{first}.{last}'. Once a domain's pattern is known, email_finder can
+render a candidate address from the person's name instead of calling the
+API, verifying the candidate first when the pattern is not trusted enough.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from hunter_wrapper.names import normalize_name, split_full_name
+
+_NOT_TOKEN = re.compile('[^a-z0-9]')
+DEFAULT_MIN_NAMED = 5
+# The only placeholders of a Hunter pattern; splitting keeps their names at odd positions
+_PLACEHOLDER = re.compile(r'\{(first|last|f|l)\}')
+
+
+def _name_token(name: str | None) -> str:
+    """Reduce a name to the lowercase ASCII letters and digits used in addresses.
+
+    Args:
+        name: A first or last name.
+
+    Returns:
+        The address token, e.g. 'nunez' for 'Núñez', or '' if nothing is left.
+
+    """
+    return _NOT_TOKEN.sub('', normalize_name(name or ''))
+
+
+def _query_names(query_params: dict) -> tuple[str | None, str | None]:
+    """Return the first and last name of an email finder lookup.
+
+    Args:
+        query_params: Email finder query parameters.
+
+    Returns:
+        The first and last name, or None for names that cannot be split.
+
+    """
+    if query_params.get('first_name') and query_params.get('last_name'):
+        return query_params['first_name'], query_params['last_name']
+    split_name = split_full_name(query_params.get('full_name') or '')
+    if split_name is None:
+        return None, None
+    return split_name
+
+
+def _name_tokens(first_name: str | None, last_name: str | None) -> dict[str, str]:
+    """Return the values of the pattern placeholders for a name.
+
+    Args:
+        first_name: The person's first name.
+        last_name: The person's last name.
+
+    Returns:
+        The first, last, f and l tokens; tokens of a missing name are left
+        out, so patterns using them fail to render.
+
+    """
+    first = _name_token(first_name)
+    last = _name_token(last_name)
+    tokens: dict[str, str] = {}
+    if first:
+        tokens.update(first=first, f=first[0])
+    if last:
+        tokens.update(last=last, l=last[0])
+    return tokens
+
+
+def render_pattern(pattern: str, first_name: str | None, last_name: str | None) -> str | None:
+    """Render the local part of an address from a Hunter pattern.
+
+    Args:
+        pattern: A pattern using {first}, {last}, {f} and {l}, e.g. '{f}{last}'.
+        first_name: The person's first name.
+        last_name: The person's last name.
+
+    Returns:
+        The local part, or None if the pattern needs a name that is missing
+        or has braces other than these placeholders.
+
+    """
+    tokens = _name_tokens(first_name, last_name)
+    # The pattern comes from the API, so it is never given to str.format
+    parts = _PLACEHOLDER.split(pattern)
+    literals = ''.join(parts[::2])
+    if '{' in literals or '}' in literals:
+        return None
+    names = parts[1::2]
+    if set(names) - tokens.keys():
+        return None
+    for position in range(1, len(parts), 2):
+        parts[position] = tokens[parts[position]]
+    return ''.join(parts) or None
+
+
+def _pattern_confidence(pattern: str, records: list[dict]) -> tuple[int, int]:
+    """Return the share of named email records that follow a pattern.
+
+    Args:
+        pattern: The address pattern, e.g. '{first}.{last}'.
+        records: The domain search 'emails' list.
+
+    Returns:
+        The percentage of records with first and last name whose address
+        matches the pattern, and the number of such named records.
+
+    """
+    named = 0
+    matches = 0
+    for record in records:
+        local_part = render_pattern(pattern, record.get('first_name'), record.get('last_name'))
+        if local_part is not None and record.get('first_name') and record.get('last_name'):
+            named += 1
+            address = record.get('value') or ''
+            matches += address.lower().partition('@')[0] == local_part
+    return (matches * 100 // named if named else 0), named
+
+
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    """An address rendered from a cached domain pattern.
+
+    Attributes:
+        email: The rendered address.
+        score: Confidence of the domain pattern, from 0 to 100.
+        trusted: Whether the score is high enough to skip verification.
+
+    """
+
+    email: str
+    score: int
+    trusted: bool
+
+    def accepts(self, verification: Any) -> bool:
+        """Return whether the candidate can be returned instead of calling the API.
+
+        Args:
+            verification: email_verifier data for the candidate, or None if not verified.
+
+        Returns:
+            True if the candidate is trusted or verified as valid.
+
+        """
+        if self.trusted:
+            return True
+        return isinstance(verification, dict) and verification.get('status') == 'valid'
+
+
+class PatternCache:
+    """Thread-safe LRU cache of email patterns per domain."""
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        synthesize: bool = True,
+        verify_below: int = 90,
+        min_named: int = DEFAULT_MIN_NAMED,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of domains kept; 0 disables the cache.
+            synthesize: Whether email_finder renders addresses from cached patterns.
+            verify_below: Pattern confidence below which a rendered address is verified first.
+            min_named: Named addresses a domain search must return before its pattern can be trusted.
+
+        """
+        self.maxsize = maxsize
+        self.synthesize = synthesize
+        self.verify_below = verify_below
+        self.min_named = min_named
+        self.candidates = 0
+        self._patterns: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached domains.
+
+        Returns:
+            The number of domains.
+
+        """
+        return len(self._patterns)
+
+    def get(self, domain: str) -> tuple[str, int] | None:
+        """Return the cached pattern of a domain.
+
+        Args:
+            domain: The domain to look up.
+
+        Returns:
+            The pattern and its confidence, or None.
+
+        """
+        with self._lock:
+            entry = self._patterns.get(domain.lower())
+            if entry is not None:
+                self._patterns.move_to_end(domain.lower())
+            return entry
+
+    def set(self, domain: str, pattern: str, confidence: int) -> None:
+        """Cache the pattern of a domain, evicting the least recently used ones when full.
+
+        Args:
+            domain: The domain.
+            pattern: The address pattern, e.g. '{first}.{last}'.
+            confidence: Confidence in the pattern, from 0 to 100.
+
+        """
+        with self._lock:
+            self._patterns[domain.lower()] = (pattern, confidence)
+            self._patterns.move_to_end(domain.lower())
+            while len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)
+
+    def observe(self, response_data: dict) -> None:
+        """Cache the pattern reported by a domain search.
+
+        The confidence is the share of the returned named addresses that
+        follow the pattern. With fewer than min_named of them it is kept
+        below verify_below, so rendered addresses are verified first.
+
+        Args:
+            response_data: The dict returned by domain_search.
+
+        """
+        domain = response_data.get('domain')
+        pattern = response_data.get('pattern')
+        if not (domain and pattern):
+            return
+        records = response_data.get('emails') or []
+        confidence, named = _pattern_confidence(pattern, records)
+        if named < self.min_named:
+            confidence = min(confidence, self.verify_below - 1)
+        self.set(domain, pattern, max(confidence, 0))
+
+    def candidate(self, query_params: dict) -> Candidate | None:
+        """Render an address for an email finder lookup from the cached pattern.
+
+        Args:
+            query_params: Email finder query parameters with domain and names.
+
+        Returns:
+            The candidate, or None if synthesis is off or the pattern or names are missing.
+
+        """
+        domain = query_params.get('domain') or ''
+        entry = self.get(domain) if self.synthesize and domain else None
+        if entry is None:
+            return None
+        local_part = render_pattern(entry[0], *_query_names(query_params))
+        if local_part is None:
+            return None
+        self.candidates += 1
+        email = '{0}@{1}'.format(local_part, domain.lower())
+        pattern_score = entry[1]
+        return Candidate(email, pattern_score, pattern_score >= self.verify_below)
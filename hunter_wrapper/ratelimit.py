@@ -0,0 +1,211 @@
+"""Client-side rate limiting for the Hunter.io API.
+
+Each endpoint gets its own token bucket so bursts stay below the plan's
+per-second limits instead of being answered with HTTP 429.
+"""
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+# Requests per second allowed by Hunter.io, see https://hunter.io/api-documentation/v2#rate-limiting
+DEFAULT_RATES = MappingProxyType({
+    'domain-search': 15.0,
+    'email-finder': 15.0,
+    'email-verifier': 10.0,
+})
+
+
+@dataclasses.dataclass
+class BucketMetrics:
+    """Counters describing how a token bucket has been used.
+
+    Attributes:
+        acquired: Number of tokens handed out.
+        rejected: Number of acquisitions refused because the wait was too long.
+        total_wait: Seconds callers were told to wait, summed.
+        max_wait: Longest single wait in seconds.
+
+    """
+
+    acquired: int = 0
+    rejected: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a constant rate."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size, defaults to one second worth of tokens.
+            clock: Monotonic time source.
+
+        """
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._tokens = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._metrics = BucketMetrics()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take a token, possibly from the future.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            Seconds the caller must wait before using the token, or None if
+            that would exceed max_wait (no token is taken then).
+
+        """
+        with self._lock:
+            self._refill()
+            wait = max(0, (1 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                self._metrics.rejected += 1
+                return None
+            self._tokens -= 1
+            self._metrics.acquired += 1
+            self._metrics.total_wait += wait
+            self._metrics.max_wait = max(self._metrics.max_wait, wait)
+            return wait
+
+    def wait_time(self) -> float:
+        """Return how long until a token is available, without taking it.
+
+        Returns:
+            Seconds until the next token, 0 if one is available now.
+
+        """
+        with self._lock:
+            self._refill()
+            return max(0, (1 - self._tokens) / self.rate)
+
+    def metrics(self) -> BucketMetrics:
+        """Return a snapshot of the bucket counters.
+
+        Returns:
+            A copy of the counters.
+
+        """
+        with self._lock:
+            return dataclasses.replace(self._metrics)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Per-endpoint token buckets shared by every call of a client.
+
+    Endpoints without a configured rate are not limited.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float] = DEFAULT_RATES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize one bucket per endpoint.
+
+        Args:
+            rates: Requests per second allowed, per endpoint name.
+            clock: Monotonic time source.
+
+        """
+        self.buckets = {
+            endpoint: TokenBucket(rate, clock=clock)
+            for endpoint, rate in rates.items()
+        }
+
+    def acquire(self, endpoint: str, timeout: float | None = None) -> bool:
+        """Block until a request to endpoint may be sent.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+            timeout: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            True once the request may be sent, False if the wait would exceed timeout.
+
+        """
+        wait = self._reserve(endpoint, timeout)
+        if wait is None:
+            return False
+        if wait:
+            time.sleep(wait)
+        return True
+
+    def try_acquire(self, endpoint: str) -> bool:
+        """Take a token for endpoint only if one is available right now.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+
+        Returns:
+            True if the request may be sent immediately.
+
+        """
+        return self._reserve(endpoint, 0) is not None
+
+    async def aacquire(self, endpoint: str, timeout: float | None = None) -> bool:
+        """Wait on the event loop until a request to endpoint may be sent.
+
+        Args:
+            endpoint: The endpoint name, e.g. 'domain-search'.
+            timeout: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            True once the request may be sent, False if the wait would exceed timeout.
+
+        """
+        wait = self._reserve(endpoint, timeout)
+        if wait is None:
+            return False
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+    def metrics(self) -> dict[str, BucketMetrics]:
+        """Return wait-time metrics for every endpoint.
+
+        Returns:
+            A snapshot of the counters, per endpoint name.
+
+        """
+        return {endpoint: bucket.metrics() for endpoint, bucket in self.buckets.items()}
+
+    def _reserve(self, endpoint: str, max_wait: float | None) -> float | None:
+        """Reserve a token from the bucket of endpoint.
+
+        Args:
+            endpoint: The endpoint name.
+            max_wait: Longest acceptable wait in seconds.
+
+        Returns:
+            Seconds to wait, or None if the wait would exceed max_wait.
+
+        """
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            return 0
+        return bucket.reserve(max_wait)
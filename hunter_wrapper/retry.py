@@ -0,0 +1,178 @@
+"""Retry policy for transient Hunter.io API failures.
+
+Rate limiting (429), server errors (5xx) and connection failures are
+retried with exponential backoff and full jitter, honoring Retry-After,
+within a total deadline.
+"""
+
+import asyncio
+import secrets
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any
+
+from hunter_wrapper.deadline import current_deadline
+from hunter_wrapper.exceptions import HunterConnectionError, HunterRateLimitError, HunterServerError
+
+RETRYABLE_ERRORS = (HunterRateLimitError, HunterServerError, HunterConnectionError)
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+_jitter = secrets.SystemRandom()
+
+
+def raise_for_retryable_status(status_code: int, headers: Mapping[str, str], body: str) -> None:
+    """Raise a typed error for rate limiting and server error status codes.
+
+    Args:
+        status_code: The HTTP status code of the response.
+        headers: The response headers.
+        body: The response body, used as error message.
+
+    Raises:
+        HunterRateLimitError: On HTTP 429.
+        HunterServerError: On HTTP 5xx.
+
+    """
+    if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        raise HunterRateLimitError(body, retry_after=parse_retry_after(headers.get('Retry-After')))
+    if status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        raise HunterServerError(body)
+
+
+def parse_retry_after(header_value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        header_value: The header value, if present.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+
+    """
+    if not header_value:
+        return None
+    if header_value.strip().isdigit():
+        return float(header_value)
+    try:
+        retry_at = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry transient failures with exponential backoff and full jitter.
+
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first one.
+        base_delay: Backoff cap of the first retry in seconds, doubled on each retry.
+        max_delay: Upper bound of the backoff cap in seconds.
+        deadline: Total seconds a call may spend across attempts (None for no limit); a call Deadline may cut it.
+        idempotent_methods: HTTP methods safe to retry after any transient error; others only on HTTP 429.
+
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30
+    deadline: float | None = 60
+    idempotent_methods: frozenset[str] = field(default=IDEMPOTENT_METHODS)
+
+    def call(self, func: Callable[[], Any], method: str = 'GET') -> Any:
+        """Call func, retrying transient failures.
+
+        Args:
+            func: Callable performing one attempt.
+            method: HTTP method of the request.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            HunterAPIError: The last error once retries are exhausted.  # noqa: DAR402
+
+        """
+        give_up_at = self._give_up_at()
+        for attempt in range(1, self.max_attempts):
+            try:
+                return func()
+            except RETRYABLE_ERRORS as exc:
+                delay = self.backoff(exc, attempt, method, give_up_at)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+        return func()
+
+    async def acall(self, func: Callable[[], Awaitable[Any]], method: str = 'GET') -> Any:
+        """Await func, retrying transient failures without blocking the event loop.
+
+        Args:
+            func: Coroutine function performing one attempt.
+            method: HTTP method of the request.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            HunterAPIError: The last error once retries are exhausted.  # noqa: DAR402
+
+        """
+        give_up_at = self._give_up_at()
+        for attempt in range(1, self.max_attempts):
+            try:
+                return await func()
+            except RETRYABLE_ERRORS as exc:
+                delay = self.backoff(exc, attempt, method, give_up_at)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+        return await func()
+
+    def backoff(
+        self,
+        error: Exception,
+        attempt: int,
+        method: str,
+        give_up_at: float | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying after error.
+
+        Args:
+            error: The error of the failed attempt.
+            attempt: Number of the failed attempt, starting at 1.
+            method: HTTP method of the request.
+            give_up_at: Monotonic time after which no retry may start.
+
+        Returns:
+            Seconds to wait, or None if the call must not be retried.
+
+        """
+        if not isinstance(error, HunterRateLimitError) and method not in self.idempotent_methods:
+            return None
+        delay = getattr(error, 'retry_after', None)
+        if delay is None:
+            # Full jitter: uniform between 0 and the exponential backoff cap
+            backoff_cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            delay = _jitter.uniform(0, backoff_cap)
+        if give_up_at is not None and time.monotonic() + delay > give_up_at:
+            return None
+        return delay
+
+    def _give_up_at(self) -> float | None:
+        """Return the monotonic time after which no retry may start.
+
+        This is the earlier of the policy deadline and the call deadline.
+
+        Returns:
+            The deadline as monotonic time, or None for no limit.
+
+        """
+        call_deadline = current_deadline()
+        if self.deadline is None:
+            return call_deadline
+        policy_deadline = time.monotonic() + self.deadline
+        return policy_deadline if call_deadline is None else min(policy_deadline, call_deadline)
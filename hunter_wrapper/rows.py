@@ -0,0 +1,139 @@
+"""Streaming row readers and result sinks for bulk Hunter.io jobs.
+
+Readers yield one row at a time and sinks write one result at a time,
+so files of any size are processed in constant memory.
+"""
+
+import csv
+import json
+from collections.abc import Iterator
+from typing import TextIO
+
+from hunter_wrapper.concurrency import BulkResult
+
+FINDER_FIELDS = ('domain', 'company', 'first_name', 'last_name', 'full_name')
+RESULT_FIELDS = ('index', *FINDER_FIELDS, 'email', 'score', 'error')
+
+
+def read_csv_rows(source: TextIO) -> Iterator[dict]:
+    """Lazily read email finder rows from a CSV file with a header line.
+
+    Args:
+        source: Open text file with domain/company and name columns.
+
+    Returns:
+        An iterator of row dicts.
+
+    """
+    return iter(csv.DictReader(source))
+
+
+def read_jsonl_rows(source: TextIO) -> Iterator[dict]:
+    """Lazily read email finder rows from a JSON Lines file.
+
+    Blank lines are skipped.
+
+    Args:
+        source: Open text file with one JSON object per line.
+
+    Yields:
+        One row dict per line.
+
+    """
+    for line in source:
+        if line.strip():
+            yield json.loads(line)
+
+
+def finder_row(bulk_result: BulkResult) -> dict:
+    """Flatten an email finder BulkResult into a row for a sink.
+
+    Args:
+        bulk_result: The outcome of one email finder lookup.
+
+    Returns:
+        A dict keyed by RESULT_FIELDS.
+
+    """
+    email, score = bulk_result.response or (None, None)
+    row = {field: bulk_result.query.get(field) for field in FINDER_FIELDS}
+    row.update(
+        index=bulk_result.index,
+        email=email,
+        score=score,
+        error=str(bulk_result.error) if bulk_result.error else None,
+    )
+    return row
+
+
+def verification_row(bulk_result: BulkResult) -> dict:
+    """Flatten a verify_many result into a row for a batch or sink.
+
+    Args:
+        bulk_result: The outcome of one verification.
+
+    Returns:
+        A row with index, email, domain, status, result, score and deliverable;
+        failed lookups have status 'error', no score and the error message.
+
+    """
+    email = bulk_result.query
+    domain = email.rpartition('@')[2].lower()
+    row = {'index': bulk_result.index, 'email': email, 'domain': domain}
+    if bulk_result.error is not None:
+        row.update(status='error', error=str(bulk_result.error))
+        return row
+    verification = bulk_result.response
+    row.update(
+        status=verification.get('status'),
+        result=verification.get('result'),
+        score=verification.get('score'),
+        deliverable=float(verification.get('result') == 'deliverable'),
+    )
+    return row
+
+
+class CsvResultSink:
+    """Write email finder results to a CSV file as they arrive."""
+
+    def __init__(self, target: TextIO) -> None:
+        """Initialize the sink and write the header line.
+
+        Args:
+            target: Open text file to write to.
+
+        """
+        self._writer = csv.DictWriter(target, fieldnames=RESULT_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, bulk_result: BulkResult) -> None:
+        """Write one result.
+
+        Args:
+            bulk_result: The outcome of one email finder lookup.
+
+        """
+        self._writer.writerow(finder_row(bulk_result))
+
+
+class JsonlResultSink:
+    """Write email finder results to a JSON Lines file as they arrive."""
+
+    def __init__(self, target: TextIO) -> None:
+        """Initialize the sink.
+
+        Args:
+            target: Open text file to write to.
+
+        """
+        self._target = target
+
+    def write(self, bulk_result: BulkResult) -> None:
+        """Write one result.
+
+        Args:
+            bulk_result: The outcome of one email finder lookup.
+
+        """
+        self._target.write(json.dumps(finder_row(bulk_result)))
+        self._target.write('\n')
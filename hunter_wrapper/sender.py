@@ -0,0 +1,364 @@
+"""Request sending for the Hunter.io API clients.
+
+A sender wraps the HTTP session with the client-side policies applied to
+every request: circuit breaking, rate limiting, timeouts, error
+classification and retries.
+"""
+
+import functools
+
+import httpx
+import requests
+
+from hunter_wrapper.base import endpoint_name
+from hunter_wrapper.circuit import CircuitBreaker
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.credits import CreditScheduler
+from hunter_wrapper.deadline import remaining_time
+from hunter_wrapper.exceptions import (
+    HunterConnectionError,
+    HunterDeadlineExceededError,
+    HunterRateLimitError,
+    HunterServerError,
+    HunterTimeoutError,
+)
+from hunter_wrapper.keys import KeyPool
+from hunter_wrapper.ratelimit import RateLimiter
+from hunter_wrapper.retry import RetryPolicy, raise_for_retryable_status
+
+# Errors telling that the API is unhealthy, as opposed to rejecting the request
+OUTAGE_ERRORS = (HunterServerError, HunterConnectionError)
+# Errors telling that a healthy API answered and rejected the request
+ANSWERED_ERRORS = (HunterRateLimitError, requests.HTTPError, httpx.HTTPStatusError)
+
+
+def account_endpoint(endpoint: str) -> str:
+    """Return the URL of the account endpoint next to an API endpoint.
+
+    Args:
+        endpoint: The API endpoint URL.
+
+    Returns:
+        The account endpoint URL.
+
+    """
+    return '{0}/account'.format(endpoint.rsplit('/', 1)[0])
+
+
+class RequestSender:
+    """Send blocking requests through the client-side policies."""
+
+    def __init__(self, session: requests.Session, config: ClientConfig, key_pool: KeyPool | None = None) -> None:
+        """Initialize the sender.
+
+        Args:
+            session: The pooled HTTP session.
+            config: The client settings.
+            key_pool: Keys to send each request with instead of the api_key parameter, if any.
+
+        """
+        self.session = session
+        self.retry_policy = RetryPolicy() if config.retry_policy is None else config.retry_policy
+        # A limiter without rates never throttles
+        self.rate_limiter = RateLimiter(rates={}) if config.rate_limiter is None else config.rate_limiter
+        self.circuit_breaker = CircuitBreaker() if config.circuit_breaker is None else config.circuit_breaker
+        # A scheduler without budgets that never reconciles never makes a call wait
+        credit_scheduler = config.credit_scheduler
+        self.credits = CreditScheduler(reconcile_every=None) if credit_scheduler is None else credit_scheduler
+        self.timeout = config.timeout
+        self._decoder = config.decoder
+        self._key_pool = key_pool
+
+    def send(self, request_type: str, endpoint: str, query_params: dict) -> requests.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            request_type: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterDeadlineExceededError: If the budget ran out waiting for the credit budget.
+
+        """
+        if not self.credits.acquire(endpoint_name(endpoint)):
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for the credit budget')
+        method = request_type.upper()
+        return self.retry_policy.call(
+            functools.partial(self._send_once, method, endpoint, query_params),
+            method,
+        )
+
+    def _send_once(self, method: str, endpoint: str, query_params: dict) -> requests.Response:
+        """Send one attempt through the circuit breaker and rate limiter.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        """
+        name = endpoint_name(endpoint)
+        trial = self.circuit_breaker.before_call(name)
+        try:
+            res = self._limited_request(name, method, endpoint, query_params)
+        except OUTAGE_ERRORS:
+            self.circuit_breaker.record_failure(name, trial=trial)
+            raise
+        except ANSWERED_ERRORS:
+            self.circuit_breaker.record_success(name, trial=trial)
+            raise
+        else:
+            self.circuit_breaker.record_success(name, trial=trial)
+        finally:
+            # Any other failure says nothing about the API; never strand a trial call
+            if trial:
+                self.circuit_breaker.release_trial(name)
+        return res
+
+    def _limited_request(self, name: str, method: str, endpoint: str, query_params: dict) -> requests.Response:
+        """Wait for the rate limiter, then send the HTTP request.
+
+        Args:
+            name: The endpoint name.
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterDeadlineExceededError: If the budget ran out waiting for the rate limiter.
+
+        """
+        if not self.rate_limiter.acquire(name, timeout=remaining_time()):
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for the rate limiter')
+        return self._pooled_request(method, endpoint, query_params)
+
+    def _pooled_request(self, method: str, endpoint: str, query_params: dict) -> requests.Response:
+        """Send the HTTP request with a key of the key pool, if there is one.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        """
+        if self._key_pool is None:
+            return self._request(method, endpoint, query_params)
+        return self._key_pool.call(
+            endpoint_name(endpoint),
+            lambda api_key: self._request(method, endpoint, {**query_params, 'api_key': api_key}),
+            functools.partial(self._fetch_account, account_endpoint(endpoint)),
+        )
+
+    def _fetch_account(self, endpoint: str, api_key: str) -> dict:
+        """Fetch the account data of a key of the pool.
+
+        Args:
+            endpoint: The account endpoint URL.
+            api_key: The key whose account is fetched.
+
+        Returns:
+            Account data as dict, with usage under 'requests'.
+
+        """
+        res = self._request('GET', endpoint, {'api_key': api_key})
+        return self._decoder.decode_data(res.content)
+
+    def _request(self, method: str, endpoint: str, query_params: dict) -> requests.Response:
+        """Send the HTTP request and classify its failures.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterTimeoutError: If connecting or reading timed out.
+            HunterConnectionError: If the API cannot be reached.
+
+        """
+        timeout = self.timeout.for_attempt()
+        try:
+            res = self.session.request(method, endpoint, params=query_params, timeout=timeout)
+        except requests.Timeout as timeout_exc:
+            raise HunterTimeoutError(str(timeout_exc)) from timeout_exc
+        except requests.ConnectionError as exc:
+            raise HunterConnectionError(str(exc)) from exc
+        raise_for_retryable_status(res.status_code, res.headers, res.text)
+        res.raise_for_status()
+        return res
+
+
+class AsyncRequestSender:
+    """Send non-blocking requests through the client-side policies."""
+
+    def __init__(self, session: httpx.AsyncClient, config: ClientConfig, key_pool: KeyPool | None = None) -> None:
+        """Initialize the sender.
+
+        Args:
+            session: The pooled async HTTP client.
+            config: The client settings.
+            key_pool: Keys to send each request with instead of the api_key parameter, if any.
+
+        """
+        self.session = session
+        self.retry_policy = RetryPolicy() if config.retry_policy is None else config.retry_policy
+        # A limiter without rates never throttles
+        self.rate_limiter = RateLimiter(rates={}) if config.rate_limiter is None else config.rate_limiter
+        self.circuit_breaker = CircuitBreaker() if config.circuit_breaker is None else config.circuit_breaker
+        # A scheduler without budgets that never reconciles never makes a call wait
+        credit_scheduler = config.credit_scheduler
+        self.credits = CreditScheduler(reconcile_every=None) if credit_scheduler is None else credit_scheduler
+        self.timeout = config.timeout
+        self._decoder = config.decoder
+        self._key_pool = key_pool
+
+    async def send(self, request_type: str, endpoint: str, query_params: dict) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            request_type: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterDeadlineExceededError: If the budget ran out waiting for the credit budget.
+
+        """
+        if not await self.credits.aacquire(endpoint_name(endpoint)):
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for the credit budget')
+        method = request_type.upper()
+        return await self.retry_policy.acall(
+            functools.partial(self._send_once, method, endpoint, query_params),
+            method,
+        )
+
+    async def _send_once(self, method: str, endpoint: str, query_params: dict) -> httpx.Response:
+        """Send one attempt through the circuit breaker and rate limiter.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        """
+        name = endpoint_name(endpoint)
+        trial = self.circuit_breaker.before_call(name)
+        try:
+            res = await self._limited_request(name, method, endpoint, query_params)
+        except OUTAGE_ERRORS:
+            self.circuit_breaker.record_failure(name, trial=trial)
+            raise
+        except ANSWERED_ERRORS:
+            self.circuit_breaker.record_success(name, trial=trial)
+            raise
+        else:
+            self.circuit_breaker.record_success(name, trial=trial)
+        finally:
+            # Any other failure says nothing about the API; never strand a trial call
+            if trial:
+                self.circuit_breaker.release_trial(name)
+        return res
+
+    async def _limited_request(self, name: str, method: str, endpoint: str, query_params: dict) -> httpx.Response:
+        """Wait for the rate limiter, then send the HTTP request.
+
+        Args:
+            name: The endpoint name.
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterDeadlineExceededError: If the budget ran out waiting for the rate limiter.
+
+        """
+        if not await self.rate_limiter.aacquire(name, timeout=remaining_time()):
+            raise HunterDeadlineExceededError('Call deadline exceeded while waiting for the rate limiter')
+        return await self._pooled_request(method, endpoint, query_params)
+
+    async def _pooled_request(self, method: str, endpoint: str, query_params: dict) -> httpx.Response:
+        """Send the HTTP request with a key of the key pool, if there is one.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        """
+        if self._key_pool is None:
+            return await self._request(method, endpoint, query_params)
+        return await self._key_pool.acall(
+            endpoint_name(endpoint),
+            lambda api_key: self._request(method, endpoint, {**query_params, 'api_key': api_key}),
+            functools.partial(self._fetch_account, account_endpoint(endpoint)),
+        )
+
+    async def _fetch_account(self, endpoint: str, api_key: str) -> dict:
+        """Fetch the account data of a key of the pool.
+
+        Args:
+            endpoint: The account endpoint URL.
+            api_key: The key whose account is fetched.
+
+        Returns:
+            Account data as dict, with usage under 'requests'.
+
+        """
+        res = await self._request('GET', endpoint, {'api_key': api_key})
+        return self._decoder.decode_data(res.content)
+
+    async def _request(self, method: str, endpoint: str, query_params: dict) -> httpx.Response:
+        """Send the HTTP request and classify its failures.
+
+        Args:
+            method: HTTP method to use.
+            endpoint: The API endpoint URL.
+            query_params: Query parameters for the request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HunterTimeoutError: If connecting, reading or waiting for a pooled connection timed out.
+            HunterConnectionError: If the API cannot be reached.
+
+        """
+        connect_timeout, read_timeout = self.timeout.for_attempt()
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=remaining_time())
+        try:
+            res = await self.session.request(method, endpoint, params=query_params, timeout=timeout)
+        except httpx.TimeoutException as timeout_exc:
+            raise HunterTimeoutError(str(timeout_exc)) from timeout_exc
+        except httpx.TransportError as exc:
+            raise HunterConnectionError(str(exc)) from exc
+        raise_for_retryable_status(res.status_code, res.headers, res.text)
+        res.raise_for_status()
+        return res
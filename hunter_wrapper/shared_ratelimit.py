@@ -0,0 +1,157 @@
+"""Rate limiting shared by every process on a host.
+
+Worker processes using one API key each have their own RateLimiter, so
+together they can exceed the plan's limits. SharedRateLimiter keeps the
+token bucket of each endpoint in a small memory-mapped file instead, and
+updates it under an exclusive file lock, so every client opened on the
+same directory draws from one bucket. File locks need a POSIX system.
+"""
+
+import contextlib
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+
+from hunter_wrapper.ratelimit import DEFAULT_RATES, RateLimiter, TokenBucket
+
+# Tokens left and the time they were counted at
+_STATE = struct.Struct('<dd')
+_FILE_MODE = 0o600
+
+
+@contextlib.contextmanager
+def _locked_file(fd: int) -> Iterator[None]:
+    """Hold an exclusive lock on an open file.
+
+    Args:
+        fd: The file descriptor.
+
+    Yields:
+        Nothing; the lock is released on exit.
+
+    """
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose state lives in a memory-mapped file.
+
+    Every bucket opened on the same file shares its tokens, across threads
+    and processes. Metrics count the tokens of this bucket object only.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open the bucket file, creating a full bucket if it does not exist.
+
+        Args:
+            path: The bucket file.
+            rate: Tokens added per second.
+            capacity: Maximum burst size, defaults to one second worth of tokens.
+            clock: Time source; it must agree between processes, hence wall-clock time.
+
+        """
+        super().__init__(rate, capacity, clock)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, _FILE_MODE)
+        with _locked_file(self._fd):
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.ftruncate(self._fd, _STATE.size)
+                os.pwrite(self._fd, _STATE.pack(self.capacity, self._updated_at), 0)
+        self._state = mmap.mmap(self._fd, _STATE.size)
+        # File locks do not exclude the threads of the process holding them
+        self._thread_lock = threading.Lock()
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take a token from the shared bucket, possibly from the future.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds; None waits as long as needed.
+
+        Returns:
+            Seconds the caller must wait before using the token, or None if
+            that would exceed max_wait (no token is taken then).
+
+        """
+        with self._shared_state():
+            return super().reserve(max_wait)
+
+    def wait_time(self) -> float:
+        """Return how long until a shared token is available, without taking it.
+
+        Returns:
+            Seconds until the next token, 0 if one is available now.
+
+        """
+        with self._shared_state():
+            return super().wait_time()
+
+    def close(self) -> None:
+        """Unmap and close the bucket file."""
+        self._state.close()
+        os.close(self._fd)
+
+    @contextlib.contextmanager
+    def _shared_state(self) -> Iterator[None]:
+        """Load the bucket from the file, then store it back, under the file lock.
+
+        Yields:
+            Nothing; the state is stored on a clean exit.
+
+        """
+        with self._thread_lock:
+            with _locked_file(self._fd):
+                tokens, updated_at = _STATE.unpack_from(self._state)
+                self._tokens = tokens
+                # A clock set back must not leave the bucket waiting for the lost time
+                self._updated_at = min(updated_at, self._clock())
+                yield
+                _STATE.pack_into(self._state, 0, self._tokens, self._updated_at)
+
+
+class SharedRateLimiter(RateLimiter):
+    """Per-endpoint token buckets shared by every process on the host.
+
+    Processes sharing a directory should use the same rates; the bucket
+    files only hold the tokens left.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        rates: Mapping[str, float] = DEFAULT_RATES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open one bucket file per endpoint in directory.
+
+        Args:
+            directory: Directory of the bucket files, created if missing.
+            rates: Requests per second allowed, per endpoint name.
+            clock: Time source shared by the processes.
+
+        """
+        super().__init__(rates={}, clock=clock)
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.buckets = {
+            endpoint: SharedTokenBucket(Path(directory, '{0}.bucket'.format(endpoint)), rate, clock=clock)
+            for endpoint, rate in rates.items()
+        }
+
+    def close(self) -> None:
+        """Close the bucket files."""
+        for bucket in self.buckets.values():
+            if isinstance(bucket, SharedTokenBucket):
+                bucket.close()
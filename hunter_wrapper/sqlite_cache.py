@@ -0,0 +1,150 @@
+"""Persistent SQLite-backed response cache.
+
+The database runs in WAL mode so many processes can read while one
+writes; payloads are stored as zlib-compressed JSON.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Mapping
+from os import PathLike
+
+from hunter_wrapper.cache import DEFAULT_TTLS, ResponseCache
+
+BUSY_TIMEOUT = 30.0
+
+_SCHEMA = (
+    'PRAGMA auto_vacuum = INCREMENTAL',
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, stored_at REAL, expires_at REAL, payload BLOB)',
+    'CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)',
+)
+_TRIM = 'DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)'
+_UPSERT = 'INSERT OR REPLACE INTO responses (key, stored_at, expires_at, payload) VALUES (?, ?, ?, ?)'
+
+
+class SQLiteCache(ResponseCache):
+    """Response cache stored in an SQLite file shared across processes.
+
+    Each thread gets its own connection. Call evict() periodically to drop
+    expired entries, trim the cache to max_entries and return freed pages
+    to the file system.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        max_entries: int | None = None,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_entries: Entry limit applied by evict(); unbounded if omitted.
+            ttls: Seconds to keep responses, per endpoint name.
+            clock: Wall-clock time source used for expiry.
+
+        """
+        super().__init__(ttls, clock)
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        connection = self._connect()
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including stale ones.
+
+        Returns:
+            The number of entries.
+
+        """
+        return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def evict(self, max_entries: int | None = None) -> int:
+        """Drop expired entries and the oldest ones beyond the entry limit.
+
+        Args:
+            max_entries: Entry limit, defaults to the one given at construction.
+
+        Returns:
+            The number of entries removed.
+
+        """
+        limit = self.max_entries if max_entries is None else max_entries
+        connection = self._connect()
+        with connection:
+            removed = connection.execute('DELETE FROM responses WHERE expires_at <= ?', (self._clock(),)).rowcount
+            if limit is not None:
+                removed += connection.execute(_TRIM, (limit,)).rowcount
+        connection.execute('PRAGMA incremental_vacuum')
+        return removed
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it if needed.
+
+        Returns:
+            An autocommit SQLite connection.
+
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _load(self, key: str, now: float) -> dict | None:
+        """Return the unexpired entry for key.
+
+        Args:
+            key: The cache key.
+            now: The current time.
+
+        Returns:
+            The cached response data, or None.
+
+        """
+        row = self._connect().execute(
+            'SELECT payload FROM responses WHERE key = ? AND expires_at > ?',
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def _store(self, key: str, response_data: dict, expires_at: float) -> None:
+        """Store an entry until expires_at, replacing any previous one.
+
+        Args:
+            key: The cache key.
+            response_data: The response data to cache.
+            expires_at: Time after which the entry is stale.
+
+        """
+        encoded = json.dumps(response_data, separators=(',', ':')).encode()
+        row = (key, self._clock(), expires_at, zlib.compress(encoded))
+        self._connect().execute(_UPSERT, row)
@@ -0,0 +1,142 @@
+"""HTTP transport helpers for the Hunter.io API client.
+
+This module builds the pooled keep-alive session shared by all client calls.
+"""
+
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Self
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for the HTTP transport.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of keep-alive connections per host.
+        pool_block: If True, pool_maxsize is a hard per-host connection limit.
+        keepalive_expiry: Seconds an idle keep-alive connection may be reused (async transport only).
+
+    """
+
+    pool_connections: int = 4
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keepalive_expiry: float = 30.0
+
+
+def create_session(pool_config: PoolConfig) -> requests.Session:
+    """Create a requests session with a pooled keep-alive adapter.
+
+    Args:
+        pool_config: Connection pool settings.
+
+    Returns:
+        A session reusing sockets across requests.
+
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_config.pool_connections,
+        pool_maxsize=pool_config.pool_maxsize,
+        pool_block=pool_config.pool_block,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_async_session(pool_config: PoolConfig) -> httpx.AsyncClient:
+    """Create a non-blocking HTTP client with a pooled keep-alive transport.
+
+    Requests waiting for a free connection queue without a pool timeout,
+    so many in-flight lookups can share a small pool.
+
+    Args:
+        pool_config: Connection pool settings.
+
+    Returns:
+        An httpx.AsyncClient reusing sockets across requests.
+
+    """
+    limits = httpx.Limits(
+        max_connections=pool_config.pool_maxsize if pool_config.pool_block else None,
+        max_keepalive_connections=pool_config.pool_maxsize,
+        keepalive_expiry=pool_config.keepalive_expiry,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(None))
+
+
+class SessionLifecycleMixin:
+    """Give a client close() and context-manager support for its session."""
+
+    session: requests.Session
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context.
+
+        Returns:
+            The client itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the runtime context.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        self.close()
+
+
+class AsyncSessionLifecycleMixin:
+    """Give an async client aclose() and async context-manager support."""
+
+    session: httpx.AsyncClient
+
+    async def aclose(self) -> None:
+        """Close the underlying client and release pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter the async runtime context.
+
+        Returns:
+            The client itself.
+
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the async runtime context.
+
+        Args:
+            exc_type: Exception type, if raised.
+            exc_value: Exception instance, if raised.
+            traceback: Traceback, if raised.
+
+        """
+        await self.aclose()
@@ -0,0 +1,184 @@
+"""Local email syntax checks run before calling the email verifier.
+
+Addresses that can never be delivered (bad syntax, over-long parts, a
+domain that is not a valid host name) are answered locally with a
+synthetic 'invalid' result, saving the credit and the round-trip.
+"""
+
+import re
+from dataclasses import dataclass
+
+MAX_EMAIL_LENGTH = 254
+MAX_LOCAL_LENGTH = 64
+MAX_DOMAIN_LENGTH = 253
+
+# RFC 5322 dot-atom, with RFC 6531 non-ASCII letters allowed
+_DOT_ATOM = re.compile(r"[\w!#$%&'*+/=?^`{|}~-]+(?:\.[\w!#$%&'*+/=?^`{|}~-]+)*")
+# RFC 5322 quoted string of printable ASCII
+_QUOTED = re.compile(r'"(?:[\x20\x21\x23-\x5b\x5d-\x7e]|\\[\x20-\x7e])*"')
+_HOST_LABEL = re.compile('[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?')
+
+
+def _ascii_domain(domain: str) -> str | None:
+    """Convert a domain to lowercase ASCII (IDNA) form.
+
+    Args:
+        domain: The domain part of an address.
+
+    Returns:
+        The ASCII domain, or None if it cannot be encoded.
+
+    """
+    try:
+        return domain.rstrip('.').encode('idna').decode('ascii').lower()
+    except UnicodeError:
+        return None
+
+
+def syntax_error(email: str) -> str | None:
+    """Explain why an email address can never be delivered.
+
+    Args:
+        email: The address to check.
+
+    Returns:
+        The reason the address is invalid, or None if its syntax is valid.
+
+    """
+    if '@' not in email:
+        return 'missing @'
+    local_part, _, domain = email.strip().rpartition('@')
+    ascii_domain = _ascii_domain(domain) or ''
+    reason = _local_part_error(local_part) or _domain_error(ascii_domain)
+    if reason is not None:
+        return reason
+    # The local part, the @ and the domain must fit in MAX_EMAIL_LENGTH
+    if len(local_part) + len(ascii_domain) >= MAX_EMAIL_LENGTH:
+        return 'address longer than {0} characters'.format(MAX_EMAIL_LENGTH)
+    return None
+
+
+def _local_part_error(local_part: str) -> str | None:
+    """Explain why the part before the @ is invalid.
+
+    Args:
+        local_part: The local part of an address.
+
+    Returns:
+        The reason the local part is invalid, or None.
+
+    """
+    if not local_part:
+        return 'missing local part'
+    if len(local_part) > MAX_LOCAL_LENGTH:
+        return 'local part longer than {0} characters'.format(MAX_LOCAL_LENGTH)
+    if not (_DOT_ATOM.fullmatch(local_part) or _QUOTED.fullmatch(local_part)):
+        return 'invalid local part'
+    return None
+
+
+def _domain_error(ascii_domain: str) -> str | None:
+    """Explain why a domain is not a deliverable host name.
+
+    Args:
+        ascii_domain: The domain in ASCII form, or '' if it could not be encoded.
+
+    Returns:
+        The reason the domain is invalid, or None.
+
+    """
+    if not ascii_domain or len(ascii_domain) > MAX_DOMAIN_LENGTH:
+        return 'invalid domain'
+    labels = ascii_domain.split('.')
+    if len(labels) < 2 or labels[-1].isdigit():
+        return 'domain is not a public host name'
+    if not all(_HOST_LABEL.fullmatch(label) for label in labels):
+        return 'invalid domain label'
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class EmailCheck:
+    """Outcome of a local email check.
+
+    Attributes:
+        email: The address to send, with its domain in lowercase ASCII form.
+        reason: Why the address is answered locally, or None if it should be sent.
+        status: Verifier status of the local result, 'invalid' or 'disposable'.
+
+    """
+
+    email: str
+    reason: str | None = None
+    status: str = 'invalid'
+
+    @property
+    def valid(self) -> bool:
+        """Return whether the address passed the local checks.
+
+        Returns:
+            True if the address should be sent to the API.
+
+        """
+        return self.reason is None
+
+    def local_result(self) -> dict:
+        """Build the verifier data returned for an address answered locally.
+
+        Returns:
+            Email verification data shaped like the API's, marked as local.
+
+        """
+        disposable = self.status == 'disposable'
+        return {
+            'email': self.email,
+            'status': self.status,
+            'result': 'risky' if disposable else 'undeliverable',
+            'score': 0,
+            'regexp': disposable,
+            'gibberish': False,
+            'disposable': disposable,
+            'webmail': False,
+            'mx_records': False,
+            'smtp_server': False,
+            'smtp_check': False,
+            'accept_all': False,
+            'block': False,
+            'sources': [],
+            'local_check': self.reason,
+        }
+
+
+class EmailValidator:
+    """Check addresses locally before they are sent to the email verifier."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize the validator.
+
+        Args:
+            enabled: Set to False to send every address to the API unchecked.
+
+        """
+        self.enabled = enabled
+        self.checked = 0
+        self.avoided = 0
+
+    def precheck(self, email: str) -> EmailCheck:
+        """Check an address and normalize its domain.
+
+        Args:
+            email: The address to check.
+
+        Returns:
+            The check outcome; invalid addresses count as avoided calls.
+
+        """
+        if not self.enabled:
+            return EmailCheck(email)
+        self.checked += 1
+        reason = syntax_error(email)
+        if reason is not None:
+            self.avoided += 1
+            return EmailCheck(email, reason)
+        local_part, _, domain = email.strip().rpartition('@')
+        return EmailCheck('{0}@{1}'.format(local_part, _ascii_domain(domain)))
@@ -1,6 +1,7 @@
 """Pytest configuration for Hunter wrapper tests."""
 
 import os
+from collections.abc import Iterator
 
 import pytest
 from dotenv import load_dotenv
@@ -34,17 +35,18 @@ def hunter_api_key() -> str:
 
 
 @pytest.fixture(scope='session', name='hunter_client')
-def create_hunter_client(hunter_key: str) -> HunterClient:
+def create_hunter_client(hunter_key: str) -> Iterator[HunterClient]:
     """Create a HunterClient instance for testing.
 
     Args:
         hunter_key: The Hunter API key from fixture.
 
-    Returns:
-        A configured HunterClient instance.
+    Yields:
+        A configured HunterClient instance, closed after the session.
 
     """
-    return HunterClient(api_key=hunter_key)
+    with HunterClient(api_key=hunter_key) as client:
+        yield client
 
 
 @pytest.fixture
@@ -0,0 +1,236 @@
+"""Pytest fixtures for offline unit tests."""
+
+import io
+import json
+import threading
+from collections import deque
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+import httpx
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.keys import KeyPool
+
+OK_STATUS = 200
+VERIFIER = 'email-verifier'
+
+
+def default_payload() -> dict:
+    """Build the reply used when no canned reply is queued.
+
+    Returns:
+        A successful Hunter API payload.
+
+    """
+    return {
+        'data': {'email': 'john@example.com', 'score': 90},
+        'meta': {},
+    }
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = float(0)
+
+    def __call__(self) -> float:
+        """Return the current fake time.
+
+        Returns:
+            The current fake time.
+
+        """
+        return self.now
+
+
+class FakeHunterAdapter(BaseAdapter):
+    """Transport adapter answering requests from a queue of canned replies.
+
+    Set responder to build the reply body from the request instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the adapter with an empty reply queue."""
+        super().__init__()
+        self.replies: deque = deque()
+        self.requests: list[requests.PreparedRequest] = []
+        self.timeouts: list = []
+        self.responder: Callable[[requests.PreparedRequest], dict] | None = None
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def add_reply(self, payload: dict, status_code: int = OK_STATUS, headers: dict | None = None) -> None:
+        """Queue a reply for the next request.
+
+        Args:
+            payload: JSON body to return.
+            status_code: HTTP status code to return.
+            headers: Extra response headers.
+
+        """
+        self.replies.append((payload, status_code, headers or {}))
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # type: ignore[override]
+        """Record the request and return the next canned reply.
+
+        Args:
+            request: The prepared request.
+            kwargs: Transport options; the timeout is recorded.
+
+        Returns:
+            A response built from the reply queue.
+
+        """
+        with self._lock:
+            self.requests.append(request)
+            self.timeouts.append(kwargs.get('timeout'))
+            if self.replies:
+                payload, status_code, headers = self.replies.popleft()
+            else:
+                payload, status_code, headers = default_payload(), OK_STATUS, {}
+        if self.responder:
+            payload = self.responder(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response.raw = io.BytesIO(json.dumps(payload).encode())
+        response.url = request.url or ''
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        """Mark the adapter as closed."""
+        self.closed = True
+
+
+class FakeAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport answering requests from a queue of canned replies."""
+
+    def __init__(self) -> None:
+        """Initialize the transport with an empty reply queue."""
+        self.replies: deque = deque()
+        self.requests: list[httpx.Request] = []
+
+    def add_reply(self, payload: dict, status_code: int = OK_STATUS, headers: dict | None = None) -> None:
+        """Queue a reply for the next request.
+
+        Args:
+            payload: JSON body to return.
+            status_code: HTTP status code to return.
+            headers: Extra response headers.
+
+        """
+        self.replies.append((payload, status_code, headers or {}))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Record the request and return the next canned reply.
+
+        Args:
+            request: The outgoing request.
+
+        Returns:
+            A response built from the reply queue.
+
+        """
+        self.requests.append(request)
+        if self.replies:
+            payload, status_code, headers = self.replies.popleft()
+        else:
+            payload, status_code, headers = default_payload(), OK_STATUS, {}
+        return httpx.Response(status_code, json=payload, headers=headers)
+
+
+def create_configured_client(
+    fake_adapter: FakeHunterAdapter,
+    config: ClientConfig | None = None,
+    api_key: str | KeyPool = 'test-key',
+) -> HunterClient:
+    """Create a client with the given settings wired to the fake adapter.
+
+    Args:
+        fake_adapter: The fake transport adapter.
+        config: The client settings; defaults are used if omitted.
+        api_key: The API key, or a pool of keys.
+
+    Returns:
+        A HunterClient instance that never touches the network.
+
+    """
+    client = HunterClient(api_key=api_key, config=config)
+    client.session.mount('https://', fake_adapter)
+    return client
+
+
+def endpoints(fake_adapter: FakeHunterAdapter) -> list[str]:
+    """Return the endpoint names of the recorded requests.
+
+    Args:
+        fake_adapter: The fake transport adapter.
+
+    Returns:
+        The last path segment of every request.
+
+    """
+    paths = [urlparse(request.url).path for request in fake_adapter.requests]
+    return [path.rsplit('/', 1)[-1] for path in paths]
+
+
+@pytest.fixture(name='fake_adapter')
+def create_fake_adapter() -> FakeHunterAdapter:
+    """Create a fake transport adapter.
+
+    Returns:
+        A FakeHunterAdapter instance.
+
+    """
+    return FakeHunterAdapter()
+
+
+@pytest.fixture(name='unit_client')
+def create_unit_client(fake_adapter: FakeHunterAdapter) -> HunterClient:
+    """Create a HunterClient whose session talks to the fake adapter.
+
+    Args:
+        fake_adapter: The fake transport adapter.
+
+    Returns:
+        A HunterClient instance that never touches the network.
+
+    """
+    return create_configured_client(fake_adapter)
+
+
+@pytest.fixture(name='fake_async_transport')
+def create_fake_async_transport() -> FakeAsyncTransport:
+    """Create a fake async transport.
+
+    Returns:
+        A FakeAsyncTransport instance.
+
+    """
+    return FakeAsyncTransport()
+
+
+@pytest.fixture(name='async_unit_client')
+def create_async_unit_client(fake_async_transport: FakeAsyncTransport) -> AsyncHunterClient:
+    """Create an AsyncHunterClient whose session talks to the fake transport.
+
+    Args:
+        fake_async_transport: The fake async transport.
+
+    Returns:
+        An AsyncHunterClient instance that never touches the network.
+
+    """
+    client = AsyncHunterClient(api_key='test-key')
+    client.session = httpx.AsyncClient(transport=fake_async_transport)
+    client.sender.session = client.session
+    return client
@@ -0,0 +1,114 @@
+"""Unit tests for the Arrow and Parquet sinks."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+from pyarrow import parquet as pq
+
+from hunter_wrapper.arrow_sink import EmailRecordSink, VerificationSink
+from hunter_wrapper.bulk import verify_many
+from hunter_wrapper.client import HunterClient
+from tests.unit.conftest import FakeHunterAdapter
+
+CONFIDENCE = 94
+
+
+class TestArrowSinks:
+    """Unit tests for the record batch sinks."""
+
+    def test_record_batches_are_bounded(self, tmp_path: Path) -> None:
+        """Test that rows are flushed in batches of the requested size.
+
+        Args:
+            tmp_path: Temporary directory.
+
+        """
+        path = tmp_path / 'emails.arrow'
+        search = {
+            'domain': 'example.com',
+            'emails': [{'value': 'user{0}@example.com'.format(number)} for number in range(5)],
+        }
+
+        with EmailRecordSink(path, batch_size=2, file_format='arrow') as sink:
+            sink.write_search(search)
+
+        reader = pa.ipc.open_file(str(path))
+        batch_sizes = [reader.get_batch(number).num_rows for number in range(reader.num_record_batches)]
+        assert batch_sizes == [2, 2, 1], 'Batches should hold at most two rows'
+
+    def test_verifications_flush_to_parquet(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+        tmp_path: Path,
+    ) -> None:
+        """Test that verify_many results stream into row groups.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+            tmp_path: Temporary directory.
+
+        """
+        fake_adapter.add_reply({'errors': []})
+        path = tmp_path / 'verifications.parquet'
+        emails = ['bad@example.com', 'a@example.com', 'b@example.com']
+
+        with VerificationSink(path, batch_size=2) as sink:
+            for bulk_result in verify_many(unit_client, emails, concurrency=1):
+                sink.write(bulk_result)
+
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).num_row_groups == 2, 'Rows should be flushed two at a time'
+        assert table.column('email').to_pylist() == emails, 'Every result should be written'
+        assert table.column('status').to_pylist()[0] == 'error', 'Failures should be written too'
+
+    def test_email_records_to_arrow_file(self, tmp_path: Path) -> None:
+        """Test that domain search records are written with the fixed schema.
+
+        Args:
+            tmp_path: Temporary directory.
+
+        """
+        path = tmp_path / 'emails.arrow'
+        search = {
+            'domain': 'stripe.com',
+            'emails': [{'value': 'patrick@stripe.com', 'type': 'personal', 'confidence': CONFIDENCE}],
+        }
+
+        with EmailRecordSink(path, file_format='arrow') as sink:
+            sink.write_search(search)
+
+        table = pa.ipc.open_file(str(path)).read_all()
+        assert table.to_pylist()[0]['email'] == 'patrick@stripe.com', 'Record should be written'
+        assert table.column('confidence').type == pa.int32(), 'Schema should be fixed'
+
+    def test_unknown_format_is_rejected(self, tmp_path: Path) -> None:
+        """Test that only Parquet and Arrow files are supported.
+
+        Args:
+            tmp_path: Temporary directory.
+
+        """
+        with pytest.raises(ValueError, match='file_format'):
+            EmailRecordSink(tmp_path / 'emails.csv', file_format='csv')
+
+
+class TestOptionalPyarrow:
+    """Unit tests for running without the analytics dependencies."""
+
+    def test_missing_pyarrow_is_explained(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that importing the module without PyArrow tells how to install it.
+
+        Args:
+            monkeypatch: Pytest fixture hiding PyArrow and the imported module.
+
+        """
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        monkeypatch.delitem(sys.modules, 'hunter_wrapper.arrow_sink')
+
+        with pytest.raises(ImportError, match='requirements-analytics.txt'):
+            importlib.import_module('hunter_wrapper.arrow_sink')
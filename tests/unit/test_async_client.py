@@ -0,0 +1,99 @@
+"""Unit tests for AsyncHunterClient."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.exceptions import HunterAPIError, MissingCompanyError, MissingNameError
+from tests.unit.conftest import FakeAsyncTransport
+
+
+async def lookup_all(client: AsyncHunterClient) -> list:
+    """Run one call per endpoint concurrently and close the client.
+
+    Args:
+        client: The client to use.
+
+    Returns:
+        The results of the three calls.
+
+    """
+    async with client:
+        return await asyncio.gather(
+            client.email_verifier('john@example.com'),
+            client.domain_search(domain='example.com', limit=5),
+            client.email_finder(domain='example.com', full_name='John Doe'),
+        )
+
+
+class TestAsyncHunterClient:
+    """Unit tests for the asyncio client."""
+
+    def test_concurrent_lookups_share_transport(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test that concurrent awaitable calls all go through one client.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        verification, search, finder = asyncio.run(lookup_all(async_unit_client))
+
+        assert verification['email'] == 'john@example.com', 'Verifier should return data'
+        assert isinstance(search, dict), 'Domain search should return data'
+        assert finder == ('john@example.com', 90), 'Finder should return email and score'
+        paths = sorted(request.url.path for request in fake_async_transport.requests)
+        assert paths == ['/v2/domain-search', '/v2/email-finder', '/v2/email-verifier'], 'All calls should be sent'
+
+    def test_raw_response(self, async_unit_client: AsyncHunterClient) -> None:
+        """Test that raw=True returns the httpx response.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+
+        """
+        response = asyncio.run(async_unit_client.email_verifier('john@example.com', raw=True))
+
+        assert isinstance(response, httpx.Response), 'Raw response should be httpx.Response'
+
+    def test_missing_data_raises_api_error(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test that responses without data map to HunterAPIError.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        fake_async_transport.add_reply({'errors': [{'id': 'wrong_params'}]})
+
+        with pytest.raises(HunterAPIError, match='wrong_params'):
+            asyncio.run(async_unit_client.email_verifier('john@example.com'))
+
+    def test_validation_runs_before_request(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test that invalid arguments fail without a request.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        with pytest.raises(MissingCompanyError):
+            asyncio.run(async_unit_client.domain_search())
+        with pytest.raises(MissingNameError):
+            asyncio.run(async_unit_client.email_finder(domain='example.com', first_name='John'))
+
+        assert not fake_async_transport.requests, 'No request should be sent'
@@ -0,0 +1,109 @@
+"""Unit tests for the columnar result batch."""
+
+import importlib
+import math
+import sys
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pytest
+import requests
+
+from hunter_wrapper.batch import ResultBatch, verify_batch
+from hunter_wrapper.client import HunterClient
+from tests.unit.conftest import FakeHunterAdapter
+
+HIGH_SCORE = 90
+LOW_SCORE = 10
+MEAN_SCORE = (HIGH_SCORE + LOW_SCORE) / 2
+
+
+def verifier_reply(request: requests.PreparedRequest) -> dict:
+    """Build a verifier reply whose outcome depends on the address.
+
+    Args:
+        request: The prepared request.
+
+    Returns:
+        A verifier payload; addresses at bounce.io are undeliverable.
+
+    """
+    email = parse_qs(urlparse(request.url).query)['email'][0]
+    if email.endswith('@bounce.io'):
+        verification = {'email': email, 'status': 'invalid', 'result': 'undeliverable', 'score': LOW_SCORE}
+    else:
+        verification = {'email': email, 'status': 'valid', 'result': 'deliverable', 'score': HIGH_SCORE}
+    return {'data': verification, 'meta': {}}
+
+
+class TestResultBatch:
+    """Unit tests for ResultBatch."""
+
+    def test_categorical_columns_use_codes(self) -> None:
+        """Test that repeated labels are stored once with integer codes."""
+        batch = ResultBatch.from_rows(
+            [{'status': 'valid'}, {'status': 'invalid'}, {'status': 'valid'}, {}],
+            categorical=('status',),
+        )
+
+        status = batch.categorical['status']
+        assert status.labels == ('valid', 'invalid', ''), 'Labels should be stored once'
+        assert status.codes.tolist() == [0, 1, 0, 2], 'Rows should hold codes'
+        assert status.decode().tolist() == ['valid', 'invalid', 'valid', ''], 'Codes should decode'
+
+    def test_filter_and_aggregate(self) -> None:
+        """Test masks, counts and grouped means."""
+        batch = ResultBatch.from_rows(
+            [
+                {'domain': 'a.com', 'score': HIGH_SCORE},
+                {'domain': 'a.com', 'score': LOW_SCORE},
+                {'domain': 'b.com', 'score': None},
+            ],
+            numeric=('score',),
+            categorical=('domain',),
+        )
+
+        assert math.isnan(batch.numeric['score'][2]), 'Missing numbers should be NaN'
+        assert batch.counts('domain') == {'a.com': 2, 'b.com': 1}, 'Rows should be counted per label'
+        assert batch.group_mean('domain', 'score') == {'a.com': MEAN_SCORE}, 'NaN should be skipped'
+        assert len(batch.select(batch.equals('domain', 'b.com'))) == 1, 'Mask should select one row'
+        assert not batch.equals('domain', 'c.com').any(), 'Unknown labels match nothing'
+
+
+class TestVerifyBatch:
+    """Unit tests for verify_batch."""
+
+    def test_results_in_input_order(self, unit_client: HunterClient, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that bulk verification lands in columns in input order.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.responder = verifier_reply
+        emails = ['a@stripe.com', 'b@bounce.io', 'c@stripe.com', 'd@bounce.io']
+
+        batch = verify_batch(unit_client, emails, concurrency=3)
+
+        assert batch.text['email'].tolist() == emails, 'Rows should be in input order'
+        assert batch.counts('status') == {'valid': 2, 'invalid': 2}, 'Statuses should be counted'
+        assert batch.group_mean('domain', 'deliverable') == {'stripe.com': 1, 'bounce.io': 0}, 'Per-domain rate'
+        assert np.nanmean(batch.numeric['score']) == MEAN_SCORE, 'Scores should be numeric'
+
+
+class TestOptionalNumpy:
+    """Unit tests for running without the analytics dependencies."""
+
+    def test_missing_numpy_is_explained(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that importing the module without NumPy tells how to install it.
+
+        Args:
+            monkeypatch: Pytest fixture hiding NumPy and the imported module.
+
+        """
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        monkeypatch.delitem(sys.modules, 'hunter_wrapper.batch')
+
+        with pytest.raises(ImportError, match='requirements-analytics.txt'):
+            importlib.import_module('hunter_wrapper.batch')
@@ -0,0 +1,144 @@
+"""Unit tests for bulk lookups and the bounded-concurrency engine."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.bulk import averify_many, verify_many
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.concurrency import BulkResult, run_bounded
+from hunter_wrapper.exceptions import HunterAPIError
+from tests.unit.conftest import FakeAsyncTransport, FakeHunterAdapter
+
+EMAIL_COUNT = 20
+LOOKUP_DELAY = 0.01
+
+
+class InFlightCounter:
+    """Blocking callable recording the peak number of concurrent calls."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query: int) -> int:
+        """Simulate a slow lookup.
+
+        Args:
+            query: The input value.
+
+        Returns:
+            The input value doubled.
+
+        """
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(LOOKUP_DELAY)
+        with self._lock:
+            self.active -= 1
+        return query * 2
+
+
+async def collect(outcomes: object) -> list[BulkResult]:
+    """Drain an async iterator of outcomes.
+
+    Args:
+        outcomes: The async iterator to drain.
+
+    Returns:
+        All outcomes as a list.
+
+    """
+    return [bulk_result async for bulk_result in outcomes]  # type: ignore[attr-defined]
+
+
+class TestVerifyMany:
+    """Unit tests for verify_many and averify_many."""
+
+    def test_results_keep_input_index(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that every result carries the index of its input.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        emails = ['user{0}@example.com'.format(number) for number in range(EMAIL_COUNT)]
+
+        outcomes = list(verify_many(unit_client, emails, concurrency=4))
+
+        indexes = sorted(bulk_result.index for bulk_result in outcomes)
+        assert indexes == list(range(EMAIL_COUNT)), 'All inputs should be answered'
+        assert all(emails[bulk_result.index] == bulk_result.query for bulk_result in outcomes), 'Index should match'
+        assert len(fake_adapter.requests) == len(emails), 'One request per email'
+
+    def test_errors_are_reported_per_item(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that a failed lookup does not abort the job.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': []})
+
+        outcomes = list(verify_many(unit_client, ['bad@example.com', 'good@example.com'], concurrency=1))
+
+        assert isinstance(outcomes[0].error, HunterAPIError), 'First lookup should fail'
+        assert outcomes[1].error is None, 'Second lookup should succeed'
+
+    def test_async_results_keep_input_index(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test the async iterator variant.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        emails = ['user{0}@example.com'.format(number) for number in range(EMAIL_COUNT)]
+
+        outcomes = asyncio.run(collect(averify_many(async_unit_client, emails, concurrency=5)))
+
+        indexes = sorted(bulk_result.index for bulk_result in outcomes)
+        assert indexes == list(range(EMAIL_COUNT)), 'All inputs should be answered'
+        assert len(fake_async_transport.requests) == len(emails), 'One request per email'
+
+
+class TestRunBounded:
+    """Unit tests for the thread-based engine."""
+
+    def test_concurrency_is_bounded(self) -> None:
+        """Test that no more than the requested number of calls overlap."""
+        counter = InFlightCounter()
+
+        query_count = 30
+        outcomes = list(run_bounded(counter, range(query_count), concurrency=3))
+
+        assert len(outcomes) == query_count, 'Every query should produce a result'
+        assert counter.peak <= 3, 'At most three calls should overlap'
+
+    def test_input_is_consumed_lazily(self) -> None:
+        """Test that stopping early leaves the rest of the input untouched."""
+        source = itertools.count()
+
+        first = next(run_bounded(InFlightCounter(), source, concurrency=2))
+
+        assert first.error is None, 'The first lookup should succeed'
+        assert next(source) <= 4, 'Only the in-flight window should be read'
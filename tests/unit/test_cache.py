@@ -0,0 +1,108 @@
+"""Unit tests for the response cache."""
+
+import pytest
+
+from hunter_wrapper.cache import MemoryCache, NullCache, ResponseCache, canonical_key
+from hunter_wrapper.config import ClientConfig
+from tests.unit.conftest import VERIFIER, FakeClock, FakeHunterAdapter, create_configured_client
+
+
+class TestCanonicalKey:
+    """Unit tests for cache key normalization."""
+
+    def test_api_key_and_order_are_ignored(self) -> None:
+        """Test that equivalent queries share a key."""
+        first_key = canonical_key('domain-search', {'domain': 'Stripe.com ', 'limit': 10, 'api_key': 'one'})
+        second_key = canonical_key('domain-search', {'limit': '10', 'api_key': 'two', 'domain': 'stripe.com'})
+
+        assert first_key == second_key, 'Equivalent queries should share a key'
+
+    def test_endpoint_is_part_of_key(self) -> None:
+        """Test that endpoints do not share entries."""
+        query_params = {'domain': 'stripe.com'}
+
+        assert canonical_key('domain-search', query_params) != canonical_key('email-finder', query_params)
+
+
+class TestNullCache:
+    """Unit tests for the cache used when none is configured."""
+
+    def test_nothing_is_stored(self) -> None:
+        """Test that the null cache always misses."""
+        cache = NullCache()
+        cache.set(VERIFIER, {'email': 'john@example.com'}, {'status': 'valid'})
+
+        assert cache.get(VERIFIER, {'email': 'john@example.com'}) is None, 'Null cache should never hit'
+
+    def test_base_class_is_abstract(self) -> None:
+        """Test that the base class needs a storage backend."""
+        with pytest.raises(TypeError):
+            ResponseCache()  # type: ignore[abstract]
+
+
+class TestMemoryCache:
+    """Unit tests for MemoryCache."""
+
+    def test_entries_expire_after_endpoint_ttl(self) -> None:
+        """Test per-endpoint TTL expiry and hit/miss counters."""
+        clock = FakeClock()
+        cache = MemoryCache(ttls={VERIFIER: 60}, clock=clock)
+        cache.set(VERIFIER, {'email': 'john@example.com'}, {'status': 'valid'})
+
+        assert cache.get(VERIFIER, {'email': 'john@example.com'}) == {'status': 'valid'}, 'Fresh entry should hit'
+        clock.now = 61
+        assert cache.get(VERIFIER, {'email': 'john@example.com'}) is None, 'Stale entry should miss'
+        assert (cache.hits, cache.misses) == (1, 1), 'Counters should track lookups'
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test LRU eviction once maxsize is reached."""
+        cache = MemoryCache(maxsize=2)
+        for email in ('a@example.com', 'b@example.com'):
+            cache.set(VERIFIER, {'email': email}, {'email': email})
+        cache.get(VERIFIER, {'email': 'a@example.com'})
+        cache.set(VERIFIER, {'email': 'c@example.com'}, {'email': 'c@example.com'})
+
+        assert len(cache) == 2, 'Cache should stay bounded'
+        assert cache.get(VERIFIER, {'email': 'b@example.com'}) is None, 'Least recently used entry should go'
+        assert cache.get(VERIFIER, {'email': 'a@example.com'}) is not None, 'Recently used entry should stay'
+
+    def test_hits_are_copies(self) -> None:
+        """Test that editing a stored or returned response does not change later hits."""
+        cache = MemoryCache(ttls={VERIFIER: 60})
+        query_params = {'email': 'jane@example.com'}
+        response_data = {'emails': [{'value': 'jane@example.com'}]}
+        cache.set(VERIFIER, query_params, response_data)
+        response_data['emails'].append({'value': 'stored@example.com'})
+        first_hit = cache.get(VERIFIER, query_params)
+        first_hit['emails'].append({'value': 'hit@example.com'})
+
+        expected = {'emails': [{'value': 'jane@example.com'}]}
+        assert cache.get(VERIFIER, query_params) == expected, 'Hits should not share state'
+
+    def test_endpoint_without_ttl_is_not_cached(self) -> None:
+        """Test that endpoints without a TTL bypass the cache."""
+        cache = MemoryCache(ttls={})
+        cache.set(VERIFIER, {'email': 'john@example.com'}, {'status': 'valid'})
+
+        assert not cache, 'Nothing should be stored'
+
+
+class TestClientCache:
+    """Unit tests for the cache in front of _query_hunter."""
+
+    def test_repeated_lookup_is_served_from_cache(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a repeated lookup costs one request.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        cache = MemoryCache()
+        client = create_configured_client(fake_adapter, ClientConfig(cache=cache))
+
+        client.email_verifier('john@example.com')
+        client.email_verifier('John@Example.com')
+        client.email_verifier('john@example.com', raw=True)
+
+        assert len(fake_adapter.requests) == 2, 'Only the first and the raw lookup should be sent'
+        assert cache.hits == 1, 'Second lookup should hit'
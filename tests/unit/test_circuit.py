@@ -0,0 +1,159 @@
+"""Unit tests for the per-endpoint circuit breaker."""
+
+import pytest
+import requests
+
+from hunter_wrapper.circuit import CircuitBreaker, CircuitState
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.exceptions import HunterCircuitOpenError, HunterServerError
+from hunter_wrapper.retry import RetryPolicy
+from tests.unit.conftest import VERIFIER, FakeClock, FakeHunterAdapter, create_configured_client
+
+SERVICE_UNAVAILABLE = 503
+BAD_REQUEST = 400
+SEARCH = 'domain-search'
+
+
+def open_breaker(clock: FakeClock) -> CircuitBreaker:
+    """Create a breaker whose verifier circuit has just opened.
+
+    Args:
+        clock: The time source.
+
+    Returns:
+        A CircuitBreaker with an open verifier circuit.
+
+    """
+    breaker = CircuitBreaker(window_size=4, min_calls=4, cooldown=10, clock=clock)
+    breaker.record_success(VERIFIER)
+    for _ in range(3):
+        breaker.record_failure(VERIFIER)
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Unit tests for CircuitBreaker."""
+
+    def test_opens_on_failure_rate(self) -> None:
+        """Test that the circuit opens once the failure rate is reached."""
+        breaker = open_breaker(FakeClock())
+
+        with pytest.raises(HunterCircuitOpenError) as raised:
+            breaker.before_call(VERIFIER)
+
+        assert raised.value.retry_in == 10, 'Cool-down should be reported'  # noqa: WPS441
+        assert breaker.states() == {VERIFIER: CircuitState.open}, 'State should be exposed'
+        breaker.before_call('domain-search')
+
+    def test_does_not_open_below_min_calls(self) -> None:
+        """Test that a few failures do not open the circuit."""
+        breaker = CircuitBreaker(min_calls=5)
+        for _ in range(4):
+            breaker.record_failure(VERIFIER)
+
+        breaker.before_call(VERIFIER)
+
+        assert breaker.states()[VERIFIER] is CircuitState.closed, 'Circuit should stay closed'
+
+    def test_half_open_trial_closes_on_success(self) -> None:
+        """Test that a successful trial call after the cool-down closes the circuit."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        trial = breaker.before_call(VERIFIER)
+        with pytest.raises(HunterCircuitOpenError):
+            breaker.before_call(VERIFIER)
+        breaker.record_success(VERIFIER, trial=trial)
+
+        assert breaker.states()[VERIFIER] is CircuitState.closed, 'Successful trial should close the circuit'
+
+    def test_half_open_trial_reopens_on_failure(self) -> None:
+        """Test that a failed trial call opens the circuit again."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        trial = breaker.before_call(VERIFIER)
+        breaker.record_failure(VERIFIER, trial=trial)
+
+        assert breaker.states()[VERIFIER] is CircuitState.open, 'Failed trial should reopen the circuit'
+
+    def test_released_trial_lets_next_trial_through(self) -> None:
+        """Test that a trial failing before it reaches the API does not strand the circuit."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now = 10
+
+        breaker.before_call(VERIFIER)
+        breaker.release_trial(VERIFIER)
+        breaker.before_call(VERIFIER)
+
+        assert breaker.states()[VERIFIER] is CircuitState.half_open, 'Next trial should be let through'
+
+    def test_only_trial_call_decides(self) -> None:
+        """Test that a call let through before the circuit opened cannot close or free it."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(window_size=4, min_calls=4, cooldown=10, clock=clock)
+        early = breaker.before_call(SEARCH)
+        for _ in range(4):
+            breaker.record_failure(SEARCH)
+        clock.now = 10
+        trial = breaker.before_call(SEARCH)
+
+        breaker.record_success(SEARCH, trial=early)
+        with pytest.raises(HunterCircuitOpenError):
+            breaker.before_call(SEARCH)
+
+        assert trial and not early, 'Only the call after the cool-down should be the trial'
+        assert breaker.states()[SEARCH] is CircuitState.half_open, 'Early call should not close the circuit'
+
+
+class TestClientCircuitBreaker:
+    """Unit tests for the circuit breaker in HunterClient."""
+
+    def test_open_circuit_fails_fast(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that no request is sent while the circuit is open.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        for _ in range(2):
+            fake_adapter.add_reply({'errors': []}, status_code=SERVICE_UNAVAILABLE)
+        config = ClientConfig(
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(min_calls=2),
+        )
+        client = create_configured_client(fake_adapter, config)
+
+        for _ in range(2):
+            with pytest.raises(HunterServerError):
+                client.email_verifier('john@example.com')
+        with pytest.raises(HunterCircuitOpenError):
+            client.email_verifier('john@example.com')
+
+        assert len(fake_adapter.requests) == 2, 'Open circuit should not send requests'
+
+    def test_rejected_trial_call_closes_circuit(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a trial call answered with a client error closes the circuit.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, cooldown=10, clock=clock)
+        fake_adapter.add_reply({'errors': []}, status_code=SERVICE_UNAVAILABLE)
+        fake_adapter.add_reply({'errors': []}, status_code=BAD_REQUEST)
+        config = ClientConfig(retry_policy=RetryPolicy(max_attempts=1), circuit_breaker=breaker)
+        client = create_configured_client(fake_adapter, config)
+
+        with pytest.raises(HunterServerError):
+            client.email_verifier('john@example.com')
+        clock.now = 10
+        with pytest.raises(requests.HTTPError):
+            client.email_verifier('john@example.com')
+        client.email_verifier('john@example.com')
+
+        assert breaker.states()[VERIFIER] is CircuitState.closed, 'API answered the trial call'
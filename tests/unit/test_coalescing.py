@@ -0,0 +1,143 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.coalescing import SingleFlight
+from hunter_wrapper.exceptions import HunterAPIError
+from tests.unit.conftest import FakeAsyncTransport
+
+CALLERS = 5
+POLL_INTERVAL = 0.001
+
+
+class GatedCall:
+    """Callable that blocks until released and counts its invocations."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Initialize the gate.
+
+        Args:
+            error: Exception to raise instead of returning.
+
+        """
+        self.calls = 0
+        self.release = threading.Event()
+        self._error = error
+
+    def __call__(self) -> dict:
+        """Wait for the release and return or raise.
+
+        Returns:
+            A fixed response.
+
+        Raises:
+            Exception: The configured error.  # noqa: DAR402
+
+        """
+        self.calls += 1
+        self.release.wait()
+        if self._error is not None:
+            raise self._error
+        return {'domain': 'stripe.com'}
+
+
+def run_callers(flight: SingleFlight, gated_call: GatedCall) -> list:
+    """Call flight.run from several threads at once.
+
+    Args:
+        flight: The single-flight group.
+        gated_call: The shared callable.
+
+    Returns:
+        The futures of every caller.
+
+    """
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(flight.run, 'stripe.com', gated_call) for _ in range(CALLERS)]
+        while flight.coalesced < CALLERS - 1:
+            threading.Event().wait(POLL_INTERVAL)
+        gated_call.release.set()
+    return futures
+
+
+async def verify_concurrently(client: AsyncHunterClient) -> list:
+    """Run identical verifications concurrently.
+
+    Args:
+        client: The async client.
+
+    Returns:
+        The results of every call.
+
+    """
+    lookups = [client.email_verifier('john@example.com') for _ in range(CALLERS)]
+    return await asyncio.gather(*lookups)
+
+
+def raise_api_error() -> dict:
+    """Raise a HunterAPIError.
+
+    Raises:
+        HunterAPIError: Always.
+
+    """
+    raise HunterAPIError()
+
+
+class TestSingleFlight:
+    """Unit tests for the threaded single-flight group."""
+
+    def test_concurrent_callers_share_one_call(self) -> None:
+        """Test that identical concurrent calls run once."""
+        gated_call = GatedCall()
+
+        futures = run_callers(SingleFlight(), gated_call)
+
+        assert gated_call.calls == 1, 'The call should run once'
+        assert all(future.result() == {'domain': 'stripe.com'} for future in futures), 'All callers share the result'
+
+    def test_concurrent_callers_share_the_error(self) -> None:
+        """Test that every caller receives the same exception."""
+        error = HunterAPIError('quota exceeded')
+        gated_call = GatedCall(error)
+
+        futures = run_callers(SingleFlight(), gated_call)
+
+        assert gated_call.calls == 1, 'The call should run once'
+        assert all(future.exception() is error for future in futures), 'All callers share the error'
+
+    def test_later_calls_start_a_new_flight(self) -> None:
+        """Test that a finished call is not reused."""
+        flight = SingleFlight()
+
+        flight.run('stripe.com', dict)
+        with pytest.raises(HunterAPIError):
+            flight.run('stripe.com', raise_api_error)
+
+        assert flight.coalesced == 0, 'Sequential calls should not be coalesced'
+
+
+class TestAsyncCoalescing:
+    """Unit tests for coalescing in AsyncHunterClient."""
+
+    def test_identical_lookups_send_one_request(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test that concurrent identical calls share one request.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        verifications = asyncio.run(verify_concurrently(async_unit_client))
+
+        assert len(fake_async_transport.requests) == 1, 'One request should be sent'
+        assert all(verification is verifications[0] for verification in verifications), 'Result should be shared'
@@ -0,0 +1,165 @@
+"""Unit tests for the account endpoint and the credit scheduler."""
+
+import asyncio
+
+import pytest
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.bulk import verify_many
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.credits import SEARCHES, VERIFICATIONS, CreditBudget, CreditScheduler
+from hunter_wrapper.deadline import Deadline, TimeoutConfig
+from hunter_wrapper.exceptions import HunterCreditsExhaustedError, HunterDeadlineExceededError
+from tests.unit.conftest import (
+    VERIFIER,
+    FakeAsyncTransport,
+    FakeClock,
+    FakeHunterAdapter,
+    create_configured_client,
+    endpoints,
+)
+
+FINDER = 'email-finder'
+HOURLY_BUDGET = 2
+SECONDS_PER_HOUR = 3600
+RECONCILE_INTERVAL = 60
+AVAILABLE = 100
+USED = 40
+FORBIDDEN = 403
+SHORT_BUDGET = 0.05
+
+
+def account_payload(verifications_left: int) -> dict:
+    """Build an account endpoint reply.
+
+    Args:
+        verifications_left: Verification credits left this month.
+
+    Returns:
+        An account payload with search and verification usage.
+
+    """
+    return {
+        'data': {
+            'plan_name': 'Starter',
+            'requests': {
+                SEARCHES: {'used': USED, 'available': AVAILABLE},
+                VERIFICATIONS: {'used': AVAILABLE - verifications_left, 'available': AVAILABLE},
+            },
+        },
+    }
+
+
+class TestCreditScheduler:
+    """Unit tests for CreditScheduler."""
+
+    def test_hourly_budget_pauses_until_next_window(self) -> None:
+        """Test that a spent hourly budget makes calls wait for the next hour."""
+        clock = FakeClock()
+        scheduler = CreditScheduler({VERIFICATIONS: CreditBudget(per_hour=HOURLY_BUDGET)}, clock=clock)
+
+        spent = [scheduler.acquire(VERIFIER) for _ in range(HOURLY_BUDGET)]
+        with Deadline(0):
+            assert not scheduler.acquire(VERIFIER), 'Spent budget should need a wait'
+            assert scheduler.acquire(FINDER), 'Searches have no budget'
+        clock.now = SECONDS_PER_HOUR
+
+        assert all(spent), 'Budget should allow the first calls'
+        assert scheduler.acquire(VERIFIER), 'A new hour should have a fresh budget'
+
+    def test_reconcile_and_exhaustion(self) -> None:
+        """Test that reconciled counts are decremented locally until exhausted."""
+        scheduler = CreditScheduler(clock=FakeClock())
+        scheduler.reconcile(account_payload(verifications_left=1)['data'])
+
+        assert scheduler.remaining[SEARCHES] == AVAILABLE - USED, 'Searches left should be known'
+        assert scheduler.acquire(VERIFIER), 'Last credit should be spent'
+        with pytest.raises(HunterCreditsExhaustedError):
+            scheduler.acquire(VERIFIER)
+
+    def test_reconcile_interval(self) -> None:
+        """Test that one caller per interval is told to reconcile."""
+        clock = FakeClock()
+        scheduler = CreditScheduler(reconcile_every=RECONCILE_INTERVAL, clock=clock)
+
+        first = scheduler.start_reconcile(VERIFIER)
+        second = scheduler.start_reconcile(VERIFIER)
+        clock.now = RECONCILE_INTERVAL
+
+        assert (first, second) == (True, False), 'Only the first caller should reconcile'
+        assert not CreditScheduler().start_reconcile('account'), 'Free endpoints never reconcile'
+        assert scheduler.start_reconcile(VERIFIER), 'Reconcile again after the interval'
+
+
+class TestClientCredits:
+    """Unit tests for credit tracking in HunterClient."""
+
+    def test_account_information(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test the account endpoint and the reconciliation before the first paid call.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        scheduler = CreditScheduler()
+        client = create_configured_client(fake_adapter, ClientConfig(credit_scheduler=scheduler))
+        fake_adapter.add_reply(account_payload(verifications_left=AVAILABLE))
+
+        client.email_verifier('john@example.com')
+        client.email_verifier('jane@example.com')
+
+        assert endpoints(fake_adapter) == ['account', VERIFIER, VERIFIER], 'Account should be fetched once'
+        assert scheduler.remaining[VERIFICATIONS] == AVAILABLE - 2, 'Each verification should be counted'
+
+    def test_failed_reconciliation_keeps_local_count(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that an account call answered with a client error does not abort the paid call.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        scheduler = CreditScheduler()
+        client = create_configured_client(fake_adapter, ClientConfig(credit_scheduler=scheduler))
+        fake_adapter.add_reply({'errors': [{'details': 'Forbidden'}]}, status_code=FORBIDDEN)
+
+        client.email_verifier('john@example.com')
+
+        assert endpoints(fake_adapter) == ['account', VERIFIER], 'Paid call should still be sent'
+        assert not scheduler.remaining, 'Local count should be kept'
+
+    def test_async_failed_reconciliation(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test the async variant.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        async_unit_client.sender.credits = CreditScheduler()
+        fake_async_transport.add_reply({'errors': [{'details': 'Forbidden'}]}, status_code=FORBIDDEN)
+
+        asyncio.run(async_unit_client.email_verifier('john@example.com'))
+
+        assert len(fake_async_transport.requests) == 2, 'Paid call should still be sent'
+
+    def test_bulk_job_pauses_on_budget(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a bulk job waits for the budget within the call deadline.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        scheduler = CreditScheduler({VERIFICATIONS: CreditBudget(per_hour=1)}, reconcile_every=None)
+        config = ClientConfig(credit_scheduler=scheduler, timeout=TimeoutConfig(total=SHORT_BUDGET))
+        client = create_configured_client(fake_adapter, config)
+
+        outcomes = list(verify_many(client, ['john@example.com', 'jane@example.com'], concurrency=1))
+
+        outcomes.sort(key=lambda outcome: outcome.index)
+        errors = [type(outcome.error) for outcome in outcomes]
+        assert errors == [type(None), HunterDeadlineExceededError], 'Second call should wait past its deadline'
+        assert len(fake_adapter.requests) == 1, 'Only the budgeted call should be sent'
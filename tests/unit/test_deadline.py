@@ -0,0 +1,110 @@
+"""Unit tests for timeouts and call deadlines."""
+
+import threading
+
+import pytest
+
+from hunter_wrapper.coalescing import SingleFlight
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.deadline import Deadline, TimeoutConfig, remaining_time
+from hunter_wrapper.exceptions import HunterDeadlineExceededError, HunterRateLimitError
+from hunter_wrapper.ratelimit import RateLimiter
+from tests.unit.conftest import VERIFIER, FakeHunterAdapter, create_configured_client
+
+TOO_MANY_REQUESTS = 429
+SHORT_BUDGET = 0.05
+DEFAULT_READ_TIMEOUT = 30
+
+
+class TestDeadline:
+    """Unit tests for Deadline and TimeoutConfig."""
+
+    def test_nested_deadline_cannot_extend(self) -> None:
+        """Test that an inner budget never outlives the outer one."""
+        with Deadline(1):
+            with Deadline(100):
+                inner_remaining = remaining_time()
+            with Deadline(None):
+                inherited_remaining = remaining_time()
+
+        assert inner_remaining is not None and inner_remaining <= 1, 'Outer budget should win'
+        assert inherited_remaining is not None and inherited_remaining <= 1, 'None should inherit the budget'
+        assert remaining_time() is None, 'Budget should end with the block'
+
+    def test_attempt_timeouts_are_clipped_to_budget(self) -> None:
+        """Test that per-attempt timeouts never exceed the remaining budget."""
+        timeout = TimeoutConfig(connect=5, read=DEFAULT_READ_TIMEOUT)
+
+        with Deadline(2):
+            connect_timeout, read_timeout = timeout.for_attempt()
+
+        assert connect_timeout <= 2 and read_timeout <= 2, 'Timeouts should be clipped'
+        assert timeout.for_attempt() == (5, DEFAULT_READ_TIMEOUT), 'Client timeouts apply without a deadline'
+
+    def test_expired_budget_raises(self) -> None:
+        """Test that no attempt starts once the budget is used up."""
+        with Deadline(0):
+            with pytest.raises(HunterDeadlineExceededError):
+                TimeoutConfig().for_attempt()
+
+
+class TestClientDeadlines:
+    """Unit tests for deadlines in HunterClient."""
+
+    def test_client_timeouts_reach_the_transport(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that connect/read timeouts are passed on each request.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(timeout=TimeoutConfig(connect=2, read=7)))
+
+        client.email_verifier('john@example.com')
+
+        assert fake_adapter.timeouts == [(2, 7)], 'Timeouts should be passed to requests'
+
+    def test_rate_limit_wait_is_bounded_by_budget(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a long rate-limit wait fails fast inside a deadline.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        config = ClientConfig(rate_limiter=RateLimiter(rates={VERIFIER: 1}))
+        client = create_configured_client(fake_adapter, config)
+        client.email_verifier('first@example.com')
+
+        with Deadline(SHORT_BUDGET):
+            with pytest.raises(HunterDeadlineExceededError):
+                client.email_verifier('second@example.com')
+
+    def test_retry_wait_is_bounded_by_budget(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a Retry-After beyond the budget is not waited for.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': []}, status_code=TOO_MANY_REQUESTS, headers={'Retry-After': '10'})
+        client = create_configured_client(fake_adapter, ClientConfig(timeout=TimeoutConfig(total=1)))
+
+        with pytest.raises(HunterRateLimitError):
+            client.email_verifier('john@example.com')
+
+        assert len(fake_adapter.requests) == 1, 'No retry should be made'
+
+    def test_coalescing_wait_is_bounded_by_budget(self) -> None:
+        """Test that a waiter gives up on a slow coalesced call."""
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.run, args=('stripe.com', release.wait))
+        leader.start()
+        while not flight._calls:  # noqa: WPS437
+            threading.Event().wait(SHORT_BUDGET)
+
+        with Deadline(SHORT_BUDGET):
+            with pytest.raises(HunterDeadlineExceededError):
+                flight.run('stripe.com', dict)
+        release.set()
+        leader.join()
@@ -0,0 +1,135 @@
+"""Unit tests for response decoding."""
+
+import json
+from dataclasses import dataclass
+
+import msgspec
+import orjson
+import pytest
+
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.decoding import ResponseDecoder, default_loads
+from hunter_wrapper.exceptions import HunterAPIError
+from hunter_wrapper.models import VerificationResult
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client
+
+SCORE = 90
+FULL_BODY = b'{"data": {"email": "john@example.com", "score": 90, "result": "deliverable", "sources": []}}'
+
+
+class FinderData(msgspec.Struct):
+    """Typed email finder data used by the tests."""
+
+    email: str
+    score: int
+
+
+@dataclass(frozen=True)
+class FinderFields:
+    """Typed email finder data declaring only some of the response fields."""
+
+    email: str
+    score: int
+
+
+class CountingLoads:
+    """JSON parser counting how often it is called."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.calls = 0
+
+    def __call__(self, body: bytes) -> dict:
+        """Parse a body with the standard library.
+
+        Args:
+            body: The JSON body.
+
+        Returns:
+            The decoded document.
+
+        """
+        self.calls += 1
+        return json.loads(body)
+
+
+class TestResponseDecoder:
+    """Unit tests for ResponseDecoder."""
+
+    def test_fastest_parser_is_default(self) -> None:
+        """Test that orjson is preferred when installed."""
+        assert default_loads() is orjson.loads, 'orjson should be the default parser'
+        assert ResponseDecoder().loads is orjson.loads, 'Decoder should use the default parser'
+
+    def test_decode_data(self) -> None:
+        """Test that the 'data' member is returned."""
+        body = b'{"data": {"email": "john@example.com", "score": 90}, "meta": {}}'
+
+        assert ResponseDecoder().decode_data(body)['score'] == SCORE, 'Data should be decoded'
+
+    def test_invalid_json_raises_api_error(self) -> None:
+        """Test that a body that is not JSON raises HunterAPIError."""
+        with pytest.raises(HunterAPIError, match='Invalid JSON'):
+            ResponseDecoder().decode_data(b'<html>Bad gateway</html>')
+
+    def test_error_payload_raises_api_error(self) -> None:
+        """Test that an error payload is surfaced in HunterAPIError."""
+        with pytest.raises(HunterAPIError, match='errors'):
+            ResponseDecoder().decode_data(b'{"errors": [{"id": "wrong_params"}]}')
+
+    def test_decode_into_struct(self) -> None:
+        """Test that data is decoded straight into a typed struct."""
+        body = b'{"data": {"email": "john@example.com", "score": 90}, "meta": {}}'
+
+        finder_data = ResponseDecoder().decode_into(body, FinderData)
+
+        assert finder_data == FinderData(email='john@example.com', score=SCORE), 'Struct should be decoded'
+
+    def test_decode_into_surfaces_api_errors(self) -> None:
+        """Test that typed decoding of an error payload raises HunterAPIError."""
+        with pytest.raises(HunterAPIError, match='errors'):
+            ResponseDecoder().decode_into(b'{"errors": []}', FinderData)
+        with pytest.raises(HunterAPIError, match='Unexpected response data'):
+            ResponseDecoder().decode_into(b'{"data": {"email": 1}}', FinderData)
+
+
+class TestDecodeIntoFallbacks:
+    """Unit tests for decode_into targets not decoded by msgspec."""
+
+    def test_decode_into_without_msgspec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the fallback that builds dataclasses from their declared fields.
+
+        Args:
+            monkeypatch: Pytest fixture patching the optional dependency.
+
+        """
+        monkeypatch.setattr('hunter_wrapper.decoding.msgspec', None)
+
+        finder_data = ResponseDecoder().decode_into(FULL_BODY, FinderFields)
+
+        assert finder_data == FinderFields(email='john@example.com', score=SCORE), 'Extra fields should be dropped'
+        with pytest.raises(HunterAPIError, match='Unexpected response data'):
+            ResponseDecoder().decode_into(b'{"data": {"email": "john@example.com"}}', FinderFields)
+
+    def test_decode_into_model(self) -> None:
+        """Test that result models are built with their from_dict."""
+        verification = ResponseDecoder().decode_into(FULL_BODY, VerificationResult)
+
+        assert verification.deliverability == 'deliverable', 'API field names should be mapped'
+
+
+class TestClientDecoding:
+    """Unit tests for decoding in HunterClient."""
+
+    def test_body_is_parsed_once(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that each response body is parsed exactly once.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        loads = CountingLoads()
+        client = create_configured_client(fake_adapter, ClientConfig(decoder=ResponseDecoder(loads)))
+
+        assert client.email_finder(domain='example.com', full_name='John Doe') == ('john@example.com', SCORE)
+        assert loads.calls == 1, 'Body should be parsed once'
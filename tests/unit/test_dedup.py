@@ -0,0 +1,276 @@
+"""Unit tests for the deduplication stage of bulk lookups."""
+
+import asyncio
+from collections.abc import Iterator
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.bulk import afind_many, averify_many, find_many, verify_many
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.concurrency import BulkResult
+from hunter_wrapper.dedup import Deduplication, finder_key
+from hunter_wrapper.exceptions import HunterAPIError
+from tests.unit.conftest import FakeAsyncTransport, FakeHunterAdapter
+
+DUPLICATED_EMAILS = (
+    'john@example.com',
+    'jane@example.com',
+    ' John@Example.com',
+    'JANE@example.com',
+    'john@example.com',
+)
+UNIQUE_EMAILS = 2
+DUPLICATE_RATIO = 0.6
+LONG_JOB = 200000
+LOOKAHEAD = 10
+
+
+async def collect(outcomes: object) -> list[BulkResult]:
+    """Drain an async iterator of outcomes.
+
+    Args:
+        outcomes: The async iterator to drain.
+
+    Returns:
+        All outcomes as a list.
+
+    """
+    return [bulk_result async for bulk_result in outcomes]  # type: ignore[attr-defined]
+
+
+async def first(outcomes: object) -> BulkResult:
+    """Take the first outcome of an async iterator and close it.
+
+    Args:
+        outcomes: The async generator of outcomes.
+
+    Returns:
+        The first outcome.
+
+    """
+    bulk_result = await anext(outcomes)  # type: ignore[call-overload]
+    await outcomes.aclose()  # type: ignore[attr-defined]
+    return bulk_result
+
+
+class CountingInput:
+    """Endless-looking input of two alternating addresses counting how far it was read."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the input.
+
+        Args:
+            size: Number of addresses to produce.
+
+        """
+        self.size = size
+        self.read = 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the addresses, counting every read.
+
+        Yields:
+            The addresses.
+
+        """
+        for index in range(self.size):
+            self.read += 1
+            yield DUPLICATED_EMAILS[index % UNIQUE_EMAILS]
+
+
+def person_rows() -> list[dict]:
+    """Build finder rows for one person spelled three ways, and another person.
+
+    Returns:
+        The rows.
+
+    """
+    return [
+        {'domain': 'example.com', 'first_name': 'José', 'last_name': 'Núñez'},
+        {'domain': 'Example.com', 'full_name': 'jose nunez'},
+        {'domain': 'example.com', 'first_name': 'Jane', 'last_name': 'Doe'},
+        {'domain': 'example.com ', 'first_name': 'JOSE', 'last_name': 'NUNEZ', 'crm_id': '7'},
+    ]
+
+
+class TestVerifyManyDeduplication:
+    """Unit tests for duplicate addresses in verify_many."""
+
+    def test_duplicates_share_one_lookup(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that each unique address is verified once and fanned out.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        deduplication = Deduplication()
+
+        outcomes = list(verify_many(unit_client, DUPLICATED_EMAILS, concurrency=2, deduplication=deduplication))
+
+        assert len(fake_adapter.requests) == UNIQUE_EMAILS, 'One request per unique address'
+        indexes = sorted(outcome.index for outcome in outcomes)
+        assert indexes == list(range(len(DUPLICATED_EMAILS))), 'Every input should be answered'
+        queries = {outcome.index: outcome.query for outcome in outcomes}
+        assert tuple(queries[index] for index in indexes) == DUPLICATED_EMAILS, 'Own query is kept'
+        assert deduplication.duplicate_ratio == DUPLICATE_RATIO, 'Three of five inputs are duplicates'
+
+    def test_duplicates_after_lookup_finished(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that a failed lookup is not reused for a duplicate read after it finished.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': []})
+        emails = ['flaky@example.com', 'good@example.com', 'other@example.com', 'flaky@example.com']
+
+        outcomes = list(verify_many(unit_client, emails, concurrency=1))
+        outcomes.sort(key=lambda outcome: outcome.index)
+
+        assert len(fake_adapter.requests) == len(emails), 'Failed address should be looked up again'
+        assert isinstance(outcomes[0].error, HunterAPIError), 'First lookup should fail'
+        assert outcomes[-1].error is None, 'Late duplicate should get a fresh result'
+
+    def test_malformed_input_is_reported(self, unit_client: HunterClient) -> None:
+        """Test that an input without a key fails on its own result instead of ending the job.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+
+        """
+        outcomes = list(verify_many(unit_client, ['john@example.com', None]))  # type: ignore[list-item]
+        outcomes.sort(key=lambda outcome: outcome.index)
+
+        assert outcomes[0].error is None, 'Valid address should succeed'
+        assert outcomes[1].error is not None, 'Malformed input should report its error'
+
+    def test_deduplication_can_be_disabled(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that every input is sent when deduplication is off.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        deduplication = Deduplication(enabled=False)
+
+        # One request at a time, so identical lookups are not coalesced either
+        list(verify_many(unit_client, DUPLICATED_EMAILS, concurrency=1, deduplication=deduplication))
+
+        assert len(fake_adapter.requests) == len(DUPLICATED_EMAILS), 'Every input should be sent'
+        assert deduplication.duplicate_ratio == 0, 'Nothing is counted when disabled'
+
+    def test_input_is_consumed_lazily(self, unit_client: HunterClient) -> None:
+        """Test that duplicates do not make the job read ahead of its results.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+
+        """
+        emails = CountingInput(LONG_JOB)
+        outcomes = verify_many(unit_client, emails, concurrency=2, deduplication=Deduplication(lookahead=LOOKAHEAD))
+
+        for _ in range(LOOKAHEAD):
+            next(outcomes)
+
+        assert emails.read < LOOKAHEAD * 4, 'Only a bounded look-ahead should be read'
+
+    def test_async_input_is_consumed_lazily(self, async_unit_client: AsyncHunterClient) -> None:
+        """Test that the async variant does not read the whole input on the event loop.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+
+        """
+        emails = CountingInput(LONG_JOB)
+        deduplication = Deduplication(lookahead=LOOKAHEAD)
+
+        asyncio.run(first(averify_many(async_unit_client, emails, concurrency=2, deduplication=deduplication)))
+
+        assert emails.read < LOOKAHEAD * 4, 'Only a bounded look-ahead should be read'
+
+    def test_forgotten_results_are_looked_up_again(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that only max_done finished results are remembered.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        emails = ['john@example.com', 'jane@example.com', 'jack@example.com', 'john@example.com']
+        deduplication = Deduplication(max_done=1)
+
+        outcomes = list(verify_many(unit_client, emails, concurrency=1, deduplication=deduplication))
+
+        assert len(outcomes) == len(emails), 'Every input should be answered'
+        assert len(fake_adapter.requests) == len(emails), 'Forgotten address should be verified again'
+
+
+class TestFindManyDeduplication:
+    """Unit tests for duplicate people in find_many."""
+
+    def test_finder_key_normalizes_names(self) -> None:
+        """Test that spellings of one person share a key."""
+        keys = {finder_key(row) for row in person_rows()}
+
+        assert len(keys) == UNIQUE_EMAILS, 'Equivalent rows should share a key'
+
+    def test_finder_key_follows_client_setting(self) -> None:
+        """Test that names are compared as given when the client does not normalize them."""
+        keys = {finder_key(row, normalize=False) for row in person_rows()}
+
+        assert len(keys) == len(person_rows()), 'Spellings should not be merged'
+
+    def test_duplicate_people_share_one_lookup(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that rows for the same person cost one request.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        outcomes = list(find_many(unit_client, person_rows(), concurrency=2))
+
+        assert len(outcomes) == len(person_rows()), 'Every row should be answered'
+        assert len(fake_adapter.requests) == UNIQUE_EMAILS, 'One request per person'
+
+    def test_async_duplicate_people(
+        self,
+        async_unit_client: AsyncHunterClient,
+        fake_async_transport: FakeAsyncTransport,
+    ) -> None:
+        """Test the async variant.
+
+        Args:
+            async_unit_client: Async client wired to the fake transport.
+            fake_async_transport: The fake async transport.
+
+        """
+        deduplication = Deduplication()
+
+        outcomes = asyncio.run(collect(afind_many(async_unit_client, person_rows(), deduplication=deduplication)))
+
+        assert len(outcomes) == len(person_rows()), 'Every row should be answered'
+        assert len(fake_async_transport.requests) == UNIQUE_EMAILS, 'One request per person'
+        assert deduplication.duplicates == UNIQUE_EMAILS, 'Two rows repeat the first person'
@@ -0,0 +1,131 @@
+"""Unit tests for the priority dispatcher."""
+
+import threading
+import time
+
+from hunter_wrapper.bulk import verify_many
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.dispatch import BATCH, INTERACTIVE, ClassMetrics, Priority, PriorityDispatcher
+from tests.unit.conftest import VERIFIER, FakeHunterAdapter, create_configured_client
+
+RATE = 20
+BACKLOG = 2
+BATCH_CALLS = 3
+FAST_RATE = 1000
+POLL_DELAY = 0.001
+
+
+def drained_dispatcher() -> PriorityDispatcher:
+    """Create a dispatcher whose verifier bucket is a few tokens in debt.
+
+    Returns:
+        A dispatcher with no verifier token for (RATE + BACKLOG) / RATE seconds.
+
+    """
+    dispatcher = PriorityDispatcher(rates={VERIFIER: RATE})
+    for _ in range(RATE + BACKLOG):
+        dispatcher.buckets[VERIFIER].reserve()
+    return dispatcher
+
+
+def wait_until_queued(dispatcher: PriorityDispatcher, class_name: str, count: int) -> None:
+    """Wait until a number of calls of a class are queued.
+
+    Args:
+        dispatcher: The dispatcher.
+        class_name: The priority class.
+        count: The number of queued calls to wait for.
+
+    """
+    while dispatcher.class_metrics().get(class_name, ClassMetrics()).queued < count:
+        time.sleep(POLL_DELAY)
+
+
+class PriorityCaller:
+    """Take verifier tokens in a priority class, recording the grant order."""
+
+    def __init__(self, dispatcher: PriorityDispatcher) -> None:
+        """Initialize the caller.
+
+        Args:
+            dispatcher: The dispatcher to take tokens from.
+
+        """
+        self.dispatcher = dispatcher
+        self.granted: list[str] = []
+
+    def __call__(self, class_name: str) -> None:
+        """Wait for a token as a call of class_name.
+
+        Args:
+            class_name: The priority class.
+
+        """
+        with Priority(class_name):
+            self.dispatcher.acquire(VERIFIER)
+        self.granted.append(class_name)
+
+    def start(self, class_name: str) -> threading.Thread:
+        """Wait for a token in a new thread.
+
+        Args:
+            class_name: The priority class.
+
+        Returns:
+            The started thread.
+
+        """
+        thread = threading.Thread(target=self, args=(class_name,))
+        thread.start()
+        return thread
+
+
+class TestPriorityDispatcher:
+    """Unit tests for PriorityDispatcher."""
+
+    def test_interactive_calls_overtake_batch_calls(self) -> None:
+        """Test that a waiting interactive call gets the next token."""
+        dispatcher = drained_dispatcher()
+        caller = PriorityCaller(dispatcher)
+
+        threads = [caller.start(BATCH) for _ in range(BATCH_CALLS)]
+        wait_until_queued(dispatcher, BATCH, BATCH_CALLS)
+        threads.append(caller.start(INTERACTIVE))
+        for thread in threads:
+            thread.join()
+
+        metrics = dispatcher.class_metrics()
+        assert caller.granted[0] == INTERACTIVE, 'Interactive call should be served before queued batch calls'
+        assert metrics[BATCH].max_queued == BATCH_CALLS, 'Batch queue depth should be recorded'
+        assert metrics[INTERACTIVE].max_wait < metrics[BATCH].max_wait, 'Interactive wait should be shorter'
+
+    def test_deadline_leaves_the_queue(self) -> None:
+        """Test that a call whose wait exceeds its timeout gives up."""
+        dispatcher = drained_dispatcher()
+
+        assert not dispatcher.acquire(VERIFIER, timeout=0), 'No token is available in time'
+        metrics = dispatcher.class_metrics()[INTERACTIVE]
+        assert (metrics.queued, metrics.rejected) == (0, 1), 'Call should leave the queue'
+        assert dispatcher.acquire('account', timeout=0), 'Endpoints without a rate are not queued'
+
+
+class TestClientDispatch:
+    """Unit tests for priority classes of client calls."""
+
+    def test_bulk_jobs_run_as_batch(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that bulk lookups are batch calls and direct calls interactive.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        dispatcher = PriorityDispatcher(rates={VERIFIER: FAST_RATE})
+        client = create_configured_client(fake_adapter, ClientConfig(rate_limiter=dispatcher))
+        emails = ['user{0}@example.com'.format(number) for number in range(BATCH_CALLS)]
+
+        list(verify_many(client, emails))
+        client.email_verifier('john@example.com')
+
+        metrics = dispatcher.class_metrics()
+        assert metrics[BATCH].granted == BATCH_CALLS, 'Bulk lookups should be batch calls'
+        assert metrics[INTERACTIVE].granted == 1, 'Direct calls should be interactive'
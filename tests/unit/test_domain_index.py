@@ -0,0 +1,103 @@
+"""Unit tests for the webmail and disposable domain index."""
+
+import pytest
+
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.domain_index import DomainIndex
+from hunter_wrapper.exceptions import HunterSkippedDomainError
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client
+
+
+class TestDomainIndex:
+    """Unit tests for DomainIndex."""
+
+    def test_bundled_lists(self) -> None:
+        """Test that the shipped lists are loaded and match subdomains."""
+        index = DomainIndex.bundled()
+
+        assert index.classify('gmail.com') == 'webmail', 'gmail.com is webmail'
+        assert index.classify('EU.Mailinator.com.') == 'disposable', 'Subdomains should match'
+        assert index.classify('stripe.com') is None, 'Company domains are not listed'
+
+    def test_learns_from_domain_search(self) -> None:
+        """Test that domain_search flags update the index."""
+        index = DomainIndex.bundled()
+
+        index.observe({'domain': 'newmail.io', 'webmail': True, 'disposable': False})
+        index.observe({'domain': 'gmail.com', 'webmail': False, 'disposable': False})
+
+        assert index.classify('newmail.io') == 'webmail', 'Observed webmail domain should be learned'
+        assert index.classify('gmail.com') is None, 'Observed flags override the bundled lists'
+
+    def test_only_differences_are_kept(self) -> None:
+        """Test that observations matching the lists are not stored and old ones are evicted."""
+        index = DomainIndex.bundled(maxsize=2)
+
+        index.observe({'domain': 'stripe.com', 'webmail': False, 'disposable': False})
+        index.observe({'domain': 'gmail.com', 'webmail': True, 'disposable': False})
+        assert not index, 'Observations matching the lists should not be stored'
+
+        for domain in ('one.io', 'two.io', 'three.io'):
+            index.observe({'domain': domain, 'disposable': True})
+
+        assert len(index) == 2, 'Learned domains should stay bounded'
+        assert index.classify('one.io') is None, 'Least recently observed domain should go'
+        assert index.classify('three.io') == 'disposable', 'Recent observation should stay'
+
+    def test_learning_can_be_disabled(self) -> None:
+        """Test that a non-learning index ignores observations."""
+        index = DomainIndex(learn=False)
+
+        index.observe({'domain': 'newmail.io', 'webmail': True})
+
+        assert index.classify('newmail.io') is None, 'Nothing should be learned'
+
+
+class TestClientDomainIndex:
+    """Unit tests for the domain index in HunterClient."""
+
+    def test_finder_skips_webmail(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that email finder lookups on webmail domains are refused.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(domain_index=DomainIndex.bundled()))
+
+        with pytest.raises(HunterSkippedDomainError, match='webmail'):
+            client.email_finder(domain='gmail.com', full_name='John Doe')
+
+        assert not fake_adapter.requests, 'No request should be sent'
+
+    def test_verifier_answers_disposable_locally(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that disposable addresses are answered without a request.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(domain_index=DomainIndex.bundled()))
+
+        verification = client.email_verifier('john@mailinator.com')
+        client.email_verifier('john@gmail.com')
+
+        assert isinstance(verification, dict), 'A dict result should be returned'
+        assert verification['status'] == 'disposable', 'Status should be disposable'
+        assert verification['disposable'], 'Disposable flag should be set'
+        assert len(fake_adapter.requests) == 1, 'Only the webmail address should be sent'
+
+    def test_domain_search_feeds_index(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that domain_search responses teach the index.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(domain_index=DomainIndex.bundled()))
+        fake_adapter.add_reply({'data': {'domain': 'burner.dev', 'disposable': True, 'emails': []}})
+
+        client.domain_search('burner.dev')
+
+        with pytest.raises(HunterSkippedDomainError, match='disposable'):
+            client.email_finder(domain='burner.dev', full_name='John Doe')
@@ -0,0 +1,66 @@
+"""Unit tests for the streaming email finder."""
+
+import io
+import json
+
+from hunter_wrapper.bulk import find_many, find_many_to_sink
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.concurrency import BulkResult
+from hunter_wrapper.exceptions import MissingNameError
+from hunter_wrapper.rows import CsvResultSink, JsonlResultSink, read_csv_rows, read_jsonl_rows
+from tests.unit.conftest import FakeHunterAdapter
+
+
+class TestFindMany:
+    """Unit tests for the streaming email finder."""
+
+    def test_csv_rows_to_csv_sink(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test finding emails from CSV rows and writing a CSV result file.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        source = io.StringIO('first_name,last_name,domain,crm_id\nJohn,Doe,example.com,1\nJane,,example.com,2\n')
+        target = io.StringIO()
+
+        sink = CsvResultSink(target)
+        processed = find_many_to_sink(unit_client, read_csv_rows(source), sink, concurrency=2)
+
+        written = sorted(target.getvalue().splitlines()[1:])
+        assert processed == 2, 'Both rows should be processed'
+        assert written[0].startswith('0,example.com,,John,Doe,,john@example.com,90,'), 'Valid row should be found'
+        assert 'first name' in written[1], 'Invalid row should carry its error'
+        assert len(fake_adapter.requests) == 1, 'Invalid row should not cost a request'
+
+    def test_jsonl_rows(self, unit_client: HunterClient) -> None:
+        """Test finding emails from JSON Lines rows.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+
+        """
+        source = io.StringIO('{"full_name": "John Doe", "domain": "example.com"}\n\n{"domain": "example.com"}\n')
+
+        rows = read_jsonl_rows(source)
+        outcomes = sorted(find_many(unit_client, rows), key=lambda outcome: outcome.index)
+
+        assert outcomes[0].response == ('john@example.com', 90), 'Finder should return email and score'
+        assert isinstance(outcomes[1].error, MissingNameError), 'Row without names should fail validation'
+
+    def test_jsonl_sink(self) -> None:
+        """Test that the JSON Lines sink writes one object per result."""
+        target = io.StringIO()
+        sink = JsonlResultSink(target)
+
+        query = {'domain': 'example.com', 'full_name': 'John Doe'}
+        sink.write(BulkResult(3, query, ('john@example.com', 90)))
+
+        written = json.loads(target.getvalue())
+        assert written['index'] == 3, 'Index should be written'
+        assert written['email'] == 'john@example.com', 'Email should be written'
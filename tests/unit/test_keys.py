@@ -0,0 +1,237 @@
+"""Unit tests for API key pools."""
+
+import asyncio
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from hunter_wrapper.async_client import AsyncHunterClient
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.credits import VERIFICATIONS, CreditScheduler
+from hunter_wrapper.exceptions import HunterNoKeysError, HunterRateLimitError
+from hunter_wrapper.keys import ROUND_ROBIN, KeyPool, PooledKey
+from hunter_wrapper.retry import RetryPolicy
+from tests.unit.conftest import VERIFIER, FakeAsyncTransport, FakeClock, FakeHunterAdapter, create_configured_client
+
+KEYS = ('first-key', 'second-key')
+UNAUTHORIZED = 401
+TOO_MANY_REQUESTS = 429
+QUARANTINE = 30
+ERROR_PAYLOAD = MappingProxyType({'errors': [{'details': 'Invalid API key'}]})
+USED_UP = MappingProxyType({VERIFICATIONS: {'used': 100, 'available': 100}})
+
+
+def sent_keys(requests: list) -> list[str]:
+    """Return the API key each recorded request was sent with.
+
+    Args:
+        requests: Recorded requests of the fake transport.
+
+    Returns:
+        The api_key query parameter of every request.
+
+    """
+    queries = [parse_qs(urlparse(str(request.url)).query) for request in requests]
+    return [query['api_key'][0] for query in queries]
+
+
+def accept(api_key: str) -> str:
+    """Send stub accepting every key.
+
+    Args:
+        api_key: The key of the attempt.
+
+    Returns:
+        The accepted key.
+
+    """
+    return api_key
+
+
+class TestKeyPool:
+    """Unit tests for KeyPool."""
+
+    def test_round_robin(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that keys are used in turn.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, api_key=KeyPool(KEYS, strategy=ROUND_ROBIN))
+
+        for _ in range(len(KEYS) * 2):
+            client.email_verifier('john@example.com', raw=True)
+
+        assert sent_keys(fake_adapter.requests) == list(KEYS * 2), 'Keys should alternate'
+        assert client.api_key == KEYS[0], 'Client should be identified with the first key'
+
+    def test_least_loaded(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that the key with the fewest requests in flight is picked.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        pool = KeyPool(KEYS)
+        pool.keys[0].in_flight = 1
+        client = create_configured_client(fake_adapter, api_key=pool)
+
+        client.email_verifier('john@example.com', raw=True)
+
+        assert sent_keys(fake_adapter.requests) == [KEYS[1]], 'Busy key should be skipped'
+        assert pool.keys[1].in_flight == 0, 'Finished requests should be checked in'
+
+    def test_invalid_key_fails_over(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a key rejected as invalid is removed and another key is used.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        pool = KeyPool(KEYS, strategy=ROUND_ROBIN)
+        client = create_configured_client(fake_adapter, api_key=pool)
+        fake_adapter.add_reply(dict(ERROR_PAYLOAD), status_code=UNAUTHORIZED)
+
+        client.email_verifier('john@example.com', raw=True)
+        client.email_verifier('jane@example.com', raw=True)
+
+        expected = [KEYS[0], KEYS[1], KEYS[1]]
+        assert sent_keys(fake_adapter.requests) == expected, 'Rejected key should not be reused'
+        assert pool.removed == {KEYS[0]: 'invalid API key'}, 'Removal reason should be recorded'
+
+    def test_rate_limited_key_is_quarantined(self) -> None:
+        """Test that a rate-limited key sits out its cool-down and then comes back."""
+        clock = FakeClock()
+        pool = KeyPool(KEYS, quarantine=QUARANTINE, clock=clock)
+        first_key, second_key = KEYS
+
+        assert pool.call(VERIFIER, RejectingSender(retry_after=None)) == second_key, 'Should fail over'
+        assert pool.call(VERIFIER, accept) == second_key, 'Quarantined key should sit out'
+        clock.now = QUARANTINE
+        assert pool.call(VERIFIER, accept) == first_key, 'Key should come back after the cool-down'
+        assert not pool.removed, 'Rate-limited key should not be removed'
+
+    def test_all_keys_rate_limited(self) -> None:
+        """Test that a pool without a key out of quarantine raises a retryable error."""
+        pool = KeyPool(KEYS[:1], clock=FakeClock())
+
+        with pytest.raises(HunterRateLimitError) as raised:
+            pool.call(VERIFIER, RejectingSender(retry_after=QUARANTINE))
+
+        assert raised.value.retry_after == QUARANTINE, 'Should tell when a key is back'  # noqa: WPS441
+
+    def test_exhausted_keys_are_skipped(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that keys without credits are skipped and an empty pool fails fast.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        exhausted = PooledKey(KEYS[0])
+        exhausted.credits.remaining[VERIFICATIONS] = 0
+        pool = KeyPool([exhausted, KEYS[1]])
+        client = create_configured_client(fake_adapter, api_key=pool)
+        fake_adapter.add_reply(dict(ERROR_PAYLOAD), status_code=UNAUTHORIZED)
+
+        with pytest.raises(HunterNoKeysError):
+            client.email_verifier('john@example.com', raw=True)
+        assert sent_keys(fake_adapter.requests) == [KEYS[1]], 'Exhausted key should not be used'
+
+    def test_async_failover(self, fake_async_transport: FakeAsyncTransport) -> None:
+        """Test that the async client fails over to another key.
+
+        Args:
+            fake_async_transport: The fake async transport.
+
+        """
+        pool = KeyPool(KEYS, strategy=ROUND_ROBIN)
+        client = AsyncHunterClient(api_key=pool)
+        client.session = httpx.AsyncClient(transport=fake_async_transport)
+        client.sender.session = client.session
+        fake_async_transport.add_reply(dict(ERROR_PAYLOAD), status_code=UNAUTHORIZED)
+
+        asyncio.run(client.email_verifier('john@example.com', raw=True))
+
+        assert sent_keys(fake_async_transport.requests) == list(KEYS), 'Second key should be used'
+        assert list(pool.removed) == [KEYS[0]], 'Rejected key should be removed'
+
+
+class TestKeyPoolFailover:
+    """Unit tests for the fail-over limits of KeyPool."""
+
+    def test_zero_retry_after_does_not_spin(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that Retry-After: 0 quarantines the key and each key is tried once per attempt.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        pool = KeyPool(KEYS, quarantine=QUARANTINE, clock=FakeClock())
+        config = ClientConfig(retry_policy=RetryPolicy(max_attempts=1))
+        client = create_configured_client(fake_adapter, config, api_key=pool)
+        for _ in range(len(KEYS) * 2):
+            fake_adapter.add_reply(dict(ERROR_PAYLOAD), status_code=TOO_MANY_REQUESTS, headers={'Retry-After': '0'})
+
+        with pytest.raises(HunterRateLimitError) as raised:
+            client.email_verifier('john@example.com', raw=True)
+
+        assert sent_keys(fake_adapter.requests) == list(KEYS), 'Each key should be tried once'
+        assert raised.value.retry_after == QUARANTINE, 'Keys should sit out the quarantine'  # noqa: WPS441
+
+
+class TestKeyReconciliation:
+    """Unit tests for the credits of pooled keys."""
+
+    def test_keys_reconcile_from_own_account(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that each key reconciles its credits from its own account, not the client's.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        reconciling = PooledKey(KEYS[0], credits=CreditScheduler())
+        client_credits = CreditScheduler()
+        client = create_configured_client(fake_adapter, api_key=KeyPool([reconciling, KEYS[1]]))
+        client.sender.credits = client_credits
+        fake_adapter.add_reply({'data': {'requests': dict(USED_UP)}})
+
+        client.email_verifier('john@example.com', raw=True)
+
+        paths = [urlparse(str(request.url)).path for request in fake_adapter.requests]
+        assert paths == ['/v2/account', '/v2/email-verifier'], 'Only the reconciling key fetches its account'
+        assert sent_keys(fake_adapter.requests) == list(KEYS), 'Key out of credits should fail over'
+        assert reconciling.credits.remaining[VERIFICATIONS] == 0, 'Key should hold its own count'
+        assert not client_credits.remaining, 'Client count should not be reconciled from a pooled key'
+
+
+class RejectingSender:
+    """Send stub rejecting the first key with a rate-limit error."""
+
+    def __init__(self, retry_after: float | None) -> None:
+        """Initialize the stub.
+
+        Args:
+            retry_after: Retry-After of the error; None leaves the cool-down to the pool.
+
+        """
+        self.retry_after = retry_after
+
+    def __call__(self, api_key: str) -> str:
+        """Reject the first key, accept the others.
+
+        Args:
+            api_key: The key of the attempt.
+
+        Returns:
+            The accepted key.
+
+        Raises:
+            HunterRateLimitError: For the first key.
+
+        """
+        if api_key == KEYS[0]:
+            raise HunterRateLimitError('Too many requests', retry_after=self.retry_after)
+        return api_key
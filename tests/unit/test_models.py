@@ -0,0 +1,83 @@
+"""Unit tests for the typed result models."""
+
+from hunter_wrapper.models import DomainSearchResult, FinderResult, Source, VerificationResult
+
+SCORE = 91
+CONFIDENCE = 97
+
+
+def verifier_data(email: str) -> dict:
+    """Build email_verifier data for an address.
+
+    Args:
+        email: The verified email address.
+
+    Returns:
+        The data of a verifier response.
+
+    """
+    return {
+        'email': email,
+        'status': ''.join(['val', 'id']),
+        'result': 'deliverable',
+        'score': SCORE,
+        'webmail': False,
+        'sources': [{'domain': 'stripe.com', 'uri': 'http://stripe.com/about', 'still_on_page': True}],
+    }
+
+
+class TestModels:
+    """Unit tests for the result models."""
+
+    def test_verification_result(self) -> None:
+        """Test that verifier data maps onto VerificationResult."""
+        verification = VerificationResult.from_dict(verifier_data('john@stripe.com'))
+
+        assert verification.status == 'valid', 'Status should be mapped'
+        assert verification.deliverability == 'deliverable', 'Result should be mapped'
+        assert verification.score == SCORE, 'Score should be mapped'
+        assert not hasattr(verification, '__dict__'), 'Models should use __slots__'  # noqa: WPS421
+
+    def test_enum_fields_are_interned(self) -> None:
+        """Test that equal status strings share one object."""
+        first = VerificationResult.from_dict(verifier_data('john@stripe.com'))
+        second = VerificationResult.from_dict(verifier_data('jane@stripe.com'))
+
+        assert first.status is second.status, 'Status strings should be interned'
+
+    def test_sources_are_built_on_access(self) -> None:
+        """Test that sources are kept as field tuples until accessed."""
+        verification = VerificationResult.from_dict(verifier_data('john@stripe.com'))
+
+        assert verification.source_fields == (
+            ('stripe.com', 'http://stripe.com/about', None, None, True),
+        ), 'Sources should be stored as plain tuples'
+        assert verification.sources == (
+            Source(domain='stripe.com', uri='http://stripe.com/about', still_on_page=True),
+        ), 'Sources should be built on access'
+
+    def test_domain_search_result(self) -> None:
+        """Test that domain search data maps onto nested email records."""
+        search = DomainSearchResult.from_dict({
+            'domain': 'stripe.com',
+            'pattern': '{first}',
+            'emails': [{
+                'value': 'patrick@stripe.com',
+                'type': 'personal',
+                'confidence': CONFIDENCE,
+                'verification': {'status': 'valid'},
+            }],
+        })
+
+        assert search.pattern == '{first}', 'Pattern should be mapped'
+        assert search.emails[0].email == 'patrick@stripe.com', 'Email value should be mapped'
+        assert search.emails[0].email_type == 'personal', 'Type should be mapped'
+        assert search.emails[0].confidence == CONFIDENCE, 'Confidence should be mapped'
+        assert search.emails[0].verification_status == 'valid', 'Verification should be mapped'
+
+    def test_finder_result(self) -> None:
+        """Test that finder data maps onto FinderResult."""
+        finder = FinderResult.from_dict({'email': 'patrick@stripe.com', 'score': SCORE, 'sources': []})
+
+        assert finder.email == 'patrick@stripe.com', 'Email should be mapped'
+        assert not finder.sources, 'Missing sources should be empty'
@@ -0,0 +1,120 @@
+"""Unit tests for email finder name normalization."""
+
+from urllib.parse import parse_qs, urlparse
+
+from hunter_wrapper.cache import MemoryCache
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.names import normalize_name, normalize_name_params, split_full_name
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client
+
+
+def sent_query(fake_adapter: FakeHunterAdapter, position: int = 0) -> dict:
+    """Return the query parameters of a recorded request.
+
+    Args:
+        fake_adapter: The fake transport adapter.
+        position: Position of the request.
+
+    Returns:
+        The query parameters, one value per name.
+
+    """
+    query = parse_qs(urlparse(fake_adapter.requests[position].url).query)
+    return {name: sent[0] for name, sent in query.items()}
+
+
+class TestNormalizeName:
+    """Unit tests for normalize_name."""
+
+    def test_accents_and_case(self) -> None:
+        """Test that accents and case are folded."""
+        assert normalize_name('José Ñúñez') == 'jose nunez', 'Accents should be stripped'
+        assert normalize_name('  STRAßE ') == 'strasse', 'Case folding expands sharp s'
+
+    def test_transliteration(self) -> None:
+        """Test letters that do not decompose to ASCII."""
+        assert normalize_name('Søren Łukasz') == 'soren lukasz', 'Latin letters should be transliterated'
+        assert normalize_name('Дмитрий Шостакович') == 'dmitriy shostakovich', 'Cyrillic should be romanized'
+
+    def test_punctuation_and_whitespace(self) -> None:
+        """Test that punctuation variants and whitespace are unified."""
+        assert normalize_name('O’Brien') == "o'brien", 'Typographic apostrophes should be unified'
+        assert normalize_name('Jean–Luc  J.') == 'jean-luc j', 'Dashes, dots and spaces should be unified'
+
+
+class TestSplitFullName:
+    """Unit tests for split_full_name."""
+
+    def test_first_and_last_word(self) -> None:
+        """Test that middle names are dropped."""
+        assert split_full_name('Patrick John Collison') == ('patrick', 'collison'), 'Middle name is dropped'
+        assert split_full_name('Patrick') is None, 'A single word cannot be split'
+
+    def test_particles_and_comma(self) -> None:
+        """Test multi-word last names and 'Last, First' order."""
+        assert split_full_name('Ludwig van Beethoven') == ('ludwig', 'van beethoven'), 'Particle starts last name'
+        assert split_full_name('Collison, Patrick') == ('patrick', 'collison'), 'Comma order is understood'
+
+    def test_name_params(self) -> None:
+        """Test that full names become first and last names."""
+        assert normalize_name_params({'full_name': 'José Núñez'}) == {
+            'first_name': 'jose',
+            'last_name': 'nunez',
+        }, 'Full name should be split'
+        assert normalize_name_params({'full_name': 'Cher'}) == {'full_name': 'cher'}, 'Single word stays full'
+
+
+class TestClientNames:
+    """Unit tests for name normalization in email_finder."""
+
+    def test_equivalent_names_share_one_request(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that equivalent spellings hit the cache.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        cache = MemoryCache()
+        client = create_configured_client(fake_adapter, ClientConfig(cache=cache))
+
+        client.email_finder(domain='example.com', first_name='José', last_name='Ñúñez')
+        client.email_finder(domain='example.com', first_name='jose', last_name='nunez')
+        client.email_finder(domain='example.com', full_name='  JOSE   NUNEZ ')
+
+        assert len(fake_adapter.requests) == 1, 'Equivalent names should cost one request'
+        assert sent_query(fake_adapter)['first_name'] == 'José', "Caller's spelling should be sent"
+
+    def test_full_name_is_sent_verbatim(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a normalized full name is only used as the lookup key.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(cache=MemoryCache()))
+
+        client.email_finder(domain='example.com', full_name='José Núñez')
+        client.email_finder(domain='example.com', first_name='jose', last_name='nunez')
+
+        assert len(fake_adapter.requests) == 1, 'Split full name should share the cache entry'
+        assert sent_query(fake_adapter) == {
+            'domain': 'example.com',
+            'full_name': 'José Núñez',
+            'api_key': 'test-key',
+        }, 'Full name should not be split or folded'
+
+    def test_normalization_can_be_disabled(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that spellings are cached apart when normalization is off.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        config = ClientConfig(cache=MemoryCache(), normalize_names=False)
+        client = create_configured_client(fake_adapter, config)
+
+        client.email_finder(domain='example.com', full_name='José Núñez')
+        client.email_finder(domain='example.com', full_name='jose nunez')
+
+        assert len(fake_adapter.requests) == 2, 'Each spelling should be looked up'
+        assert sent_query(fake_adapter)['full_name'] == 'José Núñez', 'Name should be sent verbatim'
@@ -0,0 +1,116 @@
+"""Unit tests for auto-paginating domain search."""
+
+import itertools
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.exceptions import HunterAPIError
+from hunter_wrapper.pagination import iter_domain_emails
+from tests.unit.conftest import FakeHunterAdapter
+
+TOTAL_RESULTS = 25
+# (page_size, prefetch) pairs iter_domain_emails must refuse
+INVALID_ARGUMENTS = ((0, 4), (101, 4), (10, 0))
+
+
+def domain_page(request: requests.PreparedRequest) -> dict:
+    """Build a domain search page for the requested limit and offset.
+
+    Args:
+        request: The outgoing request.
+
+    Returns:
+        A domain search payload with numbered emails.
+
+    """
+    query = parse_qs(urlparse(request.url).query)
+    offset = int(query['offset'][0])
+    limit = int(query['limit'][0])
+    emails = [
+        {'value': 'user{0}@example.com'.format(number)}
+        for number in range(offset, min(offset + limit, TOTAL_RESULTS))
+    ]
+    return {'data': {'emails': emails}, 'meta': {'results': TOTAL_RESULTS, 'limit': limit, 'offset': offset}}
+
+
+class TestIterDomainEmails:
+    """Unit tests for iter_domain_emails."""
+
+    def test_yields_every_email_in_order(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that all pages are fetched and yielded in order.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.responder = domain_page
+
+        records = iter_domain_emails(unit_client, 'example.com', page_size=4, prefetch=3)
+        emails = [record['value'] for record in records]
+
+        assert emails == ['user{0}@example.com'.format(number) for number in range(TOTAL_RESULTS)]
+        assert len(fake_adapter.requests) == 7, 'Seven pages of four should be requested'
+
+    def test_stops_when_consumer_stops(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that pages beyond the prefetch window are never requested.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.responder = domain_page
+
+        emails = iter_domain_emails(unit_client, 'example.com', page_size=2, prefetch=2)
+        first_page = list(itertools.islice(emails, 3))
+        emails.close()
+
+        assert len(first_page) == 3, 'Consumer should get the emails it asked for'
+        assert len(fake_adapter.requests) <= 4, 'Only the prefetch window should be requested'
+
+    def test_error_payload_raises(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that an error body maps to HunterAPIError.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': [{'id': 'wrong_params'}]})
+
+        with pytest.raises(HunterAPIError, match='wrong_params'):
+            next(iter_domain_emails(unit_client, 'example.com'))
+
+    @pytest.mark.parametrize(('page_size', 'prefetch'), INVALID_ARGUMENTS)
+    def test_invalid_arguments_are_rejected(
+        self,
+        unit_client: HunterClient,
+        page_size: int,
+        prefetch: int,
+    ) -> None:
+        """Test that out-of-range arguments fail before any request.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            page_size: Number of emails per request.
+            prefetch: Maximum number of pages fetched ahead.
+
+        """
+        with pytest.raises(ValueError, match='must be'):
+            iter_domain_emails(unit_client, 'example.com', page_size=page_size, prefetch=prefetch)
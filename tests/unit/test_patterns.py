@@ -0,0 +1,131 @@
+"""Unit tests for the pattern cache and local email synthesis."""
+
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.patterns import PatternCache, render_pattern
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client, endpoints
+
+VERIFY_BELOW = 90
+TRUSTED = 95
+UNTRUSTED = 50
+FULL_CONFIDENCE = 100
+HALF_CONFIDENCE = 50
+
+
+class TestRenderPattern:
+    """Unit tests for render_pattern."""
+
+    def test_tokens(self) -> None:
+        """Test the Hunter pattern tokens."""
+        assert render_pattern('{first}.{last}', 'Patrick', 'Collison') == 'patrick.collison', 'Full names'
+        assert render_pattern('{f}{last}', 'José', 'Núñez') == 'jnunez', 'Initials and accent folding'
+        assert render_pattern('{last}_{l}', 'Mary', "O'Brien") == 'obrien_o', 'Punctuation is dropped'
+
+    def test_missing_names(self) -> None:
+        """Test that a pattern needing a missing name does not render."""
+        assert render_pattern('{first}.{last}', 'Patrick', None) is None, 'Last name is required'
+        assert render_pattern('{first}', 'Patrick', None) == 'patrick', 'Only the first name is needed'
+        assert render_pattern('{unknown}', 'Patrick', 'Collison') is None, 'Unknown tokens fail'
+
+    def test_format_syntax_is_not_rendered(self) -> None:
+        """Test that format fields beyond the plain tokens do not render."""
+        assert render_pattern('{first.x}', 'Patrick', 'Collison') is None, 'Attribute access should fail'
+        assert render_pattern('{first!r}', 'Patrick', 'Collison') is None, 'Conversions should fail'
+        assert render_pattern('{first}{', 'Patrick', 'Collison') is None, 'Stray braces should fail'
+
+
+class TestPatternCache:
+    """Unit tests for PatternCache."""
+
+    def test_confidence_from_domain_search(self) -> None:
+        """Test that the pattern confidence is the share of matching addresses."""
+        patterns = PatternCache()
+
+        patterns.observe({
+            'domain': 'Stripe.com',
+            'pattern': '{first}',
+            'emails': [
+                {'value': 'patrick@stripe.com', 'first_name': 'Patrick', 'last_name': 'Collison'},
+                {'value': 'jc@stripe.com', 'first_name': 'John', 'last_name': 'Collison'},
+                {'value': 'press@stripe.com'},
+            ],
+        })
+
+        assert patterns.get('stripe.com') == ('{first}', HALF_CONFIDENCE), 'Half the named addresses match'
+
+    def test_small_sample_is_not_trusted(self) -> None:
+        """Test that a pattern backed by too few named addresses is verified first."""
+        patterns = PatternCache(verify_below=VERIFY_BELOW)
+
+        patterns.observe({
+            'domain': 'stripe.com',
+            'pattern': '{first}',
+            'emails': [{'value': 'patrick@stripe.com', 'first_name': 'Patrick', 'last_name': 'Collison'}],
+        })
+        candidate = patterns.candidate({'domain': 'stripe.com', 'first_name': 'John', 'last_name': 'Doe'})
+
+        assert candidate is not None, 'Address should still be rendered'
+        assert candidate.score == VERIFY_BELOW - 1, 'Score should stay below the trust threshold'
+        assert not candidate.trusted, 'One match should not be trusted'
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used domain is evicted."""
+        patterns = PatternCache(maxsize=1)
+
+        patterns.set('a.com', '{first}', FULL_CONFIDENCE)
+        patterns.set('b.com', '{first}', FULL_CONFIDENCE)
+
+        assert patterns.get('a.com') is None, 'Oldest domain should be evicted'
+        assert len(patterns) == 1, 'Cache should hold one domain'
+
+
+class TestClientSynthesis:
+    """Unit tests for local synthesis in email_finder."""
+
+    def test_trusted_pattern_skips_request(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a trusted pattern answers without a request.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        patterns = PatternCache(verify_below=VERIFY_BELOW)
+        patterns.set('stripe.com', '{first}.{last}', TRUSTED)
+        client = create_configured_client(fake_adapter, ClientConfig(pattern_cache=patterns))
+
+        found = client.email_finder(domain='stripe.com', full_name='Patrick Collison')
+
+        assert found == ('patrick.collison@stripe.com', TRUSTED), 'Address should be rendered'
+        assert not fake_adapter.requests, 'No request should be sent'
+
+    def test_untrusted_pattern_is_verified(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that an untrusted candidate is verified before it is returned.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        patterns = PatternCache(verify_below=VERIFY_BELOW)
+        patterns.set('stripe.com', '{first}', UNTRUSTED)
+        client = create_configured_client(fake_adapter, ClientConfig(pattern_cache=patterns))
+        fake_adapter.add_reply({'data': {'email': 'patrick@stripe.com', 'status': 'valid'}})
+
+        found = client.email_finder(domain='stripe.com', first_name='Patrick', last_name='Collison')
+
+        assert found == ('patrick@stripe.com', UNTRUSTED), 'Verified candidate should be returned'
+        assert endpoints(fake_adapter) == ['email-verifier'], 'Only the candidate should be verified'
+
+    def test_invalid_candidate_falls_back(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that the API is asked when the candidate is not valid.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        patterns = PatternCache(verify_below=VERIFY_BELOW)
+        patterns.set('stripe.com', '{first}', UNTRUSTED)
+        client = create_configured_client(fake_adapter, ClientConfig(pattern_cache=patterns))
+        fake_adapter.add_reply({'data': {'email': 'patrick@stripe.com', 'status': 'invalid'}})
+
+        client.email_finder(domain='stripe.com', first_name='Patrick', last_name='Collison')
+
+        assert endpoints(fake_adapter) == ['email-verifier', 'email-finder'], 'Finder should be the fallback'
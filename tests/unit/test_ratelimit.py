@@ -0,0 +1,77 @@
+"""Unit tests for the client-side rate limiter."""
+
+import asyncio
+
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.ratelimit import RateLimiter, TokenBucket
+from tests.unit.conftest import VERIFIER, FakeClock, FakeHunterAdapter, create_configured_client
+
+
+class TestTokenBucket:
+    """Unit tests for TokenBucket."""
+
+    def test_burst_then_paced_waits(self) -> None:
+        """Test that a full bucket allows a burst and then spaces tokens out."""
+        bucket = TokenBucket(rate=2, clock=FakeClock())
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == [0, 0, 0.5, 1], 'Tokens beyond the burst should be spaced by 1 / rate'
+        assert bucket.metrics().max_wait == 1, 'Longest wait should be recorded'
+
+    def test_refill_over_time(self) -> None:
+        """Test that tokens come back at the configured rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, clock=clock)
+        bucket.reserve()
+
+        clock.now = 1
+
+        assert bucket.reserve() == 0, 'A token should have been refilled'
+
+    def test_reserve_respects_max_wait(self) -> None:
+        """Test that a too long wait takes no token."""
+        bucket = TokenBucket(rate=1, clock=FakeClock())
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=0.5) is None, 'Wait of one second should be refused'
+        assert bucket.metrics().rejected == 1, 'Refusal should be counted'
+        assert bucket.reserve(max_wait=1) == 1, 'Refused reservation should not consume a token'
+
+
+class TestRateLimiter:
+    """Unit tests for RateLimiter."""
+
+    def test_buckets_are_per_endpoint(self) -> None:
+        """Test that endpoints do not share tokens."""
+        limiter = RateLimiter(rates={VERIFIER: 1, 'domain-search': 1}, clock=FakeClock())
+
+        assert limiter.try_acquire(VERIFIER), 'First verifier call should pass'
+        assert not limiter.try_acquire(VERIFIER), 'Second verifier call should be throttled'
+        assert limiter.try_acquire('domain-search'), 'Domain search has its own bucket'
+        assert limiter.try_acquire('account'), 'Endpoints without a rate are not limited'
+
+    def test_blocking_acquire_times_out(self) -> None:
+        """Test that acquire gives up when the wait exceeds the timeout."""
+        limiter = RateLimiter(rates={VERIFIER: 1}, clock=FakeClock())
+        limiter.acquire(VERIFIER)
+
+        assert not limiter.acquire(VERIFIER, timeout=0.1), 'Acquire should time out'
+        assert not asyncio.run(limiter.aacquire(VERIFIER, timeout=0.1)), 'Async acquire should time out'
+
+    def test_client_takes_a_token_per_request(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that the client goes through the limiter.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        limiter = RateLimiter()
+        client = create_configured_client(fake_adapter, ClientConfig(rate_limiter=limiter))
+
+        client.email_verifier('john@example.com')
+        client.domain_search(domain='example.com')
+
+        metrics = limiter.metrics()
+        assert metrics[VERIFIER].acquired == 1, 'Verifier bucket should be used'
+        assert metrics['domain-search'].acquired == 1, 'Domain search bucket should be used'
@@ -0,0 +1,126 @@
+"""Unit tests for the retry policy and typed HTTP errors."""
+
+import pytest
+
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.exceptions import HunterAPIError, HunterRateLimitError, HunterServerError
+from hunter_wrapper.retry import RetryPolicy, parse_retry_after
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client
+
+SERVICE_UNAVAILABLE = 503
+TOO_MANY_REQUESTS = 429
+
+
+class FlakyCall:
+    """Callable failing a number of times before succeeding."""
+
+    def __init__(self, error: Exception, failures: int) -> None:
+        """Initialize the call.
+
+        Args:
+            error: The error to raise.
+            failures: How many times to fail.
+
+        """
+        self.calls = 0
+        self._error = error
+        self._failures = failures
+
+    def __call__(self) -> str:
+        """Fail until the configured number of failures is reached.
+
+        Returns:
+            'ok' once the failures are used up.
+
+        Raises:
+            Exception: The configured error.  # noqa: DAR402
+
+        """
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise self._error
+        return 'ok'
+
+
+class TestRetryPolicy:
+    """Unit tests for RetryPolicy."""
+
+    def test_transient_errors_are_retried(self) -> None:
+        """Test that a server error is retried until success."""
+        flaky_call = FlakyCall(HunterServerError(), failures=2)
+
+        assert RetryPolicy(base_delay=0).call(flaky_call) == 'ok', 'Third attempt should succeed'
+        assert flaky_call.calls == 3, 'Two retries should be made'
+
+    def test_attempts_are_bounded(self) -> None:
+        """Test that the last error surfaces once attempts are exhausted."""
+        flaky_call = FlakyCall(HunterServerError('down'), failures=5)
+
+        with pytest.raises(HunterServerError, match='down'):
+            RetryPolicy(max_attempts=2, base_delay=0).call(flaky_call)
+        assert flaky_call.calls == 2, 'Only two attempts should be made'
+
+    def test_non_idempotent_only_retry_rate_limits(self) -> None:
+        """Test idempotency-aware retries."""
+        policy = RetryPolicy(base_delay=0)
+
+        assert policy.backoff(HunterServerError(), 1, 'POST') is None, 'POST should not be retried on 5xx'
+        assert policy.backoff(HunterRateLimitError(retry_after=2), 1, 'POST') == 2, 'POST is retried on 429'
+
+    def test_backoff_uses_full_jitter(self) -> None:
+        """Test that the delay stays within the exponential cap."""
+        policy = RetryPolicy(base_delay=1, max_delay=3)
+
+        delays = [policy.backoff(HunterServerError(), 4, 'GET') for _ in range(100)]
+
+        assert all(0 <= delay <= 3 for delay in delays), 'Delay should be capped by max_delay'  # type: ignore[operator]
+
+    def test_deadline_stops_retries(self) -> None:
+        """Test that a retry which would overrun the deadline is not made."""
+        flaky_call = FlakyCall(HunterRateLimitError(retry_after=10), failures=1)
+
+        with pytest.raises(HunterRateLimitError):
+            RetryPolicy(deadline=1).call(flaky_call)
+        assert flaky_call.calls == 1, 'No retry should be made past the deadline'
+
+    def test_parse_retry_after(self) -> None:
+        """Test parsing Retry-After in seconds and as an HTTP date."""
+        assert parse_retry_after('7') == 7, 'Seconds should be parsed'
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0, 'Past dates mean no wait'
+        assert parse_retry_after('soon') is None, 'Invalid values should be ignored'
+
+
+class TestClientRetries:
+    """Unit tests for retries in HunterClient."""
+
+    def test_server_error_then_success(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a 503 is retried transparently.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': []}, status_code=SERVICE_UNAVAILABLE)
+        client = create_configured_client(fake_adapter, ClientConfig(retry_policy=RetryPolicy(base_delay=0)))
+
+        verification = client.email_verifier('john@example.com')
+
+        assert verification['email'] == 'john@example.com', 'Retry should return data'
+        assert len(fake_adapter.requests) == 2, 'One retry should be made'
+
+    def test_rate_limit_error_is_typed(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that an exhausted 429 surfaces as HunterRateLimitError.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        fake_adapter.add_reply({'errors': []}, status_code=TOO_MANY_REQUESTS, headers={'Retry-After': '0'})
+        client = create_configured_client(fake_adapter, ClientConfig(retry_policy=RetryPolicy(max_attempts=1)))
+
+        with pytest.raises(HunterRateLimitError) as raised:
+            client.email_verifier('john@example.com')
+
+        rate_limit_error = raised.value  # noqa: WPS441
+        assert isinstance(rate_limit_error, HunterAPIError), 'Typed errors should derive from HunterAPIError'
+        assert rate_limit_error.retry_after == 0, 'Retry-After should be exposed'
@@ -0,0 +1,72 @@
+"""Unit tests for the rate limiter shared between processes."""
+
+import multiprocessing
+from pathlib import Path
+
+from hunter_wrapper.shared_ratelimit import SharedRateLimiter
+from tests.unit.conftest import VERIFIER, FakeClock
+
+RATE = 5
+WORKERS = 4
+FROZEN_TIME = 1000.0
+
+
+def frozen_clock() -> float:
+    """Return a time that never advances, so no token is refilled.
+
+    Returns:
+        The same time on every call.
+
+    """
+    return FROZEN_TIME
+
+
+def take_tokens(directory: str) -> int:
+    """Try to take more verifier tokens than the rate allows.
+
+    Args:
+        directory: Directory of the shared bucket files.
+
+    Returns:
+        The number of tokens taken.
+
+    """
+    limiter = SharedRateLimiter(directory, rates={VERIFIER: RATE}, clock=frozen_clock)
+    taken = sum(limiter.try_acquire(VERIFIER) for _ in range(RATE))
+    limiter.close()
+    return taken
+
+
+class TestSharedRateLimiter:
+    """Unit tests for SharedRateLimiter."""
+
+    def test_limiters_share_one_bucket(self, tmp_path: Path) -> None:
+        """Test that limiters opened on one directory draw from the same tokens.
+
+        Args:
+            tmp_path: A temporary directory.
+
+        """
+        clock = FakeClock()
+        first = SharedRateLimiter(tmp_path, rates={VERIFIER: RATE}, clock=clock)
+        second = SharedRateLimiter(tmp_path, rates={VERIFIER: RATE}, clock=clock)
+
+        taken = [first.try_acquire(VERIFIER) for _ in range(RATE)]
+        exhausted = second.try_acquire(VERIFIER)
+        clock.now = 1
+
+        assert all(taken) and not exhausted, 'Tokens taken by one limiter should be gone for the other'
+        assert second.try_acquire(VERIFIER), 'Tokens should refill for every limiter'
+        assert second.acquire('account', timeout=0), 'Endpoints without a rate are not limited'
+
+    def test_processes_share_one_bucket(self, tmp_path: Path) -> None:
+        """Test that worker processes together take no more tokens than the rate.
+
+        Args:
+            tmp_path: A temporary directory.
+
+        """
+        with multiprocessing.Pool(WORKERS) as pool:
+            taken = pool.map(take_tokens, [str(tmp_path) for _ in range(WORKERS)])
+
+        assert sum(taken) == RATE, 'Workers should share one burst of tokens'
@@ -0,0 +1,81 @@
+"""Unit tests for the SQLite-backed response cache."""
+
+import threading
+from pathlib import Path
+
+from hunter_wrapper.sqlite_cache import SQLiteCache
+from tests.unit.conftest import VERIFIER, FakeClock
+
+
+class TestSQLiteCache:
+    """Unit tests for SQLiteCache."""
+
+    def test_entries_are_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test that a second cache on the same file sees stored entries.
+
+        Args:
+            tmp_path: Temporary directory for the database.
+
+        """
+        database = tmp_path / 'hunter.sqlite'
+        writer = SQLiteCache(database)
+        writer.set(VERIFIER, {'email': 'john@example.com'}, {'status': 'valid'})
+
+        reader = SQLiteCache(database)
+
+        assert reader.get(VERIFIER, {'email': 'john@example.com'}) == {'status': 'valid'}, 'Entry should persist'
+        assert reader.hits == 1, 'Lookup should count as a hit'
+
+    def test_wal_mode_is_enabled(self, tmp_path: Path) -> None:
+        """Test that the database uses write-ahead logging.
+
+        Args:
+            tmp_path: Temporary directory for the database.
+
+        """
+        cache = SQLiteCache(tmp_path / 'hunter.sqlite')
+
+        journal_mode = cache._connect().execute('PRAGMA journal_mode').fetchone()[0]  # noqa: WPS437
+
+        assert journal_mode == 'wal', 'Database should run in WAL mode'
+
+    def test_evict_drops_expired_and_oldest_entries(self, tmp_path: Path) -> None:
+        """Test that evict keeps the file bounded.
+
+        Args:
+            tmp_path: Temporary directory for the database.
+
+        """
+        clock = FakeClock()
+        database = tmp_path / 'hunter.sqlite'
+        cache = SQLiteCache(database, max_entries=1, ttls={VERIFIER: 60}, clock=clock)
+        for second in range(4):
+            clock.now = second
+            cache.set(VERIFIER, {'email': 'user{0}@example.com'.format(second)}, {'score': second})
+        clock.now = 61.5
+
+        removed = cache.evict()
+
+        assert removed == 3, 'Two expired and one surplus entry should be removed'
+        assert cache.get(VERIFIER, {'email': 'user3@example.com'}) == {'score': 3}, 'Newest entry should stay'
+
+    def test_concurrent_writers(self, tmp_path: Path) -> None:
+        """Test that threads can write through their own connections.
+
+        Args:
+            tmp_path: Temporary directory for the database.
+
+        """
+        cache = SQLiteCache(tmp_path / 'hunter.sqlite')
+        queries = [{'email': str(number)} for number in range(8)]
+        writers = [
+            threading.Thread(target=cache.set, args=(VERIFIER, query, {}))
+            for query in queries
+        ]
+        for writer in writers:
+            writer.start()
+        for finished in writers:
+            finished.join()
+
+        assert len(cache) == 8, 'Every write should be stored'
+        cache.close()
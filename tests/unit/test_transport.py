@@ -0,0 +1,64 @@
+"""Unit tests for the pooled HTTP transport."""
+
+from requests.adapters import HTTPAdapter
+
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.transport import PoolConfig, create_session
+from tests.unit.conftest import FakeHunterAdapter
+
+
+class TestPooledTransport:
+    """Unit tests for the shared keep-alive session."""
+
+    def test_create_session_applies_pool_config(self) -> None:
+        """Test that pool settings reach the mounted adapter."""
+        pool_maxsize = 32
+        pool_config = PoolConfig(pool_connections=2, pool_maxsize=pool_maxsize, pool_block=True)
+        session = create_session(pool_config)
+
+        adapter = session.get_adapter('https://api.hunter.io/v2/email-verifier')
+        assert isinstance(adapter, HTTPAdapter), 'Session should use an HTTPAdapter'
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == pool_maxsize, 'Pool size should be applied'
+        assert adapter.poolmanager.connection_pool_kw['block'], 'Per-host limit should be applied'
+
+    def test_client_uses_configured_pool(self) -> None:
+        """Test that the client builds its session from the config."""
+        config = ClientConfig(pool=PoolConfig(pool_maxsize=5))
+        client = HunterClient(api_key='test-key', config=config)
+
+        adapter = client.session.get_adapter('https://api.hunter.io/v2/domain-search')
+        assert isinstance(adapter, HTTPAdapter), 'Session should use an HTTPAdapter'
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 5, 'Client should apply its pool config'
+
+    def test_endpoints_share_one_session(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that all endpoints go through the same session.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        unit_client.email_verifier('john@example.com')
+        unit_client.domain_search(domain='example.com')
+        unit_client.email_finder(domain='example.com', first_name='John', last_name='Doe')
+
+        paths = [request.path_url.split('?')[0] for request in fake_adapter.requests]
+        assert paths == ['/v2/email-verifier', '/v2/domain-search', '/v2/email-finder'], 'All calls should be sent'
+
+    def test_context_manager_closes_session(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that leaving the context closes pooled connections.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        with HunterClient(api_key='test-key') as client:
+            client.session.mount('https://', fake_adapter)
+            client.email_verifier('john@example.com')
+
+        assert fake_adapter.closed, 'Adapter should be closed on exit'
@@ -0,0 +1,108 @@
+"""Unit tests for local email pre-validation."""
+
+from urllib.parse import parse_qs, urlparse
+
+from hunter_wrapper.client import HunterClient
+from hunter_wrapper.config import ClientConfig
+from hunter_wrapper.validation import EmailValidator, syntax_error
+from tests.unit.conftest import FakeHunterAdapter, create_configured_client
+
+VALID_EMAILS = ('john@example.com', 'John.Doe+crm@Example.CO.UK', '"john doe"@example.com', 'josé@münchen.de')
+INVALID_EMAILS = (
+    'john',
+    '@example.com',
+    'john..doe@example.com',
+    'john@localhost',
+    'john@-example.com',
+    'john@1.2.3.4',
+)
+MAX_LOCAL_LENGTH = 64
+MAX_LABEL_LENGTH = 63
+
+
+def sent_email(fake_adapter: FakeHunterAdapter) -> str:
+    """Return the email parameter of the last request.
+
+    Args:
+        fake_adapter: The fake transport adapter.
+
+    Returns:
+        The email sent to the API.
+
+    """
+    query = urlparse(fake_adapter.requests[-1].url).query
+    return parse_qs(query)['email'][0]
+
+
+class TestSyntaxError:
+    """Unit tests for syntax_error."""
+
+    def test_valid_addresses(self) -> None:
+        """Test that well-formed addresses pass."""
+        for email in VALID_EMAILS:
+            assert syntax_error(email) is None, '{0} should be valid'.format(email)
+
+    def test_invalid_addresses(self) -> None:
+        """Test that malformed addresses are rejected."""
+        for email in INVALID_EMAILS:
+            assert syntax_error(email) is not None, '{0} should be invalid'.format(email)
+
+    def test_length_limits(self) -> None:
+        """Test the RFC length limits of the local part and the domain label."""
+        long_local_part = 'a' * (MAX_LOCAL_LENGTH + 1)
+        long_label = 'a' * (MAX_LABEL_LENGTH + 1)
+        assert syntax_error('{0}@example.com'.format(long_local_part)) is not None, 'Local part is too long'
+        assert syntax_error('john@{0}.com'.format(long_label)) is not None, 'Domain label is too long'
+
+
+class TestClientPrevalidation:
+    """Unit tests for pre-validation in email_verifier."""
+
+    def test_invalid_address_skips_request(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that an invalid address is answered locally.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        verification = unit_client.email_verifier('not an email')
+
+        assert isinstance(verification, dict), 'A dict result should be returned'
+        assert verification['status'] == 'invalid', 'Result should be invalid'
+        assert verification['local_check'] == 'missing @', 'Reason should be reported'
+        assert not fake_adapter.requests, 'No request should be sent'
+        assert unit_client.config.email_validator.avoided == 1, 'Avoided call should be counted'
+
+    def test_domain_is_sent_in_ascii_form(
+        self,
+        unit_client: HunterClient,
+        fake_adapter: FakeHunterAdapter,
+    ) -> None:
+        """Test that internationalized domains are IDNA-encoded.
+
+        Args:
+            unit_client: Client wired to the fake adapter.
+            fake_adapter: The fake transport adapter.
+
+        """
+        unit_client.email_verifier('John@Bücher.DE')
+
+        assert sent_email(fake_adapter) == 'John@xn--bcher-kva.de', 'Domain should be normalized'
+
+    def test_validation_can_be_disabled(self, fake_adapter: FakeHunterAdapter) -> None:
+        """Test that a disabled validator sends every address.
+
+        Args:
+            fake_adapter: The fake transport adapter.
+
+        """
+        client = create_configured_client(fake_adapter, ClientConfig(email_validator=EmailValidator(enabled=False)))
+
+        client.email_verifier('not an email')
+
+        assert sent_email(fake_adapter) == 'not an email', 'Address should be sent unchanged'